@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import re
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from pain_radar.core.evidence_gate import MAX_RETRIES, validate_output
+from pain_radar.core.evidence_gate import MAX_RETRIES, filter_valid_indices, validate_output
 from pain_radar.core.models import (
     Citation,
     ClusterCategory,
@@ -20,11 +23,13 @@ from pain_radar.core.models import (
     ScoredDimension,
     SourceType,
 )
+from pain_radar.llm.base import retry_backoff
 from pain_radar.llm.prompts import (
     CLUSTERING_SYSTEM,
     CLUSTERING_USER,
     COMPETITOR_SYSTEM,
     COMPETITOR_USER,
+    evidence_messages,
     format_evidence_summary,
 )
 
@@ -33,6 +38,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Above this many raw competitors, parsing moves off the event loop so
+# concurrent stages (e.g. clustering) keep making progress.
+_THREAD_PARSE_THRESHOLD = 50
+
+
+# Packs larger than this are clustered chunk-by-chunk in parallel, then merged.
+# Matches the default evidence summary cap, so no chunk's citations are
+# truncated; merged clusters cite the whole pack, so scoring and the verdict,
+# which resolve cluster citations, must be given every citation.
+CLUSTER_CHUNK_SIZE = 50
+
+# Minimum statement token Jaccard for two chunk clusters to be merged.
+_MERGE_SIMILARITY = 0.5
+
 
 async def cluster_evidence(
     citations: list[Citation],
@@ -40,30 +59,59 @@ async def cluster_evidence(
     options: dict,
     llm: LLMProvider,
     idea_brief: IdeaBrief | None = None,
+    evidence_summary: str | None = None,
 ) -> list[PainCluster]:
-    """Group citations into pain clusters via LLM. Output passes evidence gate."""
-    evidence_dicts = [c.model_dump() for c in citations]
-    evidence_summary = format_evidence_summary(evidence_dicts)
-
-    prompt_content = CLUSTERING_USER.format(
-        idea=idea,
-        count=len(citations),
-        evidence_summary=evidence_summary,
-    )
+    """Group citations into pain clusters via LLM. Output passes evidence gate.
+
+    Packs over CLUSTER_CHUNK_SIZE are split into contiguous chunks that are
+    clustered concurrently (map), then near-duplicate clusters are merged with
+    citation indices offset back to the full pack (reduce).
+    """
+    if len(citations) > CLUSTER_CHUNK_SIZE:
+        starts = range(0, len(citations), CLUSTER_CHUNK_SIZE)
+        chunk_results = await asyncio.gather(*(
+            _cluster_pack(citations[start:start + CLUSTER_CHUNK_SIZE], idea, llm)
+            for start in starts
+        ))
+        clusters = _merge_chunk_clusters(list(zip(starts, chunk_results)))
+    else:
+        clusters = await _cluster_pack(citations, idea, llm, evidence_summary)
+
+    if not clusters:
+        logger.error("Clustering exhausted all retries")
+        return []
+
+    # Classify clusters as core vs context (off the event loop, so the
+    # concurrent competitor extraction keeps streaming)
+    if idea_brief:
+        ctx = ClassifierContext.from_idea_brief(idea_brief)
+        await asyncio.to_thread(_classify_all, clusters, ctx)
+    # Sort: CORE first, CONTEXT second
+    clusters.sort(key=lambda c: 0 if c.category == ClusterCategory.CORE else 1)
+    return clusters
+
+
+async def _cluster_pack(
+    citations: list[Citation],
+    idea: str,
+    llm: LLMProvider,
+    evidence_summary: str | None = None,
+) -> list[PainCluster]:
+    """One clustering LLM call (with retries) over a pack; indices are pack-local."""
+    if evidence_summary is None:
+        evidence_summary = format_evidence_summary(citations)
+
+    prompt_content = CLUSTERING_USER.format(idea=idea)
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            raw = await llm.complete_json(
+            # Parse each cluster as soon as the model finishes emitting it
+            clusters = []
+            async for item in llm.stream_json(
                 system=CLUSTERING_SYSTEM,
-                messages=[{"role": "user", "content": prompt_content}],
+                messages=evidence_messages(len(citations), evidence_summary, prompt_content),
                 max_tokens=8192,
-            )
-
-            if not isinstance(raw, list):
-                raw = [raw]
-
-            clusters = []
-            for item in raw:
+            ):
                 cluster = _parse_cluster(item, len(citations))
                 if cluster:
                     clusters.append(cluster)
@@ -73,55 +121,109 @@ async def cluster_evidence(
                 prompt_content += "\n\nPrevious attempt produced no valid clusters. Try again with valid citation_indices."
                 continue
 
-            # Classify clusters as core vs context
-            if idea_brief:
-                for cluster in clusters:
-                    cluster.category = _classify_cluster(
-                        cluster.statement.text,
-                        idea_brief.keywords,
-                        idea_brief.workflow_verbs,
-                        idea_brief.incumbent_tools,
-                    )
-            # Sort: CORE first, CONTEXT second
-            clusters.sort(key=lambda c: 0 if c.category == ClusterCategory.CORE else 1)
             return clusters
 
-        except Exception:
+        except Exception as exc:
             logger.exception(f"Clustering attempt {attempt + 1} failed")
             if attempt < MAX_RETRIES:
                 prompt_content += "\n\nPrevious attempt failed. Output valid JSON array of cluster objects."
+                await retry_backoff(attempt, exc)
 
-    logger.error("Clustering exhausted all retries")
     return []
 
 
+def _merge_chunk_clusters(
+    chunk_results: list[tuple[int, list[PainCluster]]],
+) -> list[PainCluster]:
+    """Offset chunk-local indices to pack indices and merge near-duplicates.
+
+    Clusters whose statements share >= _MERGE_SIMILARITY token Jaccard are
+    folded into the first one seen (citations, statement citations and
+    workarounds unioned). Colliding ids get a numeric suffix, starting at the
+    chunk number, until they are unique.
+    """
+    merged: list[PainCluster] = []
+    merged_tokens: list[set[str]] = []
+    seen_ids: set[str] = set()
+
+    for chunk_no, (offset, clusters) in enumerate(chunk_results):
+        for cluster in clusters:
+            indices = [i + offset for i in cluster.citation_indices]
+            statement_indices = [i + offset for i in cluster.statement.citation_indices]
+            tokens = _normalize_tokens(cluster.statement.text)
+
+            target = None
+            for existing, existing_tokens in zip(merged, merged_tokens):
+                union = tokens | existing_tokens
+                if union and len(tokens & existing_tokens) / len(union) >= _MERGE_SIMILARITY:
+                    target = existing
+                    break
+
+            if target is not None:
+                target.citation_indices += [i for i in indices if i not in target.citation_indices]
+                target.statement.citation_indices += [
+                    i for i in statement_indices if i not in target.statement.citation_indices
+                ]
+                target.workarounds += [w for w in cluster.workarounds if w not in target.workarounds]
+                continue
+
+            cluster_id = cluster.id
+            suffix = chunk_no + 1
+            while cluster_id in seen_ids:
+                cluster_id = f"{cluster.id}-{suffix}"
+                suffix += 1
+            seen_ids.add(cluster_id)
+
+            # model_copy is shallow; lists merged into later must be our own
+            merged.append(cluster.model_copy(update={
+                "id": cluster_id,
+                "statement": cluster.statement.model_copy(
+                    update={"citation_indices": statement_indices}
+                ),
+                "citation_indices": indices,
+                "workarounds": list(cluster.workarounds),
+                "scores": _placeholder_scores(indices),
+            }))
+            merged_tokens.append(tokens)
+
+    return merged
+
+
+def _classify_all(clusters: list[PainCluster], ctx: ClassifierContext) -> None:
+    """Set each cluster's category in place."""
+    for cluster in clusters:
+        cluster.category = _classify_cluster(cluster.statement.text, ctx)
+
+
+def _placeholder_scores(valid_indices: list[int]) -> ClusterScores:
+    """Placeholder scores for a freshly parsed cluster (filled by scoring stage)."""
+    placeholder_dim = ScoredDimension(
+        score=0,
+        justification=EvidencedClaim(
+            text="Pending scoring",
+            citation_indices=valid_indices[:1],
+        ),
+    )
+    return ClusterScores(
+        frequency=placeholder_dim,
+        severity=placeholder_dim,
+        urgency=placeholder_dim,
+        payability=placeholder_dim,
+        workaround_cost=placeholder_dim,
+        saturation=placeholder_dim,
+        accessibility=placeholder_dim,
+    )
+
+
 def _parse_cluster(item: dict, pack_size: int) -> PainCluster | None:
     """Parse a raw cluster dict into a PainCluster, validating indices."""
     try:
         citation_indices = item.get("citation_indices", [])
         # Filter to valid indices
-        valid_indices = [i for i in citation_indices if 0 <= i < pack_size]
+        valid_indices = filter_valid_indices(citation_indices, pack_size)
         if not valid_indices:
             return None
 
-        # Build placeholder scores (will be filled by scoring stage)
-        placeholder_dim = ScoredDimension(
-            score=0,
-            justification=EvidencedClaim(
-                text="Pending scoring",
-                citation_indices=valid_indices[:1],
-            ),
-        )
-        placeholder_scores = ClusterScores(
-            frequency=placeholder_dim,
-            severity=placeholder_dim,
-            urgency=placeholder_dim,
-            payability=placeholder_dim,
-            workaround_cost=placeholder_dim,
-            saturation=placeholder_dim,
-            accessibility=placeholder_dim,
-        )
-
         # Read LLM-provided category as initial hint (deterministic override later)
         raw_category = item.get("category", "core").lower()
         try:
@@ -139,7 +241,7 @@ def _parse_cluster(item: dict, pack_size: int) -> PainCluster | None:
             trigger=item.get("trigger", "Unknown"),
             workarounds=item.get("workarounds", []),
             citation_indices=valid_indices,
-            scores=placeholder_scores,
+            scores=_placeholder_scores(valid_indices),
             confidence=0.5,
             recency_weight=1.0,
             category=category,
@@ -152,21 +254,21 @@ def _parse_cluster(item: dict, pack_size: int) -> PainCluster | None:
 # ---------------------------------------------------------------------------
 # Gravity patterns — cross-domain pains that are real but not product wedges
 # ---------------------------------------------------------------------------
-_GRAVITY_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(p, re.IGNORECASE)
-    for p in [
-        r"\bmanual\s+(?:process|data\s+entry|work|task|input|step)",
-        r"\bdata\s+entry\b",
-        r"\black\s+of\s+integration\b",
-        r"\bcommunication\s+(?:gap|issue|problem|breakdown)",
-        r"\btime[\s-]consuming\b",
-        r"\brepetitive\s+task",
-        r"\binefficient\s+(?:process|workflow)",
-        r"\bspreadsheet\s+(?:chaos|hell|mess|overload)",
-        r"\bemail\s+(?:overload|chaos|back[\s-]and[\s-]forth)",
-        r"\bsiloed?\s+(?:data|information|system)",
-    ]
-]
+_GRAVITY_SOURCES: tuple[str, ...] = (
+    r"\bmanual\s+(?:process|data\s+entry|work|task|input|step)",
+    r"\bdata\s+entry\b",
+    r"\black\s+of\s+integration\b",
+    r"\bcommunication\s+(?:gap|issue|problem|breakdown)",
+    r"\btime[\s-]consuming\b",
+    r"\brepetitive\s+task",
+    r"\binefficient\s+(?:process|workflow)",
+    r"\bspreadsheet\s+(?:chaos|hell|mess|overload)",
+    r"\bemail\s+(?:overload|chaos|back[\s-]and[\s-]forth)",
+    r"\bsiloed?\s+(?:data|information|system)",
+)
+# One alternation so each statement is scanned once instead of once per pattern.
+# Sources are lowercase and callers pass lowercased text, so no IGNORECASE.
+_GRAVITY_RE = re.compile("(?:" + "|".join(_GRAVITY_SOURCES) + ")")
 
 # Common stopwords excluded from keyword matching (len < 5 already excluded)
 _CLASSIFY_STOPWORDS = frozenset({
@@ -179,20 +281,60 @@ _CLASSIFY_STOPWORDS = frozenset({
 })
 
 
+_LONG_WORD_RE = re.compile(r"[a-z]{5,}")
+
+
 def _normalize_tokens(text: str) -> set[str]:
     """Lowercase, split, keep words len >= 5, drop stopwords."""
     return {
-        w for w in re.findall(r"[a-z]{5,}", text.lower())
+        w for w in _LONG_WORD_RE.findall(text.lower())
         if w not in _CLASSIFY_STOPWORDS
     }
 
 
-def _classify_cluster(
-    statement: str,
-    idea_keywords: list[str],
-    workflow_verbs: list[str],
-    incumbent_tools: list[str],
-) -> ClusterCategory:
+def _compile_phrases(phrases: list[str]) -> re.Pattern[str] | None:
+    """Compile literal phrases into one lowercase alternation (None if empty)."""
+    if not phrases:
+        return None
+    return re.compile("|".join(re.escape(p.lower()) for p in phrases))
+
+
+@dataclass(frozen=True)
+class ClassifierContext:
+    """Idea-brief lookup tables, normalized once per run.
+
+    Classification runs per cluster/competitor; building these up front keeps
+    the per-item work to set intersections and one regex pass per phrase list.
+    """
+
+    kw_tokens: frozenset[str]
+    verb_re: re.Pattern[str] | None
+    verb_token_sets: tuple[frozenset[str], ...]
+    tool_re: re.Pattern[str] | None
+    tool_phrases_lower: tuple[str, ...]
+    mop_lower: str
+    mop_tokens: frozenset[str]
+
+    @classmethod
+    def from_idea_brief(cls, idea_brief: IdeaBrief) -> ClassifierContext:
+        kw_tokens: set[str] = set()
+        for kw in idea_brief.keywords:
+            kw_tokens |= _normalize_tokens(kw)
+        return cls(
+            kw_tokens=frozenset(kw_tokens),
+            verb_re=_compile_phrases(idea_brief.workflow_verbs),
+            verb_token_sets=tuple(
+                frozenset(_normalize_tokens(v)) for v in idea_brief.workflow_verbs
+            ),
+            tool_re=_compile_phrases(idea_brief.incumbent_tools),
+            tool_phrases_lower=tuple(t.lower() for t in idea_brief.incumbent_tools),
+            mop_lower=idea_brief.moment_of_pain.lower(),
+            mop_tokens=frozenset(_normalize_tokens(idea_brief.moment_of_pain)),
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_cluster(statement: str, ctx: ClassifierContext) -> ClusterCategory:
     """Deterministic core vs context classification.
 
     CORE requires: at least one workflow verb phrase match OR one incumbent
@@ -201,37 +343,40 @@ def _classify_cluster(
 
     CONTEXT if: matches a gravity pattern AND has zero idea keyword matches
     AND zero workflow verb matches.
+
+    Memoized on (statement, ctx): the model often re-emits identical
+    statements, and ClassifierContext is frozen so it hashes by value.
     """
     stmt_lower = statement.lower()
     stmt_tokens = _normalize_tokens(statement)
 
     # --- Check workflow verb phrase matches ---
-    has_workflow_match = False
-    for verb in workflow_verbs:
-        # Phrase-level match (e.g. "re-key into QuickBooks")
-        if verb.lower() in stmt_lower:
-            has_workflow_match = True
-            break
-        # Token-level fallback: require 2+ content tokens from the verb phrase
-        verb_tokens = _normalize_tokens(verb)
-        if verb_tokens and len(stmt_tokens & verb_tokens) >= min(2, len(verb_tokens)):
-            has_workflow_match = True
-            break
+    # Phrase-level match (e.g. "re-key into QuickBooks"), all verbs in one pass
+    has_workflow_match = ctx.verb_re is not None and ctx.verb_re.search(stmt_lower) is not None
+    if not has_workflow_match:
+        for verb_tokens in ctx.verb_token_sets:
+            # Token-level fallback: require 2+ content tokens from the verb phrase
+            if verb_tokens and len(stmt_tokens & verb_tokens) >= min(2, len(verb_tokens)):
+                has_workflow_match = True
+                break
 
     # --- Check incumbent tool mentions ---
-    has_tool_match = False
-    for tool in incumbent_tools:
-        if tool.lower() in stmt_lower:
-            has_tool_match = True
-            break
+    has_tool_match = ctx.tool_re is not None and ctx.tool_re.search(stmt_lower) is not None
 
     # --- Count normalized idea keyword matches ---
-    kw_tokens = set()
-    for kw in idea_keywords:
-        kw_tokens |= _normalize_tokens(kw)
-    keyword_overlap = len(stmt_tokens & kw_tokens)
+    keyword_overlap = len(stmt_tokens & ctx.kw_tokens)
+
+    matches_gravity = _GRAVITY_RE.search(stmt_lower) is not None
+    return _cluster_rules(keyword_overlap, has_workflow_match, has_tool_match, matches_gravity)
 
-    # --- Classification rules ---
+
+def _cluster_rules(
+    keyword_overlap: int,
+    has_workflow_match: bool,
+    has_tool_match: bool,
+    matches_gravity: bool,
+) -> ClusterCategory:
+    """Core vs context decision from precomputed match features (pure)."""
     # Rule 1: >=2 keyword matches → CORE regardless
     if keyword_overlap >= 2:
         return ClusterCategory.CORE
@@ -241,7 +386,6 @@ def _classify_cluster(
         return ClusterCategory.CORE
 
     # Rule 3: gravity pattern + zero keyword/verb matches → CONTEXT
-    matches_gravity = any(p.search(stmt_lower) for p in _GRAVITY_PATTERNS)
     if matches_gravity and keyword_overlap == 0 and not has_workflow_match:
         return ClusterCategory.CONTEXT
 
@@ -256,21 +400,19 @@ def _classify_cluster(
 # ---------------------------------------------------------------------------
 # Labor/service substitute patterns
 # ---------------------------------------------------------------------------
-_SUBSTITUTE_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(p, re.IGNORECASE)
-    for p in [
-        r"\bagency\b",
-        r"\bfreelancer",
-        r"\boutsourc",
-        r"\bvirtual\s+assistant",
-        r"\b(?:VA|VAs)\b",
-        r"\bbookkeeping\s+service",
-        r"\bwe\s+do\s+it\s+for\s+you",
-        r"\bmanaged\s+service",
-        r"\bfull[\s-]service",
-        r"\bdone[\s-]for[\s-]you",
-    ]
-]
+_SUBSTITUTE_SOURCES: tuple[str, ...] = (
+    r"\bagency\b",
+    r"\bfreelancer",
+    r"\boutsourc",
+    r"\bvirtual\s+assistant",
+    r"\b(?:va|vas)\b",
+    r"\bbookkeeping\s+service",
+    r"\bwe\s+do\s+it\s+for\s+you",
+    r"\bmanaged\s+service",
+    r"\bfull[\s-]service",
+    r"\bdone[\s-]for[\s-]you",
+)
+_SUBSTITUTE_RE = re.compile("(?:" + "|".join(_SUBSTITUTE_SOURCES) + ")")
 
 
 def _classify_competitor_relationship(
@@ -278,7 +420,7 @@ def _classify_competitor_relationship(
     positioning: str,
     strengths_text: str,
     llm_label: str,
-    idea_brief: IdeaBrief | None,
+    ctx: ClassifierContext | None,
 ) -> CompetitorRelationship:
     """Deterministic-first competitor relationship classification with guardrails.
 
@@ -289,7 +431,7 @@ def _classify_competitor_relationship(
     4. Fallback: use LLM label, but override to ADJACENT if LLM says DIRECT
        and neither Rule 1 nor Rule 3 (>=3 overlap) is satisfied.
     """
-    if not idea_brief:
+    if ctx is None:
         # No idea brief — trust LLM label but cap at SUBSTITUTE
         try:
             rel = CompetitorRelationship(llm_label.lower())
@@ -300,62 +442,70 @@ def _classify_competitor_relationship(
         return rel
 
     combined_text = f"{positioning} {strengths_text}".lower()
+    combined_tokens = _normalize_tokens(combined_text)
     name_lower = name.lower()
 
     # --- Check incumbent tool match ---
     is_incumbent = any(
-        tool.lower() in name_lower or name_lower in tool.lower()
-        for tool in idea_brief.incumbent_tools
+        tool_lower in name_lower or name_lower in tool_lower
+        for tool_lower in ctx.tool_phrases_lower
     )
 
     # --- Check workflow verb overlap in positioning/strengths ---
-    has_workflow_overlap = False
-    for verb in idea_brief.workflow_verbs:
-        if verb.lower() in combined_text:
-            has_workflow_overlap = True
-            break
-        # Token-level fallback
-        verb_tokens = _normalize_tokens(verb)
-        combined_tokens = _normalize_tokens(combined_text)
-        if verb_tokens and len(combined_tokens & verb_tokens) >= min(2, len(verb_tokens)):
-            has_workflow_overlap = True
-            break
+    has_workflow_overlap = ctx.verb_re is not None and ctx.verb_re.search(combined_text) is not None
+    if not has_workflow_overlap:
+        for verb_tokens in ctx.verb_token_sets:
+            # Token-level fallback
+            if verb_tokens and len(combined_tokens & verb_tokens) >= min(2, len(verb_tokens)):
+                has_workflow_overlap = True
+                break
 
     # Also check moment_of_pain overlap
-    if not has_workflow_overlap and idea_brief.moment_of_pain:
-        if idea_brief.moment_of_pain.lower() in combined_text:
+    if not has_workflow_overlap and ctx.mop_lower:
+        if ctx.mop_lower in combined_text:
             has_workflow_overlap = True
         else:
             # Token-level fallback for moment_of_pain
-            mop_tokens = _normalize_tokens(idea_brief.moment_of_pain)
-            combined_tokens = _normalize_tokens(combined_text)
-            if mop_tokens and len(combined_tokens & mop_tokens) >= min(2, len(mop_tokens)):
+            if ctx.mop_tokens and len(combined_tokens & ctx.mop_tokens) >= min(2, len(ctx.mop_tokens)):
                 has_workflow_overlap = True
 
+    is_labor_substitute = _SUBSTITUTE_RE.search(combined_text) is not None
+    keyword_overlap = len(combined_tokens & ctx.kw_tokens)
+    try:
+        llm_rel = CompetitorRelationship(llm_label.lower())
+    except ValueError:
+        llm_rel = CompetitorRelationship.ADJACENT
+
+    return _competitor_rules(
+        is_incumbent, has_workflow_overlap, is_labor_substitute, keyword_overlap, llm_rel,
+    )
+
+
+def _competitor_rules(
+    is_incumbent: bool,
+    has_workflow_overlap: bool,
+    is_labor_substitute: bool,
+    keyword_overlap: int,
+    rel: CompetitorRelationship,
+) -> CompetitorRelationship:
+    """Relationship decision from precomputed match features (pure).
+
+    rel is the LLM's label, already parsed; it is only used as the Rule 4
+    fallback.
+    """
     # Rule 1: incumbent tool + workflow overlap → DIRECT
     if is_incumbent and has_workflow_overlap:
         return CompetitorRelationship.DIRECT
 
     # Rule 2: labor/service substitute
-    if any(p.search(combined_text) for p in _SUBSTITUTE_PATTERNS):
+    if is_labor_substitute:
         return CompetitorRelationship.SUBSTITUTE
 
     # Rule 3: keyword overlap >= 3 without workflow match → SUBSTITUTE
-    kw_tokens = set()
-    for kw in idea_brief.keywords:
-        kw_tokens |= _normalize_tokens(kw)
-    combined_tokens = _normalize_tokens(combined_text)
-    keyword_overlap = len(combined_tokens & kw_tokens)
-
     if keyword_overlap >= 3 and not has_workflow_overlap:
         return CompetitorRelationship.SUBSTITUTE
 
     # Rule 4: LLM label as fallback with guardrail
-    try:
-        rel = CompetitorRelationship(llm_label.lower())
-    except ValueError:
-        rel = CompetitorRelationship.ADJACENT
-
     # Guardrail: LLM can't say DIRECT unless Rule 1 or Rule 3 (>=3 overlap) met
     if rel == CompetitorRelationship.DIRECT:
         if not (is_incumbent and has_workflow_overlap) and keyword_overlap < 3:
@@ -370,56 +520,64 @@ async def extract_competitors(
     options: dict,
     llm: LLMProvider,
     idea_brief: IdeaBrief | None = None,
+    evidence_summary: str | None = None,
 ) -> list[Competitor]:
     """Extract competitor information from evidence. Output passes evidence gate."""
-    evidence_dicts = [c.model_dump() for c in citations]
-    evidence_summary = format_evidence_summary(evidence_dicts)
+    if evidence_summary is None:
+        evidence_summary = format_evidence_summary(citations)
 
-    prompt_content = COMPETITOR_USER.format(
-        idea=idea,
-        count=len(citations),
-        evidence_summary=evidence_summary,
-    )
+    prompt_content = COMPETITOR_USER.format(idea=idea)
 
     for attempt in range(MAX_RETRIES + 1):
         try:
             raw = await llm.complete_json(
                 system=COMPETITOR_SYSTEM,
-                messages=[{"role": "user", "content": prompt_content}],
+                messages=evidence_messages(len(citations), evidence_summary, prompt_content),
                 max_tokens=8192,
             )
 
             if not isinstance(raw, list):
                 raw = [raw]
 
-            competitors = []
-            for item in raw:
-                comp = _parse_competitor(item, len(citations))
-                if comp:
-                    # Classify relationship deterministically
-                    strengths_text = " ".join(s.text for s in comp.strengths)
-                    llm_label = item.get("relationship", "adjacent")
-                    comp.relationship = _classify_competitor_relationship(
-                        comp.name,
-                        comp.positioning,
-                        strengths_text,
-                        llm_label,
-                        idea_brief,
-                    )
-                    competitors.append(comp)
-
-            return competitors
-
-        except Exception:
+            ctx = ClassifierContext.from_idea_brief(idea_brief) if idea_brief else None
+            if len(raw) > _THREAD_PARSE_THRESHOLD:
+                return await asyncio.to_thread(_parse_competitors, raw, len(citations), ctx)
+            return _parse_competitors(raw, len(citations), ctx)
+
+        except Exception as exc:
             logger.exception(f"Competitor extraction attempt {attempt + 1} failed")
+            if attempt < MAX_RETRIES:
+                await retry_backoff(attempt, exc)
 
     return []
 
 
+def _parse_competitors(
+    raw: list, pack_size: int, ctx: ClassifierContext | None
+) -> list[Competitor]:
+    """Parse raw competitor dicts and classify each relationship."""
+    competitors = []
+    for item in raw:
+        comp = _parse_competitor(item, pack_size)
+        if comp:
+            # Classify relationship deterministically
+            strengths_text = " ".join([s.text for s in comp.strengths])
+            llm_label = item.get("relationship", "adjacent")
+            comp.relationship = _classify_competitor_relationship(
+                comp.name,
+                comp.positioning,
+                strengths_text,
+                llm_label,
+                ctx,
+            )
+            competitors.append(comp)
+    return competitors
+
+
 def _parse_competitor(item: dict, pack_size: int) -> Competitor | None:
     """Parse a raw competitor dict into a Competitor model."""
     try:
-        citation_indices = [i for i in item.get("citation_indices", []) if 0 <= i < pack_size]
+        citation_indices = filter_valid_indices(item.get("citation_indices", []), pack_size)
         if not citation_indices:
             return None
 
@@ -427,14 +585,14 @@ def _parse_competitor(item: dict, pack_size: int) -> Competitor | None:
         strengths = []
         for s in item.get("strengths", []):
             if isinstance(s, dict) and s.get("text"):
-                indices = [i for i in s.get("citation_indices", []) if 0 <= i < pack_size]
+                indices = filter_valid_indices(s.get("citation_indices", []), pack_size)
                 if indices:
                     strengths.append(EvidencedClaim(text=s["text"], citation_indices=indices))
 
         weaknesses = []
         for w in item.get("weaknesses", []):
             if isinstance(w, dict) and w.get("text"):
-                indices = [i for i in w.get("citation_indices", []) if 0 <= i < pack_size]
+                indices = filter_valid_indices(w.get("citation_indices", []), pack_size)
                 if indices:
                     weaknesses.append(EvidencedClaim(text=w["text"], citation_indices=indices))
 
@@ -447,7 +605,7 @@ def _parse_competitor(item: dict, pack_size: int) -> Competitor | None:
         # Parse target_icp
         target_icp = None
         if item.get("target_icp") and isinstance(item["target_icp"], dict):
-            icp_indices = [i for i in item["target_icp"].get("citation_indices", []) if 0 <= i < pack_size]
+            icp_indices = filter_valid_indices(item["target_icp"].get("citation_indices", []), pack_size)
             if icp_indices:
                 target_icp = EvidencedClaim(
                     text=item["target_icp"].get("text", ""),
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from pain_radar.core.evidence_gate import MAX_RETRIES
+from pain_radar.core.evidence_gate import MAX_RETRIES, filter_valid_indices
 from pain_radar.core.models import (
     Citation,
     Competitor,
@@ -13,9 +13,11 @@ from pain_radar.core.models import (
     EvidencedClaim,
     PainCluster,
 )
+from pain_radar.llm.base import retry_backoff
 from pain_radar.llm.prompts import (
     CONFLICT_SYSTEM,
     CONFLICT_USER,
+    evidence_messages,
     format_evidence_summary,
 )
 
@@ -30,33 +32,32 @@ async def detect_conflicts(
     competitors: list[Competitor],
     citations: list[Citation],
     llm: LLMProvider,
+    evidence_summary: str | None = None,
 ) -> list[ConflictReport]:
     """Detect contradictions between clusters, competitors, and evidence."""
-    evidence_dicts = [c.model_dump() for c in citations]
-    evidence_summary = format_evidence_summary(evidence_dicts)
+    if evidence_summary is None:
+        evidence_summary = format_evidence_summary(citations)
 
-    clusters_summary = "\n".join(
+    clusters_summary = "\n".join([
         f"- [{c.id}] {c.statement.text} (who: {c.who}, citations: {c.citation_indices})"
         for c in clusters
-    )
+    ])
 
-    competitors_summary = "\n".join(
+    competitors_summary = "\n".join([
         f"- {c.name} ({c.url}): {c.positioning} (citations: {c.citation_indices})"
         for c in competitors
-    )
+    ])
 
     prompt_content = CONFLICT_USER.format(
         clusters_summary=clusters_summary or "No clusters",
         competitors_summary=competitors_summary or "No competitors",
-        count=len(citations),
-        evidence_summary=evidence_summary,
     )
 
     for attempt in range(MAX_RETRIES + 1):
         try:
             raw = await llm.complete_json(
                 system=CONFLICT_SYSTEM,
-                messages=[{"role": "user", "content": prompt_content}],
+                messages=evidence_messages(len(citations), evidence_summary, prompt_content),
                 max_tokens=4096,
             )
 
@@ -73,12 +74,23 @@ async def detect_conflicts(
             conflicts.sort(key=lambda c: 0 if c.relevance == "strong" else 1)
             return conflicts
 
-        except Exception:
+        except Exception as exc:
             logger.exception(f"Conflict detection attempt {attempt + 1} failed")
+            if attempt < MAX_RETRIES:
+                await retry_backoff(attempt, exc)
 
     return []
 
 
+def _parse_side(side: dict, pack_size: int) -> EvidencedClaim | None:
+    """Parse one side of a conflict; None if it lacks text or valid citations."""
+    text = side.get("text", "")
+    indices = filter_valid_indices(side.get("citation_indices", []), pack_size)
+    if text and indices:
+        return EvidencedClaim(text=text, citation_indices=indices)
+    return None
+
+
 def _parse_conflict(item: dict, pack_size: int) -> ConflictReport | None:
     """Parse a raw conflict dict into a ConflictReport."""
     try:
@@ -86,18 +98,8 @@ def _parse_conflict(item: dict, pack_size: int) -> ConflictReport | None:
         if not description:
             return None
 
-        side_a_raw = item.get("side_a", {})
-        side_b_raw = item.get("side_b", {})
-
-        def parse_side(side: dict) -> EvidencedClaim | None:
-            text = side.get("text", "")
-            indices = [i for i in side.get("citation_indices", []) if 0 <= i < pack_size]
-            if text and indices:
-                return EvidencedClaim(text=text, citation_indices=indices)
-            return None
-
-        side_a = parse_side(side_a_raw)
-        side_b = parse_side(side_b_raw)
+        side_a = _parse_side(item.get("side_a", {}), pack_size)
+        side_b = _parse_side(item.get("side_b", {}), pack_size)
 
         if side_a and side_b:
             relevance_raw = item.get("relevance", "weak")
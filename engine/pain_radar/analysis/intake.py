@@ -10,6 +10,7 @@ from pain_radar.llm.prompts import IDEA_BRIEF_SYSTEM, IDEA_BRIEF_USER
 
 if TYPE_CHECKING:
     from pain_radar.llm.base import LLMProvider
+    from pain_radar.llm.cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,28 +21,39 @@ async def generate_idea_brief(
     idea: str,
     options: dict,
     llm: LLMProvider,
+    brief_cache: SemanticCache | None = None,
 ) -> IdeaBrief:
     """Generate structured idea brief via LLM. Falls back to placeholder on failure.
 
     Returns a proper IdeaBrief with workflow_verbs and incumbent_tools populated
     when the LLM succeeds. On failure, returns a minimal placeholder so the
     pipeline can proceed with keyword-only queries (identical to prior behavior).
+
+    With brief_cache, a paraphrased resubmission of an idea reuses the earlier
+    brief; niche and buyer_role must match exactly.
     """
     niche = options.get("niche", "")
     buyer_role = options.get("buyer_role", "")
+    prompt_content = IDEA_BRIEF_USER.format(
+        idea=idea,
+        niche=niche or "N/A",
+        buyer_role=buyer_role or "N/A",
+    )
+
+    # Only the idea is compared fuzzily; the shared template would inflate
+    # similarity and a short niche or role would barely move it
+    cache_scope = (niche, buyer_role)
+    if brief_cache is not None:
+        cached = brief_cache.get(idea, scope=cache_scope)
+        if cached is not None:
+            logger.info("IdeaBrief served from semantic cache")
+            return cached.model_copy(update={"raw_idea": idea})
 
     for attempt in range(_MAX_RETRIES + 1):
         try:
             raw = await llm.complete_json(
                 system=IDEA_BRIEF_SYSTEM,
-                messages=[{
-                    "role": "user",
-                    "content": IDEA_BRIEF_USER.format(
-                        idea=idea,
-                        niche=niche or "N/A",
-                        buyer_role=buyer_role or "N/A",
-                    ),
-                }],
+                messages=[{"role": "user", "content": prompt_content}],
                 max_tokens=2048,
             )
 
@@ -67,7 +79,7 @@ async def generate_idea_brief(
                 incumbent_tools = []
             incumbent_tools = [str(t) for t in incumbent_tools if t][:5]
 
-            return IdeaBrief(
+            brief = IdeaBrief(
                 raw_idea=idea,
                 one_liner=raw.get("one_liner", idea[:200]),
                 buyer_persona=raw.get("buyer_persona", buyer_role or "Unknown"),
@@ -77,6 +89,9 @@ async def generate_idea_brief(
                 workflow_verbs=workflow_verbs,
                 incumbent_tools=incumbent_tools,
             )
+            if brief_cache is not None:
+                brief_cache.set(idea, brief, scope=cache_scope)
+            return brief
 
         except Exception:
             logger.exception(f"IdeaBrief generation attempt {attempt + 1} failed")
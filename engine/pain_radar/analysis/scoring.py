@@ -4,25 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Awaitable, Callable
 from urllib.parse import urlparse
 
-from pain_radar.core.evidence_gate import MAX_RETRIES, validate_output
+from pydantic import ValidationError
+
+from pain_radar.core.evidence_gate import MAX_RETRIES, filter_valid_indices, validate_output
 from pain_radar.core.models import (
     Citation,
     ClusterScores,
-    EvidencedClaim,
     PainCluster,
     PayabilityAssessment,
-    ScoredDimension,
 )
 from pain_radar.llm.prompts import (
     PAYABILITY_SYSTEM,
     PAYABILITY_USER,
+    SCORING_BATCH_CLUSTER,
+    SCORING_BATCH_USER,
     SCORING_SYSTEM,
     SCORING_USER,
+    evidence_messages,
     format_evidence_summary,
+    render_prompt,
 )
 
 if TYPE_CHECKING:
@@ -30,6 +35,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Max in-flight scoring calls per run (keeps us under provider RPM limits)
+SCORING_CONCURRENCY = 4
+
+# Clusters scored per request; they share one copy of the evidence prefix
+SCORING_BATCH_SIZE = 8
+
+_SCORE_DIMENSIONS = (
+    "frequency", "severity", "urgency", "payability",
+    "workaround_cost", "saturation", "accessibility",
+)
+
+
+def _clamp_score(score: object) -> int:
+    """Coerce a model-emitted score (int, float or numeric string) to 0-5.
+
+    Anything non-numeric becomes 0.
+    """
+    if type(score) is int:
+        return 0 if score < 0 else min(score, 5)
+    try:
+        value = int(float(score))
+    except (TypeError, ValueError, OverflowError):
+        return 0
+    return max(0, min(5, value))
+
 
 def compute_recency_weight(
     date_published: str | None, niche_velocity: str = "normal"
@@ -45,12 +75,26 @@ def compute_recency_weight(
     if not date_published:
         return 0.5
 
-    try:
-        pub_date = datetime.fromisoformat(date_published.replace("Z", "+00:00"))
-        now = datetime.now(timezone.utc)
-        months = (now.year - pub_date.year) * 12 + (now.month - pub_date.month)
-    except (ValueError, AttributeError):
-        return 0.5
+    # Only year and month matter: read them straight from "YYYY-MM..." and
+    # fall back to a full ISO parse for anything else.
+    if (
+        len(date_published) >= 7
+        and date_published[4] == "-"
+        and date_published[:4].isdigit()
+        and date_published[5:7].isdigit()
+    ):
+        month = int(date_published[5:7])
+        if not 1 <= month <= 12:
+            return 0.5
+        now = time.gmtime()
+        months = (now.tm_year - int(date_published[:4])) * 12 + (now.tm_mon - month)
+    else:
+        try:
+            pub_date = datetime.fromisoformat(date_published.replace("Z", "+00:00"))
+            now_dt = datetime.now(timezone.utc)
+            months = (now_dt.year - pub_date.year) * 12 + (now_dt.month - pub_date.month)
+        except (ValueError, AttributeError):
+            return 0.5
 
     if months < 6:
         return 1.0
@@ -65,6 +109,7 @@ def compute_recency_weight(
 def compute_cluster_confidence(
     cluster_citation_indices: list[int],
     citations: list[Citation],
+    recency_weights: list[float] | None = None,
 ) -> float:
     """Deterministic cluster confidence from citation features.
 
@@ -73,17 +118,23 @@ def compute_cluster_confidence(
     - domain_div: unique domains (capped at 3)
     - type_div: unique source types (capped at 3)
     - avg_recency: mean recency weight of supporting citations
+
+    *recency_weights*, if given, holds the precomputed weight of every citation.
     """
-    valid = [citations[i] for i in cluster_citation_indices if 0 <= i < len(citations)]
-    if not valid:
+    valid_indices = filter_valid_indices(cluster_citation_indices, len(citations))
+    if not valid_indices:
         return 0.0
+    valid = [citations[i] for i in valid_indices]
 
     breadth = min(len(valid), 5) / 5.0
     domains = {urlparse(c.url).netloc for c in valid}
     domain_div = min(len(domains), 3) / 3.0
     types = {c.source_type for c in valid}
     type_div = min(len(types), 3) / 3.0
-    avg_recency = sum(compute_recency_weight(c.date_published) for c in valid) / len(valid)
+    if recency_weights is None:
+        avg_recency = sum(compute_recency_weight(c.date_published) for c in valid) / len(valid)
+    else:
+        avg_recency = sum(recency_weights[i] for i in valid_indices) / len(valid_indices)
 
     return round(0.25 * breadth + 0.25 * domain_div + 0.25 * type_div + 0.25 * avg_recency, 3)
 
@@ -93,104 +144,182 @@ async def score_clusters(
     citations: list[Citation],
     llm: LLMProvider,
     on_progress: Callable[[int, int], Awaitable[None]] | None = None,
+    max_concurrency: int = SCORING_CONCURRENCY,
+    evidence_summary: str | None = None,
+    batch_size: int = SCORING_BATCH_SIZE,
 ) -> list[PainCluster]:
-    """Score each cluster on 7 dimensions. Each score passes evidence gate."""
-    evidence_dicts = [c.model_dump() for c in citations]
-    evidence_summary = format_evidence_summary(evidence_dicts)
-    sem = asyncio.Semaphore(4)
+    """Score each cluster on 7 dimensions. Each score passes evidence gate.
+
+    Clusters are scored batch_size at a time in a single request, with the
+    batches running concurrently (at most max_concurrency calls in flight).
+    Clusters a batch response leaves unscored fall back to one call each. A
+    cluster whose scoring task fails outright is returned with its
+    placeholder scores rather than failing the whole stage.
+    """
+    if not clusters or not citations:
+        return list(clusters)
+    if evidence_summary is None:
+        evidence_summary = format_evidence_summary(citations)
+    # Citations are shared across clusters; parse each date once
+    recency = [compute_recency_weight(c.date_published) for c in citations]
+    sem = asyncio.Semaphore(max_concurrency)
     scored_count = 0
     counter_lock = asyncio.Lock()
     total = len(clusters)
 
-    async def _score_one(cluster: PainCluster) -> PainCluster:
+    async def _report_progress() -> None:
         nonlocal scored_count
-        prompt_content = SCORING_USER.format(
+        async with counter_lock:
+            scored_count += 1
+            if on_progress:
+                await on_progress(scored_count, total)
+
+    def _apply_scores(cluster: PainCluster, scores: ClusterScores) -> None:
+        valid = filter_valid_indices(cluster.citation_indices, len(citations))
+        cluster.scores = scores
+        cluster.confidence = compute_cluster_confidence(
+            cluster.citation_indices, citations, recency
+        )
+        cluster.recency_weight = sum(recency[i] for i in valid) / len(valid) if valid else 0.5
+
+    async def _score_batch(batch: list[PainCluster]) -> set[str]:
+        """Score *batch* in one call; return the ids of clusters that got scores."""
+        prompt_content = SCORING_BATCH_USER.format(clusters="\n\n".join([
+            render_prompt(
+                SCORING_BATCH_CLUSTER,
+                cluster_id=c.id,
+                cluster_statement=c.statement.text,
+                who=c.who,
+                trigger=c.trigger,
+                citation_indices=c.citation_indices,
+            )
+            for c in batch
+        ]))
+        async with sem:
+            try:
+                raw = await llm.complete_json(
+                    system=SCORING_SYSTEM,
+                    messages=evidence_messages(len(citations), evidence_summary, prompt_content),
+                    max_tokens=8192,
+                )
+            except Exception:
+                logger.exception(f"Batch scoring failed for {len(batch)} clusters")
+                return set()
+
+        scored_ids: set[str] = set()
+        if not isinstance(raw, dict):
+            return scored_ids
+        for cluster in batch:
+            entry = raw.get(cluster.id)
+            if not isinstance(entry, dict):
+                continue
+            try:
+                scores = _parse_scores(entry, len(citations), cluster.citation_indices)
+            except Exception:
+                # Leave this cluster to the per-cluster fallback; the others
+                # in the batch keep their scores
+                logger.exception(f"Batch scores for cluster {cluster.id} are malformed")
+                continue
+            if scores:
+                _apply_scores(cluster, scores)
+                scored_ids.add(cluster.id)
+                await _report_progress()
+        return scored_ids
+
+    async def _score_one(cluster: PainCluster) -> PainCluster:
+        prompt_content = render_prompt(
+            SCORING_USER,
             cluster_statement=cluster.statement.text,
             who=cluster.who,
             trigger=cluster.trigger,
             citation_indices=cluster.citation_indices,
-            count=len(citations),
-            evidence_summary=evidence_summary,
         )
+        # Evidence leads and is identical for every cluster, so the provider
+        # prompt cache covers it after the first call
+        messages = evidence_messages(len(citations), evidence_summary, prompt_content)
 
         async with sem:
             for attempt in range(MAX_RETRIES + 1):
                 try:
                     raw = await llm.complete_json(
                         system=SCORING_SYSTEM,
-                        messages=[{"role": "user", "content": prompt_content}],
+                        messages=messages,
                         max_tokens=4096,
                     )
 
                     scores = _parse_scores(raw, len(citations), cluster.citation_indices)
                     if scores:
-                        recency_weights = []
-                        for idx in cluster.citation_indices:
-                            if 0 <= idx < len(citations):
-                                w = compute_recency_weight(citations[idx].date_published)
-                                recency_weights.append(w)
-                        avg_recency = (
-                            sum(recency_weights) / len(recency_weights)
-                            if recency_weights
-                            else 0.5
-                        )
-
-                        cluster.scores = scores
-                        cluster.confidence = compute_cluster_confidence(
-                            cluster.citation_indices, citations
-                        )
-                        cluster.recency_weight = avg_recency
+                        _apply_scores(cluster, scores)
                         break
 
                 except Exception:
                     logger.exception(f"Scoring attempt {attempt + 1} failed for cluster {cluster.id}")
 
-        async with counter_lock:
-            scored_count += 1
-            if on_progress:
-                await on_progress(scored_count, total)
-
+        await _report_progress()
         return cluster
 
-    scored = await asyncio.gather(*[_score_one(c) for c in clusters])
-    return list(scored)
+    # Batch responses are keyed by cluster id, so ids must be unique
+    batched_ids: set[str] = set()
+    if batch_size > 1 and len({c.id for c in clusters}) == len(clusters):
+        batches = [clusters[i:i + batch_size] for i in range(0, len(clusters), batch_size)]
+        batch_results = await asyncio.gather(
+            *[_score_batch(b) for b in batches if len(b) > 1], return_exceptions=True
+        )
+        for result in batch_results:
+            if isinstance(result, BaseException):
+                logger.error(f"Batch scoring task failed: {result!r}")
+            else:
+                batched_ids |= result
+
+    remaining = [c for c in clusters if c.id not in batched_ids]
+    results = await asyncio.gather(
+        *[_score_one(c) for c in remaining], return_exceptions=True
+    )
+    for cluster, result in zip(remaining, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Scoring failed for cluster {cluster.id}: {result!r}")
+    return list(clusters)
 
 
 def _parse_scores(raw: dict, pack_size: int, fallback_indices: list[int]) -> ClusterScores | None:
-    """Parse raw scoring output into ClusterScores."""
-    dimensions = [
-        "frequency", "severity", "urgency", "payability",
-        "workaround_cost", "saturation", "accessibility",
-    ]
+    """Parse raw scoring output into ClusterScores.
 
+    Sanitized fields are collected as plain dicts and validated in a single
+    model_validate call; pydantic's Rust validator builds the nested models
+    faster than per-object constructors or model_construct.
+    """
     parsed = {}
-    for dim in dimensions:
+    for dim in _SCORE_DIMENSIONS:
         dim_data = raw.get(dim, {})
         if not isinstance(dim_data, dict):
-            return None
+            # e.g. "severity": 4 -- keep the score, fall back on the justification
+            dim_data = {"score": dim_data}
 
-        score = dim_data.get("score", 0)
-        if not isinstance(score, int) or score < 0 or score > 5:
-            score = max(0, min(5, int(score) if isinstance(score, (int, float)) else 0))
+        score = _clamp_score(dim_data.get("score", 0))
 
         justification = dim_data.get("justification", {})
         if isinstance(justification, str):
             justification = {"text": justification, "citation_indices": fallback_indices[:1]}
+        elif not isinstance(justification, dict):
+            # e.g. "justification": null
+            justification = {}
 
         text = justification.get("text", f"Score {score} for {dim}")
         indices = justification.get("citation_indices", fallback_indices[:1])
-        valid_indices = [i for i in indices if 0 <= i < pack_size]
+        if not isinstance(indices, list):
+            indices = fallback_indices[:1]
+        valid_indices = filter_valid_indices(indices, pack_size)
         if not valid_indices:
             valid_indices = fallback_indices[:1]
 
-        parsed[dim] = ScoredDimension(
-            score=score,
-            justification=EvidencedClaim(text=text, citation_indices=valid_indices),
-        )
+        parsed[dim] = {
+            "score": score,
+            "justification": {"text": text, "citation_indices": valid_indices},
+        }
 
     try:
-        return ClusterScores(**parsed)
-    except Exception:
+        return ClusterScores.model_validate(parsed)
+    except ValidationError:
         logger.exception("Failed to construct ClusterScores")
         return None
 
@@ -199,24 +328,26 @@ async def assess_payability(
     citations: list[Citation],
     idea: str,
     llm: LLMProvider,
+    evidence_summary: str | None = None,
 ) -> PayabilityAssessment:
     """Assess payability signals from evidence."""
-    evidence_dicts = [c.model_dump() for c in citations]
-    evidence_summary = format_evidence_summary(evidence_dicts)
+    if not citations:
+        return _insufficient_payability()
+    if evidence_summary is None:
+        evidence_summary = format_evidence_summary(citations)
     unique_urls = len({c.url for c in citations})
 
     prompt_content = PAYABILITY_USER.format(
         idea=idea,
-        count=len(citations),
         unique_urls=unique_urls,
-        evidence_summary=evidence_summary,
     )
+    messages = evidence_messages(len(citations), evidence_summary, prompt_content)
 
     for attempt in range(MAX_RETRIES + 1):
         try:
             raw = await llm.complete_json(
                 system=PAYABILITY_SYSTEM,
-                messages=[{"role": "user", "content": prompt_content}],
+                messages=messages,
                 max_tokens=4096,
             )
 
@@ -225,7 +356,11 @@ async def assess_payability(
         except Exception:
             logger.exception(f"Payability assessment attempt {attempt + 1} failed")
 
-    # Fallback: insufficient evidence
+    return _insufficient_payability()
+
+
+def _insufficient_payability() -> PayabilityAssessment:
+    """Fallback when there is no evidence or every attempt failed."""
     return PayabilityAssessment(
         hiring_signals=[],
         outsourcing_signals=[],
@@ -241,13 +376,13 @@ def _parse_payability(raw: dict, pack_size: int) -> PayabilityAssessment:
     Hard cap: if all signals reference 2 or fewer unique citation indices,
     strength cannot exceed "moderate" (prevents single-source inflation).
     """
-    def parse_signals(key: str) -> list[EvidencedClaim]:
+    def parse_signals(key: str) -> list[dict]:
         signals = []
         for s in raw.get(key, []):
             if isinstance(s, dict) and s.get("text"):
-                indices = [i for i in s.get("citation_indices", []) if 0 <= i < pack_size]
+                indices = filter_valid_indices(s.get("citation_indices", []), pack_size)
                 if indices:
-                    signals.append(EvidencedClaim(text=s["text"], citation_indices=indices))
+                    signals.append({"text": s["text"], "citation_indices": indices})
         return signals
 
     hiring = parse_signals("hiring_signals")
@@ -262,19 +397,19 @@ def _parse_payability(raw: dict, pack_size: int) -> PayabilityAssessment:
     # If all signals point to <= 2 unique sources, cap at "moderate".
     all_indices: set[int] = set()
     for sig in hiring + outsourcing + template_sop:
-        all_indices.update(sig.citation_indices)
+        all_indices.update(sig["citation_indices"])
 
-    summary = raw.get("summary", "No payability assessment available.")
+    summary = str(raw.get("summary", "No payability assessment available."))
     if strength == "strong" and len(all_indices) <= 2:
         strength = "moderate"
         summary += (
             " [Capped from 'strong': all signals reference 2 or fewer unique citations.]"
         )
 
-    return PayabilityAssessment(
-        hiring_signals=hiring,
-        outsourcing_signals=outsourcing,
-        template_sop_signals=template_sop,
-        overall_strength=strength,
-        summary=summary,
-    )
+    return PayabilityAssessment.model_validate({
+        "hiring_signals": hiring,
+        "outsourcing_signals": outsourcing,
+        "template_sop_signals": template_sop,
+        "overall_strength": strength,
+        "summary": summary,
+    })
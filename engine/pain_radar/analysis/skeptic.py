@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from pydantic_core import to_json
+
 from pain_radar.core.models import Citation, ResearchReport
 from pain_radar.llm.prompts import SKEPTIC_SYSTEM, SKEPTIC_USER
 
@@ -13,6 +16,54 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Cap on serialized report size sent for review, in prompt tokens
+_REPORT_TOKEN_BUDGET = 8000
+
+# Sections in review priority; the evidence pack is the bulk and goes last
+_REPORT_FIELD_PRIORITY = (
+    "verdict", "pain_map", "payability", "competitors", "conflicts",
+    "idea_brief", "validation_plan", "evidence_quality", "evidence_pack",
+)
+
+
+def _serialize_report(
+    report: ResearchReport, budget: int, count_tokens: Callable[[str], int]
+) -> str:
+    """Compact JSON of the report, filled section by section up to *budget* tokens.
+
+    List sections are cut at item boundaries so the output stays valid JSON;
+    sections that did not fit (fully or partly) are named under "truncated".
+    """
+    parts: list[str] = []
+    truncated: list[str] = []
+    used = 1  # enclosing braces
+    for field in _REPORT_FIELD_PRIORITY:
+        value = getattr(report, field)
+        head = f'"{field}":'
+        if isinstance(value, list):
+            items: list[str] = []
+            size = count_tokens(head) + 1  # brackets + separators
+            for item in value:
+                encoded = to_json(item).decode()
+                cost = count_tokens(encoded)
+                if used + size + cost > budget:
+                    truncated.append(field)
+                    break
+                items.append(encoded)
+                size += cost
+            encoded_field = head + "[" + ",".join(items) + "]"
+        else:
+            encoded_field = head + to_json(value).decode()
+            size = count_tokens(encoded_field)
+            if used + size > budget:
+                truncated.append(field)
+                continue
+        parts.append(encoded_field)
+        used += size
+    if truncated:
+        parts.append('"truncated":' + to_json(truncated).decode())
+    return "{" + ",".join(parts) + "}"
+
 
 async def run_skeptic_pass(
     report: ResearchReport,
@@ -20,32 +71,24 @@ async def run_skeptic_pass(
     llm: LLMProvider,
 ) -> list[str]:
     """Run skeptic review on the full report. Returns list of flags."""
-    # Serialize report to JSON for review (exclude heavy fields)
-    report_dict = report.model_dump()
-    # Remove raw snapshot data to keep prompt manageable
-    if "source_snapshots" in report_dict:
-        del report_dict["source_snapshots"]
-
-    import json
-    report_json = json.dumps(report_dict, indent=2, default=str)
-
-    # Truncate if too long for context
-    if len(report_json) > 30000:
-        report_json = report_json[:30000] + "\n... (truncated)"
+    if not report.evidence_pack:
+        return []  # fallback-only report; nothing to red-team against
+    report_json = _serialize_report(report, _REPORT_TOKEN_BUDGET, llm.count_tokens)
 
     try:
-        raw = await llm.complete_json(
-            system=SKEPTIC_SYSTEM,
-            messages=[{
-                "role": "user",
-                "content": SKEPTIC_USER.format(report_json=report_json),
-            }],
-            max_tokens=4096,
-        )
-
-        if isinstance(raw, list):
-            return [str(flag) for flag in raw if flag]
-        return []
+        # Flags arrive as a JSON array, so collect them as they stream in
+        return [
+            str(flag)
+            async for flag in llm.stream_json(
+                system=SKEPTIC_SYSTEM,
+                messages=[{
+                    "role": "user",
+                    "content": SKEPTIC_USER.format(report_json=report_json),
+                }],
+                max_tokens=4096,
+            )
+            if flag and not isinstance(flag, dict)
+        ]
 
     except Exception:
         logger.exception("Skeptic pass failed")
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
+import re
+from collections import Counter, defaultdict
 from typing import TYPE_CHECKING
 
+from pydantic import ValidationError
+
 from pain_radar.core.evidence_gate import (
     MAX_RETRIES,
     auto_populate_excerpts,
+    filter_valid_indices,
     validate_and_fix_excerpts,
 )
 from pain_radar.core.models import (
@@ -17,15 +24,19 @@ from pain_radar.core.models import (
     EvidencedClaim,
     PainCluster,
     PayabilityAssessment,
+    SourceType,
     ValidationPlan,
     Verdict,
     VerdictDecision,
 )
+from pain_radar.llm.base import is_retryable_error, retry_backoff
 from pain_radar.llm.prompts import (
     VALIDATION_PLAN_SYSTEM,
     VALIDATION_PLAN_USER,
     VERDICT_SYSTEM,
     VERDICT_USER,
+    correction_messages,
+    evidence_messages,
     format_evidence_summary,
 )
 
@@ -34,44 +45,120 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Above this many citations, verdict parsing (excerpt matching against the
+# pack) moves off the event loop so concurrent jobs keep making progress.
+_THREAD_PARSE_THRESHOLD = 200
+
+# Claims about the analysis process rather than the domain
+_META_PHRASES = (
+    "insufficient evidence",
+    "evidence is too sparse",
+    "no specific reasons",
+    "evidence mix",
+    "too thin",
+    "analysis process",
+    "evidence too sparse",
+    "risk assessment incomplete",
+)
+# One alternation so each claim is scanned once instead of once per phrase.
+# Phrases are lowercase and claims are lowercased before matching.
+_META_RE = re.compile("|".join(re.escape(p) for p in _META_PHRASES))
+
+_VERDICT_FIELDS = ("decision", "reasons", "risks", "narrowest_wedge", "what_would_change")
+_VALIDATION_PLAN_FIELDS = (
+    "objective", "channels", "outreach_targets", "interview_script",
+    "landing_page_hypotheses", "concierge_procedure", "success_threshold",
+    "reversal_criteria",
+)
+
+
+class VerdictParseError(ValueError):
+    """Model output that could not be parsed into a verdict or validation plan."""
+
+    def __init__(self, reason: str, missing_fields: list[str] | None = None) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.missing_fields = missing_fields or []
+
+
+def _describe_parse_error(exc: Exception, missing: list[str]) -> str:
+    if isinstance(exc, ValidationError):
+        reason = "; ".join(
+            f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in exc.errors()[:5]
+        )
+    else:
+        reason = str(exc) or type(exc).__name__
+    if missing:
+        reason += f" (missing fields: {', '.join(missing)})"
+    return reason
+
+
+def _check_object(raw: object, fields: tuple[str, ...]) -> list[str]:
+    """Return the expected fields missing from *raw*, which must be a JSON object."""
+    if not isinstance(raw, dict):
+        raise VerdictParseError(
+            f"expected a JSON object, got {type(raw).__name__}", list(fields)
+        )
+    return [f for f in fields if f not in raw]
+
 
 def _best_citation_indices(citations: list[Citation], n: int = 3) -> list[int]:
-    """Pick up to *n* citation indices from diverse source types."""
+    """Pick up to *n* citation indices from diverse source types.
+
+    The first citation of each source type comes first, then the earliest
+    remaining citations fill any open slots.
+    """
     if not citations:
         return [0]
-    seen_types: set[str] = set()
+    seen_types: set[SourceType] = set()
     picked: list[int] = []
     for i, c in enumerate(citations):
-        stype = c.source_type.value if hasattr(c.source_type, "value") else str(c.source_type)
-        if stype not in seen_types:
+        if c.source_type not in seen_types:
             picked.append(i)
-            seen_types.add(stype)
+            seen_types.add(c.source_type)
             if len(picked) >= n:
+                return picked
+            if len(seen_types) == len(SourceType):
                 break
     # Fill remaining slots if we haven't reached n
-    if len(picked) < n:
-        for i in range(len(citations)):
-            if i not in picked:
-                picked.append(i)
-                if len(picked) >= n:
-                    break
-    return picked or [0]
+    chosen = set(picked)
+    for i in range(len(citations)):
+        if len(picked) >= n:
+            break
+        if i not in chosen:
+            picked.append(i)
+    return picked
+
+
+def _citation_word_index(citations: list[Citation]) -> dict[str, list[int]]:
+    """Map each lowercased excerpt word to the indices of citations containing it."""
+    index: dict[str, list[int]] = defaultdict(list)
+    for i, c in enumerate(citations):
+        for word in set(c.excerpt.lower().split()):
+            index[word].append(i)
+    return index
+
 
+def _match_citation_to_text(
+    text: str,
+    citations: list[Citation],
+    word_index: dict[str, list[int]] | None = None,
+) -> list[int]:
+    """Find the best-matching citation for a text string via word overlap.
 
-def _match_citation_to_text(text: str, citations: list[Citation]) -> list[int]:
-    """Find the best-matching citation for a text string via word overlap."""
+    Ties go to the lowest index; no overlap at all falls back to [0]. Pass a
+    prebuilt *word_index* when matching several texts against one pack.
+    """
     if not citations:
         return [0]
-    text_words = set(text.lower().split())
-    best_idx = 0
-    best_score = 0
-    for i, c in enumerate(citations):
-        excerpt_words = set(c.excerpt.lower().split())
-        overlap = len(text_words & excerpt_words)
-        if overlap > best_score:
-            best_score = overlap
-            best_idx = i
-    return [best_idx]
+    if word_index is None:
+        word_index = _citation_word_index(citations)
+    overlap: Counter[int] = Counter()
+    for word in set(text.lower().split()):
+        overlap.update(word_index.get(word, ()))
+    if not overlap:
+        return [0]
+    return [min(overlap, key=lambda i: (-overlap[i], i))]
 
 
 async def generate_verdict(
@@ -81,24 +168,31 @@ async def generate_verdict(
     conflicts: list[ConflictReport],
     citations: list[Citation],
     llm: LLMProvider,
+    evidence_summary: str | None = None,
 ) -> Verdict:
     """Generate KILL/NARROW/ADVANCE verdict with evidence."""
-    evidence_dicts = [c.model_dump() for c in citations]
-    evidence_summary = format_evidence_summary(evidence_dicts)
+    if not citations or (not clusters and not competitors):
+        # Nothing for the model to weigh; every attempt would end in the fallback
+        return _insufficient_evidence_verdict(
+            citations, conflicts,
+            "No pain clusters or competitors could be extracted from the evidence",
+        )
+    if evidence_summary is None:
+        evidence_summary = format_evidence_summary(citations)
 
-    clusters_summary = "\n".join(
+    clusters_summary = "\n".join([
         f"- [{c.id}] [{c.category.value}] {c.statement.text} | frequency={c.scores.frequency.score} "
         f"severity={c.scores.severity.score} payability={c.scores.payability.score} "
         f"confidence={c.confidence:.2f} recency={c.recency_weight:.2f}"
         for c in clusters
-    )
+    ])
 
-    competitors_summary = "\n".join(
+    competitors_summary = "\n".join([
         f"- {c.name} [{c.relationship.value}]: pricing_page={c.pricing_page_exists}, "
         f"min_price={c.min_price_observed or 'unknown'}, "
         f"onboarding={c.onboarding_model.value}"
         for c in competitors
-    )
+    ])
 
     payability_summary = (
         f"Overall: {payability.overall_strength}\n"
@@ -107,41 +201,58 @@ async def generate_verdict(
         f"Summary: {payability.summary}"
     )
 
-    conflicts_summary = "\n".join(
+    conflicts_summary = "\n".join([
         f"- {c.description}" for c in conflicts
-    ) or "No conflicts detected"
+    ]) or "No conflicts detected"
 
     prompt_content = VERDICT_USER.format(
-        idea=evidence_dicts[0].get("url", "unknown") if evidence_dicts else "unknown",
+        idea=citations[0].url if citations else "unknown",
         clusters_summary=clusters_summary or "No clusters",
         competitors_summary=competitors_summary or "No competitors",
         payability_summary=payability_summary,
         conflicts_summary=conflicts_summary,
-        count=len(citations),
-        evidence_summary=evidence_summary,
     )
+    messages = evidence_messages(len(citations), evidence_summary, prompt_content)
 
     for attempt in range(MAX_RETRIES + 1):
         try:
             raw = await llm.complete_json(
                 system=VERDICT_SYSTEM,
-                messages=[{"role": "user", "content": prompt_content}],
+                messages=messages,
                 max_tokens=4096,
             )
 
-            verdict = _parse_verdict(raw, len(citations), conflicts, citations)
-            if verdict:
-                return verdict
+            if len(citations) > _THREAD_PARSE_THRESHOLD:
+                return await asyncio.to_thread(
+                    _parse_verdict, raw, len(citations), conflicts, citations,
+                )
+            return _parse_verdict(raw, len(citations), conflicts, citations)
 
-        except Exception:
+        except VerdictParseError as exc:
+            logger.warning(f"Verdict attempt {attempt + 1} unparseable: {exc.reason}")
+            messages = messages + correction_messages(raw, exc.reason, _VERDICT_FIELDS)
+        except Exception as exc:
             logger.exception(f"Verdict generation attempt {attempt + 1} failed")
+            if not is_retryable_error(exc):
+                break
+            if attempt < MAX_RETRIES:
+                await retry_backoff(attempt, exc)
+
+    return _insufficient_evidence_verdict(
+        citations, conflicts,
+        "Insufficient evidence to evaluate idea after exhausting analysis retries",
+    )
 
-    # Fallback: INSUFFICIENT_EVIDENCE when retries exhausted
+
+def _insufficient_evidence_verdict(
+    citations: list[Citation], conflicts: list[ConflictReport], reason: str
+) -> Verdict:
+    """INSUFFICIENT_EVIDENCE verdict used when no model verdict is available."""
     fallback_indices = _best_citation_indices(citations)
     return Verdict(
         decision=VerdictDecision.INSUFFICIENT_EVIDENCE,
         reasons=[EvidencedClaim(
-            text="Insufficient evidence to evaluate idea after exhausting analysis retries",
+            text=reason,
             citation_indices=fallback_indices,
         )],
         risks=[EvidencedClaim(
@@ -159,8 +270,13 @@ def _parse_verdict(
     pack_size: int,
     conflicts: list[ConflictReport],
     citations: list[Citation] | None = None,
-) -> Verdict | None:
-    """Parse raw verdict output."""
+) -> Verdict:
+    """Parse raw verdict output.
+
+    Raises VerdictParseError describing what was malformed, so the caller
+    can ask the model to correct it.
+    """
+    missing = _check_object(raw, _VERDICT_FIELDS)
     try:
         decision_str = raw.get("decision", "KILL").upper()
         try:
@@ -169,13 +285,15 @@ def _parse_verdict(
             decision = VerdictDecision.KILL
 
         _citations = citations or []
+        word_index: dict[str, list[int]] | None = None
 
         def parse_claims(key: str) -> list[EvidencedClaim]:
+            nonlocal word_index
             claims = []
             for item in raw.get(key, []):
                 if isinstance(item, dict):
                     text = item.get("text", "")
-                    indices = [i for i in item.get("citation_indices", []) if 0 <= i < pack_size]
+                    indices = filter_valid_indices(item.get("citation_indices", []), pack_size)
                     if text and indices:
                         # Parse evidence_excerpts from LLM output
                         raw_excerpts = item.get("evidence_excerpts", [])
@@ -201,9 +319,11 @@ def _parse_verdict(
 
                         claims.append(claim)
                 elif isinstance(item, str) and item.strip():
+                    if word_index is None:
+                        word_index = _citation_word_index(_citations)
                     claim = EvidencedClaim(
                         text=item,
-                        citation_indices=_match_citation_to_text(item, _citations),
+                        citation_indices=_match_citation_to_text(item, _citations, word_index),
                     )
                     if _citations:
                         claim.evidence_excerpts = auto_populate_excerpts(
@@ -216,20 +336,8 @@ def _parse_verdict(
         risks = parse_claims("risks")
 
         # Filter out meta-statements (about the analysis process, not the domain)
-        meta_phrases = [
-            "insufficient evidence",
-            "evidence is too sparse",
-            "no specific reasons",
-            "evidence mix",
-            "too thin",
-            "analysis process",
-            "evidence too sparse",
-            "risk assessment incomplete",
-        ]
-
         def is_meta_statement(text: str) -> bool:
-            lower = text.lower()
-            return any(p in lower for p in meta_phrases)
+            return _META_RE.search(text.lower()) is not None
 
         reasons = [r for r in reasons if not is_meta_statement(r.text)]
         risks = [r for r in risks if not is_meta_statement(r.text)]
@@ -268,9 +376,8 @@ def _parse_verdict(
             what_would_change=raw.get("what_would_change", "Unknown"),
             conflicts=conflicts,
         )
-    except Exception:
-        logger.exception("Failed to parse verdict")
-        return None
+    except Exception as exc:
+        raise VerdictParseError(_describe_parse_error(exc, missing), missing) from exc
 
 
 async def generate_validation_plan(
@@ -281,10 +388,15 @@ async def generate_validation_plan(
     llm: LLMProvider,
 ) -> ValidationPlan:
     """Generate 7-day validation plan. Mandatory for ALL verdicts."""
-    top_clusters_text = "\n".join(
+    if verdict.decision == VerdictDecision.INSUFFICIENT_EVIDENCE and not clusters:
+        # No findings to tailor a plan to; the generic evidence-gathering plan
+        # is what the model would be asked to restate
+        return _fallback_validation_plan(verdict)
+
+    top_clusters_text = "\n".join([
         f"- {c.statement.text} (confidence={c.confidence:.2f})"
-        for c in sorted(clusters, key=lambda x: x.confidence, reverse=True)[:5]
-    )
+        for c in heapq.nlargest(5, clusters, key=lambda x: x.confidence)
+    ])
 
     prompt_content = VALIDATION_PLAN_USER.format(
         verdict_decision=verdict.decision.value,
@@ -294,22 +406,33 @@ async def generate_validation_plan(
         what_would_change=verdict.what_would_change,
     )
 
+    messages = [{"role": "user", "content": prompt_content}]
+
     for attempt in range(MAX_RETRIES + 1):
         try:
             raw = await llm.complete_json(
                 system=VALIDATION_PLAN_SYSTEM,
-                messages=[{"role": "user", "content": prompt_content}],
+                messages=messages,
                 max_tokens=4096,
             )
 
-            plan = _parse_validation_plan(raw, verdict.decision)
-            if plan:
-                return plan
+            return _parse_validation_plan(raw, verdict.decision)
 
-        except Exception:
+        except VerdictParseError as exc:
+            logger.warning(f"Validation plan attempt {attempt + 1} unparseable: {exc.reason}")
+            messages = messages + correction_messages(raw, exc.reason, _VALIDATION_PLAN_FIELDS)
+        except Exception as exc:
             logger.exception(f"Validation plan attempt {attempt + 1} failed")
+            if not is_retryable_error(exc):
+                break
+            if attempt < MAX_RETRIES:
+                await retry_backoff(attempt, exc)
+
+    return _fallback_validation_plan(verdict)
+
 
-    # Fallback plan
+def _fallback_validation_plan(verdict: Verdict) -> ValidationPlan:
+    """Generic evidence-gathering plan used when no model plan is available."""
     return ValidationPlan(
         verdict_context=verdict.decision,
         objective="Collect evidence to validate or invalidate this idea",
@@ -327,8 +450,9 @@ async def generate_validation_plan(
     )
 
 
-def _parse_validation_plan(raw: dict, decision: VerdictDecision) -> ValidationPlan | None:
-    """Parse raw validation plan output."""
+def _parse_validation_plan(raw: dict, decision: VerdictDecision) -> ValidationPlan:
+    """Parse raw validation plan output; raises VerdictParseError."""
+    missing = _check_object(raw, _VALIDATION_PLAN_FIELDS)
     try:
         success_threshold = raw.get("success_threshold", "")
         if not success_threshold:
@@ -345,9 +469,8 @@ def _parse_validation_plan(raw: dict, decision: VerdictDecision) -> ValidationPl
             success_threshold=success_threshold,
             reversal_criteria=raw.get("reversal_criteria"),
         )
-    except Exception:
-        logger.exception("Failed to parse validation plan")
-        return None
+    except Exception as exc:
+        raise VerdictParseError(_describe_parse_error(exc, missing), missing) from exc
 
 
 def enforce_verdict_payability_consistency(
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
-import io
-import json
+import functools
+import operator
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
 from pain_radar.api.schemas import (
     ClarifyRequest,
@@ -18,9 +23,11 @@ from pain_radar.api.schemas import (
     RunResponse,
     StatusResponse,
 )
-from pain_radar.core.models import ClarificationQuestion, JobProgress
+from pain_radar.core.models import ClarificationQuestion, JobProgress, ResearchReport
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from pain_radar.db import Database
     from pain_radar.pipeline.orchestrator import ResearchOrchestrator
 
@@ -30,6 +37,20 @@ router = APIRouter(prefix="/api/research")
 _db: Database | None = None
 _orchestrator: ResearchOrchestrator | None = None
 
+# Parsed progress and encoded report responses keyed on (job_id, row
+# timestamp), so status and report polls between writes skip re-parsing
+# (and, for reports, re-serializing) the stored JSON. Encoded reports with a
+# large evidence pack run to hundreds of KB each, so far fewer are kept.
+_PARSED_CACHE_SIZE = 256
+_REPORT_CACHE_SIZE = 8
+_progress_cache: OrderedDict[tuple[str, str], JobProgress] = OrderedDict()
+_report_cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+# Payloads larger than this are parsed off the event loop
+_THREAD_PARSE_BYTES = 64 * 1024
+
+_QUESTIONS_ADAPTER = TypeAdapter(list[ClarificationQuestion])
+
 
 def init_routes(db: Database, orchestrator: ResearchOrchestrator) -> None:
     global _db, _orchestrator
@@ -47,12 +68,33 @@ def _get_orchestrator() -> ResearchOrchestrator:
     return _orchestrator
 
 
+async def _parse_cached[T](
+    cache: OrderedDict[tuple[str, str], T],
+    key: tuple[str, str],
+    parse: Callable[[str], T],
+    payload: str,
+    max_entries: int = _PARSED_CACHE_SIZE,
+) -> T:
+    """Return parse(payload), reusing the result for an unchanged row."""
+    parsed = cache.get(key)
+    if parsed is None:
+        if len(payload) > _THREAD_PARSE_BYTES:
+            parsed = await asyncio.to_thread(parse, payload)
+        else:
+            parsed = parse(payload)
+        cache[key] = parsed
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+    cache.move_to_end(key)
+    return parsed
+
+
 @router.post("/run", response_model=RunResponse)
 async def start_research(req: RunRequest) -> RunResponse:
     db = _get_db()
     orchestrator = _get_orchestrator()
 
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
     options = {
         "niche": req.niche,
         "geography": req.geography,
@@ -98,12 +140,14 @@ async def get_status(job_id: str) -> StatusResponse:
 
     progress = None
     if job["progress_json"]:
-        progress = JobProgress(**json.loads(job["progress_json"]))
+        progress = await _parse_cached(
+            _progress_cache, (job_id, job["updated_at"]), JobProgress.model_validate_json,
+            job["progress_json"],
+        )
 
     questions = None
     if job["status"] == "clarifying" and job["clarification_questions_json"]:
-        raw = json.loads(job["clarification_questions_json"])
-        questions = [ClarificationQuestion(**q) for q in raw]
+        questions = _QUESTIONS_ADAPTER.validate_json(job["clarification_questions_json"])
 
     return StatusResponse(
         job_id=job_id,
@@ -113,11 +157,16 @@ async def get_status(job_id: str) -> StatusResponse:
     )
 
 
+def _encode_report_response(job_id: str, report_json: str) -> bytes:
+    report = ResearchReport.model_validate_json(report_json)
+    return to_json(ReportResponse(job_id=job_id, status="complete", report=report))
+
+
 @router.get("/{job_id}/report", response_model=ReportResponse)
-async def get_report(job_id: str) -> ReportResponse:
+async def get_report(job_id: str) -> ReportResponse | Response:
     db = _get_db()
 
-    job = await db.get_job(job_id)
+    job, report_row = await asyncio.gather(db.get_job(job_id), db.get_report(job_id))
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -127,14 +176,17 @@ async def get_report(job_id: str) -> ReportResponse:
     if job["status"] != "complete":
         return ReportResponse(job_id=job_id, status=job["status"])
 
-    report_row = await db.get_report(job_id)
     if not report_row:
         raise HTTPException(status_code=500, detail="Report not found despite complete status")
 
-    from pain_radar.core.models import ResearchReport
-    report = ResearchReport(**json.loads(report_row["report_json"]))
-
-    return ReportResponse(job_id=job_id, status="complete", report=report)
+    # Returned as a ready-made body: FastAPI would otherwise dump, re-validate
+    # and re-serialize the whole report on every poll
+    body = await _parse_cached(
+        _report_cache, (job_id, report_row["created_at"]),
+        functools.partial(_encode_report_response, job_id), report_row["report_json"],
+        max_entries=_REPORT_CACHE_SIZE,
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{job_id}/export")
@@ -143,43 +195,73 @@ async def export_evidence(
 ) -> StreamingResponse:
     db = _get_db()
 
-    job = await db.get_job(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    citations = await db.get_citations(job_id)
-    if not citations:
-        raise HTTPException(status_code=404, detail="No citations found")
+    # Rows stream straight from the cursor; the first one is fetched up
+    # front (alongside the job) so a missing job or empty pack still 404s
+    rows = db.iter_citations(job_id)
+    try:
+        job, first = await asyncio.gather(db.get_job(job_id), anext(rows, None))
+    except BaseException:
+        await rows.aclose()
+        raise
+    if not job or first is None:
+        await rows.aclose()
+        raise HTTPException(
+            status_code=404, detail="Job not found" if not job else "No citations found",
+        )
+    citations = _prepend(first, rows)
 
     if format == "json":
-        content = json.dumps(citations, indent=2)
         return StreamingResponse(
-            io.BytesIO(content.encode()),
+            _iter_json(citations),
             media_type="application/json",
             headers={"Content-Disposition": f"attachment; filename=evidence_{job_id}.json"},
         )
 
-    # CSV export
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=[
-        "id", "url", "excerpt", "source_type", "date_published",
-        "date_retrieved", "recency_months", "snapshot_hash",
-    ])
-    writer.writeheader()
-    for c in citations:
-        writer.writerow({
-            "id": c["id"],
-            "url": c["url"],
-            "excerpt": c["excerpt"],
-            "source_type": c["source_type"],
-            "date_published": c["date_published"],
-            "date_retrieved": c["date_retrieved"],
-            "recency_months": c["recency_months"],
-            "snapshot_hash": c["snapshot_hash"],
-        })
-
     return StreamingResponse(
-        io.BytesIO(output.getvalue().encode()),
+        _iter_csv(citations),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=evidence_{job_id}.csv"},
     )
+
+
+_CSV_FIELDS = [
+    "id", "url", "excerpt", "source_type", "date_published",
+    "date_retrieved", "recency_months", "snapshot_hash",
+]
+_csv_row = operator.itemgetter(*_CSV_FIELDS)
+
+
+async def _prepend(first: dict, rest: AsyncIterator[dict]) -> AsyncIterator[dict]:
+    yield first
+    async for row in rest:
+        yield row
+
+
+class _LineBuffer:
+    """File-like sink keeping only the last line csv.writer wrote."""
+
+    line = ""
+
+    def write(self, line: str) -> None:
+        self.line = line
+
+
+async def _iter_csv(citations: AsyncIterable[dict]) -> AsyncIterator[str]:
+    """Yield the evidence CSV one row at a time."""
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_FIELDS)
+    yield buffer.line
+    async for c in citations:
+        writer.writerow(_csv_row(c))
+        yield buffer.line
+
+
+async def _iter_json(citations: AsyncIterable[dict]) -> AsyncIterator[bytes]:
+    """Yield the citations as an indent=2 JSON array, one citation at a time."""
+    yield b"["
+    separator = b"\n  "
+    async for c in citations:
+        yield separator + to_json(c, indent=2).replace(b"\n", b"\n  ")
+        separator = b",\n  "
+    yield b"\n]"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings
@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     llm_model: str = "claude-sonnet-4-5-20250929"
     anthropic_api_key: str = ""
     openai_api_key: str = ""
+    llm_mode: str = "online"  # "online" | "batch" (provider Batch API: cheaper, slow)
+    llm_batch_poll_seconds: float = 30.0
+    llm_cache_size: int = 256  # exact-match response cache entries; 0 disables
+    llm_max_concurrency: int = 20  # in-flight requests per process; 0 disables
 
     # Search
     serper_api_key: str = ""  # optional, falls back to DuckDuckGo
@@ -24,6 +28,7 @@ class Settings(BaseSettings):
     # Infrastructure
     engine_port: int = 8000
     data_dir: Path = Path("./data")
+    db_readers: int = 4  # read-only SQLite connections beside the writer; 0 shares it
 
     model_config = {
         "env_file": ("../.env", ".env"),
@@ -31,19 +36,19 @@ class Settings(BaseSettings):
         "extra": "ignore",
     }
 
-    @property
+    @cached_property
     def db_path(self) -> Path:
         return self.data_dir / "pain_radar.db"
 
-    @property
+    @cached_property
     def snapshots_dir(self) -> Path:
         return self.data_dir / "snapshots"
 
-    @property
+    @cached_property
     def has_serper(self) -> bool:
         return bool(self.serper_api_key)
 
-    @property
+    @cached_property
     def has_reddit(self) -> bool:
         return bool(self.reddit_client_id and self.reddit_client_secret)
 
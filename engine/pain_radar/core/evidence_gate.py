@@ -7,8 +7,13 @@ the LLM prompt. After 3 failures, the field is marked "insufficient evidence".
 
 from __future__ import annotations
 
+import functools
 import re
+import string
+from collections import Counter
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from typing import Annotated, Any, Literal, get_args, get_origin
 
 from pydantic import BaseModel
 
@@ -32,17 +37,33 @@ _EXCERPT_STOPWORDS = frozenset({
     "from", "into", "through", "during", "before", "with", "without",
     "for", "of", "on", "in", "to", "at", "by", "up", "out", "off", "over",
 })
+# Content tokens are >= 5 chars, so only these stopwords can ever match one
+_LONG_EXCERPT_STOPWORDS = frozenset(w for w in _EXCERPT_STOPWORDS if len(w) >= 5)
 
 MAX_RETRIES = 2  # retry up to 2 times (3 total attempts)
 
 
-@dataclass
+def filter_valid_indices(indices, pack_size: int) -> list[int]:
+    """Keep only citation indices that point into an evidence pack of pack_size.
+
+    LLM output is usually already in range, so check the bounds with C-level
+    min()/max() first and only fall back to the per-element filter when some
+    index is out of range.
+    """
+    if not indices:
+        return []
+    if min(indices) >= 0 and max(indices) < pack_size:
+        return list(indices)
+    return [i for i in indices if 0 <= i < pack_size]
+
+
+@dataclass(slots=True)
 class GateViolation:
     field_path: str
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GateResult:
     passed: bool
     violations: list[GateViolation] = field(default_factory=list)
@@ -69,46 +90,170 @@ def validate_output(
     4. Reject any freeform numeric in justification text that doesn't appear
        in a cited excerpt.
     """
+    if _is_claim_free(type(output)):
+        return GateResult(passed=True)
     violations: list[GateViolation] = []
+    excerpt_missing = _excerpt_missing_check(evidence_pack, snapshots) if snapshots else None
+    cited_numbers = _cited_numbers_lookup(evidence_pack)
     # If the root object is itself an EvidencedClaim, validate it directly
     if isinstance(output, EvidencedClaim):
-        _validate_claim(output, "<root>", evidence_pack, snapshots, violations)
+        _validate_claim(
+            output, "<root>", evidence_pack, excerpt_missing, cited_numbers, violations
+        )
     else:
-        _walk_model(output, "", evidence_pack, snapshots, violations)
+        _walk_model(output, "", evidence_pack, excerpt_missing, cited_numbers, violations)
     return GateResult(passed=len(violations) == 0, violations=violations)
 
 
+def _excerpt_missing_check(
+    evidence_pack: list[Citation],
+    snapshots: dict[str, SourceSnapshot],
+) -> Callable[[int], bool]:
+    """Return a check for "citation idx's excerpt is absent from its snapshot".
+
+    Answers are memoized per (snapshot, excerpt) pair, so claims that share
+    a citation, and citations that repeat an excerpt from the same snapshot,
+    scan the (possibly large) snapshot text once per validation. The scan
+    itself is str.__contains__, whose C search beats any index we could
+    build over raw_text in Python.
+    """
+    @functools.cache
+    def excerpt_absent(snapshot_hash: str, excerpt: str) -> bool:
+        snapshot = snapshots.get(snapshot_hash)
+        if snapshot is None:
+            return False
+        raw_text = snapshot.raw_text
+        return len(excerpt) > len(raw_text) or excerpt not in raw_text
+
+    def missing(idx: int) -> bool:
+        citation = evidence_pack[idx]
+        return excerpt_absent(citation.snapshot_hash, citation.excerpt)
+
+    return missing
+
+
+def _cited_numbers_lookup(
+    evidence_pack: list[Citation],
+) -> Callable[[frozenset[int]], frozenset[str]]:
+    """Return a lookup of the number tokens in a set of cited excerpts.
+
+    Memoized per set of (valid) citation indices, since many claims in a
+    report cite the same few citations, and each excerpt is scanned once.
+    """
+    @functools.cache
+    def excerpt_numbers(idx: int) -> frozenset[str]:
+        return frozenset(m.group(0) for m in _NUM_PATTERN.finditer(evidence_pack[idx].excerpt))
+
+    @functools.cache
+    def cited_numbers(indices: frozenset[int]) -> frozenset[str]:
+        return frozenset().union(*map(excerpt_numbers, indices))
+
+    return cited_numbers
+
+
+@functools.cache
+def _model_bearing_fields(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    """Names of the fields of *model_cls* whose values can contain a model.
+
+    Scalar fields (str, int, enums, list[str], ...) can never hold an
+    EvidencedClaim, so _walk_model skips them without reading the value.
+    """
+    return tuple(
+        name for name, info in model_cls.model_fields.items()
+        if _may_hold_model(info.annotation)
+    )
+
+
+def _may_hold_model(annotation: Any) -> bool:
+    return any(
+        leaf is None or leaf is object or issubclass(leaf, BaseModel)
+        for leaf in _annotation_leaves(annotation)
+    )
+
+
+def _annotation_leaves(annotation: Any) -> Iterator[type | None]:
+    """Yield the concrete types an annotation can take.
+
+    None stands for anything unknown (Any, TypeVars, unresolved forward
+    refs), which callers treat as possibly holding a claim.
+    """
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return
+    if origin is Annotated:
+        yield from _annotation_leaves(get_args(annotation)[0])
+    elif args := get_args(annotation):
+        for arg in args:
+            yield from _annotation_leaves(arg)
+    elif isinstance(annotation, type):
+        yield annotation
+    elif annotation is not None:
+        yield None
+
+
+@functools.cache
+def _is_claim_free(model_cls: type[BaseModel]) -> bool:
+    """Whether no EvidencedClaim can appear anywhere under *model_cls*."""
+    return _claim_free(model_cls, set())
+
+
+def _claim_free(model_cls: type[BaseModel], seen: set[type]) -> bool:
+    if issubclass(model_cls, EvidencedClaim):
+        return False
+    seen.add(model_cls)
+    for name in _model_bearing_fields(model_cls):
+        for leaf in _annotation_leaves(model_cls.model_fields[name].annotation):
+            if leaf is None or leaf is object or leaf is BaseModel:
+                return False
+            if issubclass(leaf, BaseModel) and leaf not in seen and not _claim_free(leaf, seen):
+                return False
+    return True
+
+
 def _walk_model(
     obj: BaseModel,
     path: str,
     evidence_pack: list[Citation],
-    snapshots: dict[str, SourceSnapshot] | None,
+    excerpt_missing: Callable[[int], bool] | None,
+    cited_numbers: Callable[[frozenset[int]], frozenset[str]],
     violations: list[GateViolation],
 ) -> None:
-    """Recursively walk a Pydantic model looking for EvidencedClaim fields."""
-    for field_name, field_info in type(obj).model_fields.items():
-        value = getattr(obj, field_name, None)
-        if value is None:
+    """Walk a Pydantic model tree looking for EvidencedClaim fields.
+
+    Uses an explicit stack instead of recursion; children are pushed in
+    reverse so claims are still validated in field (pre-)order.
+    """
+    stack: list[tuple[BaseModel, str]] = [(obj, path)]
+    while stack:
+        node, node_path = stack.pop()
+        if isinstance(node, EvidencedClaim):
+            _validate_claim(
+                node, node_path, evidence_pack, excerpt_missing, cited_numbers, violations
+            )
             continue
-        current_path = f"{path}.{field_name}" if path else field_name
-        if isinstance(value, EvidencedClaim):
-            _validate_claim(value, current_path, evidence_pack, snapshots, violations)
-        elif isinstance(value, BaseModel):
-            _walk_model(value, current_path, evidence_pack, snapshots, violations)
-        elif isinstance(value, list):
-            for i, item in enumerate(value):
-                item_path = f"{current_path}[{i}]"
-                if isinstance(item, EvidencedClaim):
-                    _validate_claim(item, item_path, evidence_pack, snapshots, violations)
-                elif isinstance(item, BaseModel):
-                    _walk_model(item, item_path, evidence_pack, snapshots, violations)
+        children: list[tuple[BaseModel, str]] = []
+        for field_name in _model_bearing_fields(type(node)):
+            value = getattr(node, field_name, None)
+            if value is None:
+                continue
+            current_path = f"{node_path}.{field_name}" if node_path else field_name
+            if isinstance(value, BaseModel):
+                children.append((value, current_path))
+            elif isinstance(value, list):
+                children.extend(
+                    (item, f"{current_path}[{i}]")
+                    for i, item in enumerate(value)
+                    if isinstance(item, BaseModel)
+                )
+        stack.extend(reversed(children))
 
 
 def _validate_claim(
     claim: EvidencedClaim,
     path: str,
     evidence_pack: list[Citation],
-    snapshots: dict[str, SourceSnapshot] | None,
+    excerpt_missing: Callable[[int], bool] | None,
+    cited_numbers: Callable[[frozenset[int]], frozenset[str]],
     violations: list[GateViolation],
 ) -> None:
     """Validate a single EvidencedClaim."""
@@ -123,29 +268,27 @@ def _validate_claim(
             ))
 
     # 2. Check excerpts exist in snapshots (if snapshots provided)
-    if snapshots:
+    if excerpt_missing:
         for idx in claim.citation_indices:
             if idx < 0 or idx >= pack_size:
                 continue
-            citation = evidence_pack[idx]
-            snapshot = snapshots.get(citation.snapshot_hash)
-            if snapshot and citation.excerpt not in snapshot.raw_text:
+            if excerpt_missing(idx):
                 violations.append(GateViolation(
                     field_path=path,
                     reason=(
                         f"Excerpt not found in snapshot for citation {idx}. "
-                        f"Excerpt: '{citation.excerpt[:80]}...'"
+                        f"Excerpt: '{evidence_pack[idx].excerpt[:80]}...'"
                     ),
                 ))
 
     # 3. Check freeform numerics are backed by cited excerpts
-    numbers_in_text = _NUM_PATTERN.findall(claim.text)
+    # Each distinct number once, in order of first appearance
+    numbers_in_text = dict.fromkeys(m.group(0) for m in _NUM_PATTERN.finditer(claim.text))
     if numbers_in_text:
-        # Collect all text from cited excerpts
-        cited_excerpts = ""
-        for idx in claim.citation_indices:
-            if 0 <= idx < pack_size:
-                cited_excerpts += " " + evidence_pack[idx].excerpt
+        # Number tokens from all cited excerpts
+        backed_numbers = cited_numbers(
+            frozenset(idx for idx in claim.citation_indices if 0 <= idx < pack_size)
+        )
 
         for num in numbers_in_text:
             # Skip trivially small numbers (0-5) which may be scores
@@ -155,7 +298,7 @@ def _validate_claim(
                     continue
             except ValueError:
                 pass
-            if num not in cited_excerpts:
+            if num not in backed_numbers:
                 violations.append(GateViolation(
                     field_path=path,
                     reason=(
@@ -169,32 +312,50 @@ def _validate_claim(
 # Excerpt validation + keyword-dense span selection
 # ---------------------------------------------------------------------------
 
-def _extract_content_tokens(text: str) -> list[str]:
-    """Extract content tokens: lowercase words len>=5 and not stopwords."""
-    words = re.sub(r"[^\w\s]", "", text.lower()).split()
-    return [w for w in words if len(w) >= 5 and w not in _EXCERPT_STOPWORDS]
+_PUNCT_RE = re.compile(r"[^\w\s]")
+# ASCII fast path for _PUNCT_RE: delete the same characters via str.translate
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation.replace("_", ""))
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_CHUNK_RE = re.compile(r"\S+")
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_content_tokens(text: str) -> tuple[str, ...]:
+    """Extract content tokens: lowercase words len>=5 and not stopwords.
+
+    Cached because the same excerpts are tokenized for every claim citing them.
+    """
+    lowered = text.lower()
+    if lowered.isascii():
+        words = lowered.translate(_PUNCT_TABLE).split()
+    else:
+        words = _PUNCT_RE.sub("", lowered).split()
+    return tuple(w for w in words if len(w) >= 5 and w not in _LONG_EXCERPT_STOPWORDS)
 
 
 def _best_keyword_span(
     source_text: str,
     claim_text: str,
     span_len: int = 80,
+    claim_tokens: set[str] | None = None,
 ) -> str:
     """Find the most keyword-dense span of ~span_len chars in source_text.
 
     Uses a sliding window scored by overlap of content tokens with claim_text.
-    Prefers sentence boundaries when available.
+    Prefers sentence boundaries when available. Callers scoring several
+    sources against one claim can pass its precomputed *claim_tokens*.
     """
     if len(source_text) <= span_len:
         return source_text.strip()
 
-    claim_tokens = set(_extract_content_tokens(claim_text))
+    if claim_tokens is None:
+        claim_tokens = set(_extract_content_tokens(claim_text))
     if not claim_tokens:
         # No meaningful claim tokens — return first span
         return source_text[:span_len].strip()
 
     # Try sentence-level first
-    sentences = re.split(r"(?<=[.!?])\s+|\n+", source_text)
+    sentences = _SENTENCE_SPLIT_RE.split(source_text)
     if len(sentences) > 1:
         best_sent = ""
         best_score = -1
@@ -202,25 +363,58 @@ def _best_keyword_span(
             sent = sent.strip()
             if not sent or len(sent) < 15:
                 continue
-            sent_tokens = set(_extract_content_tokens(sent))
-            score = len(claim_tokens & sent_tokens)
+            score = len(claim_tokens.intersection(_extract_content_tokens(sent)))
             if score > best_score:
                 best_score = score
                 best_sent = sent
+                if score == len(claim_tokens):
+                    break  # a later sentence can only tie
         if best_sent:
             return best_sent[:span_len].strip()
 
-    # Sliding window fallback
+    # Sliding window fallback. The text is tokenized once with offsets and
+    # the window slides over whole words; only the (at most two) words cut by
+    # a window edge are re-tokenized, so each score equals tokenizing that
+    # window's text on its own.
+    def claim_hit(chunk: str) -> str | None:
+        tokens = _extract_content_tokens(chunk)
+        return tokens[0] if tokens and tokens[0] in claim_tokens else None
+
+    words = [(m.start(), m.end(), claim_hit(m.group())) for m in _CHUNK_RE.finditer(source_text)]
+    n = len(words)
+    hits: Counter[str] = Counter()  # claim tokens of words fully inside the window
+    lo = hi = 0  # words[lo:hi] lie fully inside [start, end)
+
     best_start = 0
     best_score = -1
+    max_score = len(claim_tokens)
     step = max(1, span_len // 4)
     for start in range(0, len(source_text) - span_len + 1, step):
-        window = source_text[start:start + span_len]
-        window_tokens = set(_extract_content_tokens(window))
-        score = len(claim_tokens & window_tokens)
+        end = start + span_len
+        while hi < n and words[hi][1] <= end:
+            if hi >= lo and words[hi][2]:
+                hits[words[hi][2]] += 1
+            hi += 1
+        while lo < n and words[lo][0] < start:
+            if lo < hi and words[lo][2]:
+                hits[words[lo][2]] -= 1
+                if not hits[words[lo][2]]:
+                    del hits[words[lo][2]]
+            lo += 1
+
+        score = len(hits)
+        edge_hits = set()
+        if lo > 0 and words[lo - 1][1] > start:
+            edge_hits.add(claim_hit(source_text[start:min(words[lo - 1][1], end)]))
+        if hi < n and start <= words[hi][0] < end:
+            edge_hits.add(claim_hit(source_text[words[hi][0]:end]))
+        score += len({t for t in edge_hits if t and t not in hits})
+
         if score > best_score:
             best_score = score
             best_start = start
+            if score == max_score:
+                break  # no later window can beat a full match
 
     return source_text[best_start:best_start + span_len].strip()
 
@@ -242,15 +436,16 @@ def validate_and_fix_excerpts(
         return []
 
     pack_size = len(evidence_pack)
-    valid_indices = [i for i in claim.citation_indices if 0 <= i < pack_size]
+    valid_indices = filter_valid_indices(claim.citation_indices, pack_size)
     if not valid_indices:
         return []
 
     cited_texts = [evidence_pack[i].excerpt for i in valid_indices]
-    cited_tokens_by_source = [set(_extract_content_tokens(t)) for t in cited_texts]
-    all_cited_tokens = set()
-    for ts in cited_tokens_by_source:
-        all_cited_tokens |= ts
+    all_cited_tokens: set[str] = set().union(*map(_extract_content_tokens, cited_texts))
+
+    # Every replacement is the same span (first cited source vs the claim),
+    # so it is computed at most once
+    replacement: str | None = None
 
     fixed = []
     for excerpt in claim.evidence_excerpts:
@@ -258,8 +453,9 @@ def validate_and_fix_excerpts(
 
         # Short excerpt: skip overlap scoring, auto-replace
         if len(excerpt_tokens) < 8:
-            best = _best_keyword_span(cited_texts[0], claim.text)
-            fixed.append(best)
+            if replacement is None:
+                replacement = _best_keyword_span(cited_texts[0], claim.text)
+            fixed.append(replacement)
             continue
 
         # Check content-token overlap
@@ -271,8 +467,9 @@ def validate_and_fix_excerpts(
             fixed.append(excerpt)
         else:
             # Auto-replace with best span from cited evidence
-            best = _best_keyword_span(cited_texts[0], claim.text)
-            fixed.append(best)
+            if replacement is None:
+                replacement = _best_keyword_span(cited_texts[0], claim.text)
+            fixed.append(replacement)
 
     return fixed
 
@@ -287,10 +484,11 @@ def auto_populate_excerpts(
     cited excerpts.
     """
     pack_size = len(evidence_pack)
-    valid_indices = [i for i in claim.citation_indices if 0 <= i < pack_size]
+    valid_indices = filter_valid_indices(claim.citation_indices, pack_size)
     if not valid_indices:
         return []
 
+    claim_tokens = set(_extract_content_tokens(claim.text))
     excerpts = []
     seen_urls: set[str] = set()
     for idx in valid_indices:
@@ -298,7 +496,9 @@ def auto_populate_excerpts(
         if citation.url in seen_urls:
             continue
         seen_urls.add(citation.url)
-        span = _best_keyword_span(citation.excerpt, claim.text, span_len=80)
+        span = _best_keyword_span(
+            citation.excerpt, claim.text, span_len=80, claim_tokens=claim_tokens,
+        )
         if span:
             excerpts.append(span)
         if len(excerpts) >= 2:
@@ -325,6 +525,12 @@ _ABSENCE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
      "not found in retrieved excerpts"),
 ]
 
+# All absence patterns in one scan; the gN group that matched names the pattern
+_ABSENCE_COMBINED = re.compile(
+    "|".join(f"(?P<g{i}>{p.pattern})" for i, (p, _) in enumerate(_ABSENCE_PATTERNS)),
+    re.IGNORECASE,
+)
+
 # Whitelist — already hedged phrasing, skip rewrite
 _ABSENCE_WHITELIST_PHRASES = [
     "not observed in",
@@ -339,6 +545,7 @@ def compute_display_rewrites(text: str) -> list[dict]:
     Returns a list of rewrite dicts. Each has:
     - original: the matched phrase
     - rewritten: the replacement phrase
+    - start, end: offsets of the matched phrase in text
     - rule: "absence_rewrite"
 
     The raw text is NEVER mutated — these are display overrides only.
@@ -349,17 +556,24 @@ def compute_display_rewrites(text: str) -> list[dict]:
     if any(phrase in lower for phrase in _ABSENCE_WHITELIST_PHRASES):
         return []
 
-    # Apply only the first matching pattern to avoid overlapping rewrites
-    for pattern, replacement in _ABSENCE_PATTERNS:
-        match = pattern.search(text)
-        if match:
-            return [{
-                "original": match.group(0),
-                "rewritten": replacement,
-                "rule": "absence_rewrite",
-            }]
-
-    return []
+    # Apply only the first matching pattern to avoid overlapping rewrites.
+    # The combined scan finds the leftmost match; a higher-priority pattern
+    # can then only match further right, so just those are re-checked there.
+    match = _ABSENCE_COMBINED.search(text)
+    if not match:
+        return []
+    idx = int(match.lastgroup[1:])
+    for i, (pattern, _) in enumerate(_ABSENCE_PATTERNS[:idx]):
+        if later := pattern.search(text, match.start() + 1):
+            match, idx = later, i
+            break
+    return [{
+        "original": match.group(0),
+        "rewritten": _ABSENCE_PATTERNS[idx][1],
+        "start": match.start(),
+        "end": match.end(),
+        "rule": "absence_rewrite",
+    }]
 
 
 def apply_display_rewrites(text: str, rewrites: list[dict]) -> str:
@@ -367,10 +581,27 @@ def apply_display_rewrites(text: str, rewrites: list[dict]) -> str:
 
     The original text should be stored unchanged. This produces the rendered version.
     """
-    result = text
-    for rw in rewrites:
-        result = result.replace(rw["original"], rw["rewritten"], 1)
-    return result
+    return _splice_rewrites(text, rewrites, "original", "rewritten")
+
+
+def _splice_rewrites(text: str, rewrites: list[dict], original_key: str, new_key: str) -> str:
+    """Replace each rewrite's [start, end) span of text with rw[new_key].
+
+    Rewrites without offsets (computed before they were recorded) fall back
+    to replacing the first occurrence of rw[original_key].
+    """
+    if not all("start" in rw for rw in rewrites):
+        for rw in rewrites:
+            text = text.replace(rw[original_key], rw[new_key], 1)
+        return text
+    parts: list[str] = []
+    end = len(text)
+    # Right to left, so earlier offsets stay valid
+    for rw in sorted(rewrites, key=lambda rw: rw["start"], reverse=True):
+        parts += (text[rw["end"]:end], rw[new_key])
+        end = rw["start"]
+    parts.append(text[:end])
+    return "".join(reversed(parts))
 
 
 # ---------------------------------------------------------------------------
@@ -400,6 +631,7 @@ def compute_frequency_downgrades(
     - original_word: the matched frequency word
     - replacement: the ladder phrase
     - unique_urls: how many unique URLs support this claim
+    - start, end: offsets of the matched word in claim.text
     - rule: "frequency_downgrade"
 
     The raw text is NEVER mutated — these are display overrides only.
@@ -410,7 +642,7 @@ def compute_frequency_downgrades(
 
     # Count unique URLs among citation_indices
     pack_size = len(evidence_pack)
-    valid_indices = [i for i in claim.citation_indices if 0 <= i < pack_size]
+    valid_indices = filter_valid_indices(claim.citation_indices, pack_size)
     unique_urls = len({evidence_pack[i].url for i in valid_indices})
 
     # Monotonic ladder
@@ -427,13 +659,12 @@ def compute_frequency_downgrades(
         "original_word": match.group(0),
         "replacement": replacement,
         "unique_urls": unique_urls,
+        "start": match.start(),
+        "end": match.end(),
         "rule": "frequency_downgrade",
     }]
 
 
 def apply_frequency_downgrades(text: str, downgrades: list[dict]) -> str:
     """Apply frequency downgrades to produce a display-only version."""
-    result = text
-    for dg in downgrades:
-        result = result.replace(dg["original_word"], dg["replacement"], 1)
-    return result
+    return _splice_rewrites(text, downgrades, "original_word", "replacement")
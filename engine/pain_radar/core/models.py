@@ -10,7 +10,7 @@ import re
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 # ---------------------------------------------------------------------------
@@ -64,6 +64,8 @@ class VerdictDecision(str, Enum):
 # ---------------------------------------------------------------------------
 
 class SourceSnapshot(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     url: str
     content_hash: str  # SHA256 of raw content
     raw_text: str  # extracted text (HTML stripped)
@@ -76,6 +78,9 @@ class SourceSnapshot(BaseModel):
 # ---------------------------------------------------------------------------
 
 class Citation(BaseModel):
+    # Citations are shared by index across every stage; never edited in place
+    model_config = ConfigDict(frozen=True)
+
     url: str
     excerpt: str
     source_type: SourceType
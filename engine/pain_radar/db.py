@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import sqlite3
+import zlib
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
 
 import aiosqlite
+from pydantic_core import to_json
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS jobs (
@@ -24,7 +31,7 @@ CREATE TABLE IF NOT EXISTS jobs (
 CREATE TABLE IF NOT EXISTS source_snapshots (
     content_hash TEXT PRIMARY KEY,
     url TEXT NOT NULL,
-    raw_text TEXT NOT NULL,
+    raw_text TEXT NOT NULL,  -- zlib-compressed UTF-8 BLOB (legacy rows: TEXT)
     fetched_at TEXT NOT NULL,
     storage_path TEXT NOT NULL
 );
@@ -48,14 +55,59 @@ CREATE TABLE IF NOT EXISTS reports (
 );
 
 CREATE INDEX IF NOT EXISTS idx_citations_job_id ON citations(job_id);
+-- Covers get_snapshots_for_job's snapshot_hash subquery without table reads
+CREATE INDEX IF NOT EXISTS idx_citations_job_snapshot ON citations(job_id, snapshot_hash);
 CREATE INDEX IF NOT EXISTS idx_snapshots_url ON source_snapshots(url);
 """
 
+# Shared by the single-row and bulk writers so both hit the same entry in
+# sqlite3's per-connection prepared-statement cache (keyed on SQL text)
+_INSERT_SNAPSHOT_SQL = (
+    "INSERT OR IGNORE INTO source_snapshots "
+    "(content_hash, url, raw_text, fetched_at, storage_path) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_CITATION_SQL = (
+    "INSERT INTO citations "
+    "(job_id, url, excerpt, source_type, date_published, date_retrieved, "
+    "recency_months, snapshot_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"))
+
+
+def _decompress_text(value: bytes | str) -> str:
+    # Snapshots stored before compression was added are plain TEXT
+    if isinstance(value, str):
+        return value
+    return zlib.decompress(value).decode("utf-8")
+
+_CITATION_PAGE_SIZE = 500  # rows per iter_citations read
+
+# The Database whose transaction() block the current task is running in
+_active_transaction: ContextVar[Database | None] = ContextVar(
+    "_active_transaction", default=None
+)
+
 
 class Database:
-    def __init__(self, db_path: Path) -> None:
+    """One writer connection plus a pool of read-only connections.
+
+    In WAL mode readers never block on (or behind) the writer, so reads go
+    through their own connections, each with its own aiosqlite thread.
+    """
+
+    def __init__(self, db_path: Path, readers: int = 4) -> None:
         self._db_path = db_path
         self._db: aiosqlite.Connection | None = None
+        # Held by a transaction() block for its whole duration, and by each
+        # standalone write, so concurrent jobs never share a transaction
+        self._write_lock = asyncio.Lock()
+        self._reader_count = readers
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._lookup_conn: sqlite3.Connection | None = None
 
     async def connect(self) -> None:
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -63,10 +115,38 @@ class Database:
         self._db.row_factory = aiosqlite.Row
         await self._db.executescript(SCHEMA_SQL)
         await self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL stays consistent on crash, minus an fsync per commit
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+        await self._db.execute("PRAGMA temp_store=MEMORY")
+        await self._db.execute("PRAGMA cache_size=-64000")  # KiB, i.e. ~64 MB
+        await self._db.execute("PRAGMA mmap_size=268435456")
+        await self._db.execute("PRAGMA wal_autocheckpoint=1000")
         await self._db.execute("PRAGMA foreign_keys=ON")
         await self._db.commit()
 
+        reader_uri = f"{self._db_path.resolve().as_uri()}?mode=ro"
+        for _ in range(self._reader_count):
+            reader = await aiosqlite.connect(reader_uri, uri=True)
+            reader.row_factory = aiosqlite.Row
+            await reader.execute("PRAGMA temp_store=MEMORY")
+            await reader.execute("PRAGMA cache_size=-16000")
+            await reader.execute("PRAGMA mmap_size=268435456")
+            self._readers.put_nowait(reader)
+        if self._reader_count:
+            # Plain sqlite3 for primary-key lookups; see _lookup(). It runs on
+            # the event loop, so it must never wait on a lock
+            self._lookup_conn = sqlite3.connect(
+                reader_uri, uri=True, check_same_thread=False, timeout=0
+            )
+            self._lookup_conn.row_factory = sqlite3.Row
+            self._lookup_conn.execute("PRAGMA mmap_size=268435456")
+
     async def close(self) -> None:
+        if self._lookup_conn is not None:
+            self._lookup_conn.close()
+            self._lookup_conn = None
+        while not self._readers.empty():
+            await self._readers.get_nowait().close()
         if self._db:
             await self._db.close()
 
@@ -75,62 +155,139 @@ class Database:
         assert self._db is not None, "Database not connected"
         return self._db
 
+    @property
+    def _in_transaction(self) -> bool:
+        """Whether the current task is inside one of this database's transactions."""
+        return _active_transaction.get() is self
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes into one transaction (one commit/fsync).
+
+        Write methods called inside the block skip their own commit; the block
+        commits on success and rolls back on error. Nested blocks join the
+        outer transaction. Writes from other tasks wait until it ends.
+        """
+        if self._in_transaction:
+            yield
+            return
+        async with self._write_lock:
+            await self.db.execute("BEGIN IMMEDIATE")
+            token = _active_transaction.set(self)
+            try:
+                yield
+            except BaseException:
+                await self.db.rollback()
+                raise
+            else:
+                await self.db.commit()
+            finally:
+                _active_transaction.reset(token)
+
+    @asynccontextmanager
+    async def _writing(self) -> AsyncIterator[None]:
+        """Run a standalone write and commit it, or join the current transaction."""
+        if self._in_transaction:
+            yield
+            return
+        async with self._write_lock:
+            try:
+                yield
+            except BaseException:
+                await self.db.rollback()
+                raise
+            await self.db.commit()
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection (the writer, if there is no pool).
+
+        Inside a transaction reads use the writer so they see its
+        uncommitted writes.
+        """
+        if not self._reader_count or self._in_transaction:
+            yield self.db
+            return
+        reader = await self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put_nowait(reader)
+
+    async def _lookup(self, sql: str, params: tuple) -> dict | None:
+        """Fetch one row by primary key.
+
+        An indexed single-row read takes microseconds, less than handing it
+        to an aiosqlite thread and back, so it runs inline on a read-only
+        sqlite3 connection (WAL readers don't wait on the writer). If that
+        connection finds the database busy (e.g. WAL recovery or a
+        checkpoint), the lookup is retried on a pooled reader instead of
+        blocking the loop.
+        """
+        if self._lookup_conn is not None and not self._in_transaction:
+            try:
+                row = self._lookup_conn.execute(sql, params).fetchone()
+            except sqlite3.OperationalError:
+                pass  # SQLITE_BUSY: fall through to a pooled reader
+            else:
+                return dict(row) if row is not None else None
+        async with self._reader() as conn:
+            cursor = await conn.execute(sql, params)
+            row = await cursor.fetchone()
+        return dict(row) if row is not None else None
+
     # -- Jobs --
 
     async def create_job(
         self, job_id: str, idea_text: str, options: dict | None = None
     ) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        await self.db.execute(
-            "INSERT INTO jobs (id, idea_text, options_json, status, created_at, updated_at) "
-            "VALUES (?, ?, ?, 'created', ?, ?)",
-            (job_id, idea_text, json.dumps(options) if options else None, now, now),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "INSERT INTO jobs (id, idea_text, options_json, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, 'created', ?, ?)",
+                (job_id, idea_text, json.dumps(options) if options else None, now, now),
+            )
 
     async def update_job_status(self, job_id: str, status: str) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        await self.db.execute(
-            "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?",
-            (status, now, job_id),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?",
+                (status, now, job_id),
+            )
 
     async def update_job_progress(self, job_id: str, progress: dict) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        await self.db.execute(
-            "UPDATE jobs SET progress_json = ?, updated_at = ? WHERE id = ?",
-            (json.dumps(progress), now, job_id),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "UPDATE jobs SET progress_json = ?, updated_at = ? WHERE id = ?",
+                (to_json(progress).decode(), now, job_id),
+            )
 
     async def set_clarification_questions(
         self, job_id: str, questions: list[dict]
     ) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        await self.db.execute(
-            "UPDATE jobs SET clarification_questions_json = ?, status = 'clarifying', "
-            "updated_at = ? WHERE id = ?",
-            (json.dumps(questions), now, job_id),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "UPDATE jobs SET clarification_questions_json = ?, status = 'clarifying', "
+                "updated_at = ? WHERE id = ?",
+                (json.dumps(questions), now, job_id),
+            )
 
     async def set_clarification_answers(
         self, job_id: str, answers: list[dict]
     ) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        await self.db.execute(
-            "UPDATE jobs SET clarification_answers_json = ?, updated_at = ? WHERE id = ?",
-            (json.dumps(answers), now, job_id),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "UPDATE jobs SET clarification_answers_json = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(answers), now, job_id),
+            )
 
     async def get_job(self, job_id: str) -> dict | None:
-        cursor = await self.db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-        row = await cursor.fetchone()
-        if row is None:
-            return None
-        return dict(row)
+        return await self._lookup("SELECT * FROM jobs WHERE id = ?", (job_id,))
 
     # -- Source Snapshots --
 
@@ -142,31 +299,49 @@ class Database:
         fetched_at: str,
         storage_path: str,
     ) -> None:
-        await self.db.execute(
-            "INSERT OR IGNORE INTO source_snapshots "
-            "(content_hash, url, raw_text, fetched_at, storage_path) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (content_hash, url, raw_text, fetched_at, storage_path),
+        async with self._writing():
+            await self.db.execute(
+                _INSERT_SNAPSHOT_SQL,
+                (content_hash, url, _compress_text(raw_text), fetched_at, storage_path),
+            )
+
+    async def store_snapshots_bulk(
+        self, rows: Iterable[tuple[str, str, str, str, str]]
+    ) -> None:
+        """Store (content_hash, url, raw_text, fetched_at, storage_path) rows at once."""
+        # A generator, so aiosqlite's worker thread does the compression
+        compressed = (
+            (content_hash, url, _compress_text(raw_text), fetched_at, storage_path)
+            for content_hash, url, raw_text, fetched_at, storage_path in rows
         )
-        await self.db.commit()
+        async with self.transaction():
+            await self.db.executemany(_INSERT_SNAPSHOT_SQL, compressed)
 
     async def get_snapshot(self, content_hash: str) -> dict | None:
-        cursor = await self.db.execute(
-            "SELECT * FROM source_snapshots WHERE content_hash = ?", (content_hash,)
-        )
-        row = await cursor.fetchone()
-        return dict(row) if row else None
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                "SELECT * FROM source_snapshots WHERE content_hash = ?", (content_hash,)
+            )
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        snapshot = dict(row)
+        snapshot["raw_text"] = _decompress_text(snapshot["raw_text"])
+        return snapshot
 
     async def get_snapshots_for_job(self, job_id: str) -> list[dict]:
         """Get all snapshots referenced by citations for a job."""
-        cursor = await self.db.execute(
-            "SELECT DISTINCT s.content_hash, s.raw_text FROM source_snapshots s "
-            "INNER JOIN citations c ON c.snapshot_hash = s.content_hash "
-            "WHERE c.job_id = ?",
-            (job_id,),
-        )
-        rows = await cursor.fetchall()
-        return [dict(r) for r in rows]
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                "SELECT content_hash, raw_text FROM source_snapshots WHERE content_hash IN "
+                "(SELECT snapshot_hash FROM citations WHERE job_id = ?)",
+                (job_id,),
+            )
+            rows = await cursor.fetchall()
+        return [
+            {"content_hash": r["content_hash"], "raw_text": _decompress_text(r["raw_text"])}
+            for r in rows
+        ]
 
     # -- Citations --
 
@@ -181,39 +356,71 @@ class Database:
         recency_months: int | None,
         snapshot_hash: str,
     ) -> int:
-        cursor = await self.db.execute(
-            "INSERT INTO citations "
-            "(job_id, url, excerpt, source_type, date_published, date_retrieved, "
-            "recency_months, snapshot_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                job_id, url, excerpt, source_type, date_published,
-                date_retrieved, recency_months, snapshot_hash,
-            ),
-        )
-        await self.db.commit()
+        async with self._writing():
+            cursor = await self.db.execute(
+                _INSERT_CITATION_SQL,
+                (
+                    job_id, url, excerpt, source_type, date_published,
+                    date_retrieved, recency_months, snapshot_hash,
+                ),
+            )
         return cursor.lastrowid  # type: ignore[return-value]
 
+    async def store_citations_bulk(
+        self,
+        job_id: str,
+        rows: Iterable[tuple[str, str, str, str | None, str, int | None, str]],
+    ) -> None:
+        """Store a job's citations at once.
+
+        Rows are (url, excerpt, source_type, date_published, date_retrieved,
+        recency_months, snapshot_hash).
+        """
+        async with self.transaction():
+            await self.db.executemany(
+                _INSERT_CITATION_SQL,
+                ((job_id, *row) for row in rows),
+            )
+
     async def get_citations(self, job_id: str) -> list[dict]:
-        cursor = await self.db.execute(
-            "SELECT * FROM citations WHERE job_id = ? ORDER BY id", (job_id,)
-        )
-        rows = await cursor.fetchall()
+        async with self._reader() as conn:
+            cursor = await conn.execute(
+                "SELECT * FROM citations WHERE job_id = ? ORDER BY id", (job_id,)
+            )
+            rows = await cursor.fetchall()
         return [dict(r) for r in rows]
 
+    async def iter_citations(self, job_id: str) -> AsyncIterator[dict]:
+        """Yield a job's citations page by page, for streaming exports.
+
+        A reader is borrowed per page and returned before the page is
+        yielded, so a slow or stalled download never holds a pooled
+        connection.
+        """
+        last_id = 0
+        while True:
+            async with self._reader() as conn:
+                cursor = await conn.execute(
+                    "SELECT * FROM citations WHERE job_id = ? AND id > ? ORDER BY id LIMIT ?",
+                    (job_id, last_id, _CITATION_PAGE_SIZE),
+                )
+                rows = await cursor.fetchall()
+            for row in rows:
+                yield dict(row)
+            if len(rows) < _CITATION_PAGE_SIZE:
+                return
+            last_id = rows[-1]["id"]
+
     # -- Reports --
 
     async def store_report(self, job_id: str, report_json: str) -> None:
         now = datetime.now(timezone.utc).isoformat()
-        await self.db.execute(
-            "INSERT OR REPLACE INTO reports (job_id, report_json, created_at) "
-            "VALUES (?, ?, ?)",
-            (job_id, report_json, now),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "INSERT OR REPLACE INTO reports (job_id, report_json, created_at) "
+                "VALUES (?, ?, ?)",
+                (job_id, report_json, now),
+            )
 
     async def get_report(self, job_id: str) -> dict | None:
-        cursor = await self.db.execute(
-            "SELECT * FROM reports WHERE job_id = ?", (job_id,)
-        )
-        row = await cursor.fetchone()
-        return dict(row) if row else None
+        return await self._lookup("SELECT * FROM reports WHERE job_id = ?", (job_id,))
@@ -2,12 +2,134 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import random
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
+from pydantic_core import from_json
+
 if TYPE_CHECKING:
     from pain_radar.core.config import Settings
+    from pain_radar.llm.batch import BatchRequest
+
+# Full-jitter exponential backoff for retried LLM calls (seconds)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+_backoff_rng = random.Random()
+
+# Provider HTTP statuses that a retry of the same request cannot fix
+_NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404, 422})
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """False for provider errors that will fail identically on retry.
+
+    Anthropic and OpenAI SDK status errors both carry status_code; auth,
+    permission, not-found and bad-request failures are permanent, while
+    429/5xx, timeouts and malformed output are worth another attempt.
+    """
+    return getattr(exc, "status_code", None) not in _NON_RETRYABLE_STATUS
+
+
+async def retry_backoff(attempt: int, exc: BaseException) -> None:
+    """Sleep before retrying an LLM call that raised exc on attempt (0-based).
+
+    Malformed output (ValueError, incl. JSON decode and pydantic validation
+    errors) retries immediately: the corrective reminder appended to the
+    prompt is what fixes it. Anything else (rate limits, timeouts, 5xx) waits
+    uniform(0, min(cap, base * 2**attempt)) so parallel workers don't retry
+    in lockstep.
+    """
+    if isinstance(exc, ValueError):
+        return
+    delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt)
+    await asyncio.sleep(_backoff_rng.uniform(0, delay))
+
+
+def _strip_code_fences(raw: str) -> str:
+    """Strip markdown code fences wrapped around a JSON response."""
+    text = raw.strip()
+    if text.startswith("```"):
+        # Remove first line (```json or ```) and last line (```) by slicing,
+        # without splitting a multi-KB response into lines
+        newline = text.find("\n")
+        text = text[newline + 1:] if newline != -1 else ""
+        last_newline = text.rfind("\n")
+        if text[last_newline + 1:].strip() == "```":
+            text = text[:max(last_newline, 0)]
+    return text
+
+
+def parse_json_response(raw: str) -> Any:
+    """Parse a model's JSON response, tolerating markdown code fences.
+
+    Uses pydantic's Rust JSON parser, which is several times faster than the
+    stdlib on large responses. Raises ValueError on invalid JSON.
+    """
+    return from_json(_strip_code_fences(raw))
+
+
+def _strip_leading_fence(buf: str) -> str | None:
+    """Drop an opening code fence line; None while the fence is still arriving."""
+    text = buf.lstrip()
+    if text.startswith("```"):
+        newline = text.find("\n")
+        if newline == -1:
+            return None
+        return text[newline + 1:]
+    if "```".startswith(text):
+        return None
+    return text
+
+
+async def iter_json_stream(chunks: AsyncIterator[str]) -> AsyncIterator[Any]:
+    """Incrementally parse streamed model text; see LLMProvider.stream_json."""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    is_array: bool | None = None  # unknown until the first JSON character
+    closed = False
+
+    async for chunk in chunks:
+        buf += chunk
+        if is_array is None:
+            body = _strip_leading_fence(buf)
+            if body is None or not body.lstrip():
+                continue
+            body = body.lstrip()
+            if body[0] not in "[{":
+                # Stop paying for a response that can never parse
+                raise ValueError(f"Streamed response does not start with JSON: {body[:40]!r}")
+            is_array = body[0] == "["
+            pos = len(buf) - len(body) + 1
+        if not is_array or closed:
+            continue
+
+        while True:
+            # Skip separators between array elements
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":
+                closed = True
+                break
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # element still arriving
+            if end == len(buf) and buf[pos] not in "{[\"":
+                break  # a bare number/literal may continue in the next chunk
+            yield item
+            pos = end
+
+    if not is_array:
+        yield parse_json_response(buf)
+    elif not closed:
+        raise ValueError("Streamed JSON array ended before its closing bracket")
 
 
 class LLMProvider(ABC):
@@ -24,6 +146,49 @@ class LLMProvider(ABC):
         """Return text completion from the model."""
         ...
 
+    async def stream(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[str]:
+        """Yield the completion as text chunks.
+
+        Providers with a streaming endpoint override this; the default yields
+        the whole completion as a single chunk.
+        """
+        yield await self.complete(system, messages, temperature, max_tokens)
+
+    async def submit_batch(self, requests: list[BatchRequest]) -> str:
+        """Submit requests as one provider batch job; return the batch id."""
+        raise NotImplementedError(f"{type(self).__name__} does not support batch mode")
+
+    async def fetch_batch(self, batch_id: str) -> dict[str, str] | None:
+        """Return {custom_id: text} once the batch has ended, else None.
+
+        Requests that errored inside the batch are omitted from the mapping.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch mode")
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether this provider implements submit_batch and fetch_batch."""
+        cls = type(self)
+        return (
+            cls.submit_batch is not LLMProvider.submit_batch
+            and cls.fetch_batch is not LLMProvider.fetch_batch
+        )
+
+    def count_tokens(self, text: str) -> int:
+        """Approximate the prompt tokens *text* will cost.
+
+        BPE vocabularies average about 4 UTF-8 bytes per token on English and
+        JSON; counting bytes rather than characters keeps the estimate
+        conservative for non-Latin scripts.
+        """
+        return len(text.encode("utf-8")) // 4 + 1
+
     async def complete_json(
         self,
         system: str,
@@ -36,32 +201,62 @@ class LLMProvider(ABC):
         The system prompt should instruct the model to output valid JSON.
         """
         raw = await self.complete(system, messages, temperature, max_tokens)
-        # Strip markdown code fences if present
-        text = raw.strip()
-        if text.startswith("```"):
-            # Remove first line (```json or ```) and last line (```)
-            lines = text.split("\n")
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
-        return json.loads(text)
+        return parse_json_response(raw)
+
+    async def stream_json(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 8192,
+    ) -> AsyncIterator[Any]:
+        """Yield parsed JSON from the model while it is still generating.
+
+        A top-level array is yielded item by item as each element completes;
+        an object is yielded once when the stream ends. Raises ValueError if
+        the response is not valid JSON or the array is cut off, and as soon as
+        the first character shows it is not an array or object.
+        """
+        async for item in iter_json_stream(
+            self.stream(system, messages, temperature, max_tokens)
+        ):
+            yield item
 
 
 def create_provider(settings: Settings) -> LLMProvider:
     """Factory: create LLM provider from settings."""
+    provider: LLMProvider
     if settings.llm_provider == "claude":
         from pain_radar.llm.claude import ClaudeProvider
-        return ClaudeProvider(
+        provider = ClaudeProvider(
             api_key=settings.anthropic_api_key,
             model=settings.llm_model,
         )
     elif settings.llm_provider == "openai":
         from pain_radar.llm.openai_provider import OpenAIProvider
-        return OpenAIProvider(
+        provider = OpenAIProvider(
             api_key=settings.openai_api_key,
             model=settings.llm_model,
         )
     else:
         raise ValueError(f"Unknown LLM provider: {settings.llm_provider}")
+
+    if settings.llm_mode == "batch":
+        if not provider.supports_batch:
+            raise ValueError(f"LLM provider {settings.llm_provider} does not support batch mode")
+        from pain_radar.llm.batch import BatchProvider
+        provider = BatchProvider(provider, poll_seconds=settings.llm_batch_poll_seconds)
+    elif settings.llm_mode != "online":
+        raise ValueError(f"Unknown LLM mode: {settings.llm_mode}")
+    elif settings.llm_max_concurrency > 0:
+        from pain_radar.llm.limit import ConcurrencyLimitedProvider, get_request_semaphore
+        provider = ConcurrencyLimitedProvider(
+            provider, get_request_semaphore(settings.llm_max_concurrency)
+        )
+
+    if settings.llm_cache_size > 0:
+        from pain_radar.llm.cache import CachedProvider, get_response_cache
+        provider = CachedProvider(
+            provider, settings.llm_model, get_response_cache(settings.llm_cache_size)
+        )
+    return provider
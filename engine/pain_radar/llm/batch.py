@@ -0,0 +1,93 @@
+"""Batch-mode LLM provider — trades latency for provider Batch API pricing.
+
+Concurrent completions issued within a short window (e.g. clustering chunks
+alongside competitor extraction, or per-cluster scoring) are coalesced into a
+single provider batch job. Each caller awaits a future keyed on its
+custom_id; one poller per batch resolves them when the job ends. Stage code
+is unchanged: it still calls complete()/complete_json() and parses results
+with the same helpers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+
+from pain_radar.llm.base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    system: str
+    messages: list[dict[str, str]]
+    temperature: float
+    max_tokens: int
+
+
+class BatchProvider(LLMProvider):
+    """Wraps a provider and routes completions through its Batch API."""
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        window_seconds: float = 2.0,
+        poll_seconds: float = 30.0,
+    ) -> None:
+        self._inner = inner
+        self._window_seconds = window_seconds
+        self._poll_seconds = poll_seconds
+        self._pending: list[tuple[BatchRequest, asyncio.Future[str]]] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def complete(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> str:
+        request = BatchRequest(
+            custom_id=uuid.uuid4().hex,
+            system=system,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Submit everything queued during the window as one batch and poll it."""
+        await asyncio.sleep(self._window_seconds)
+        pending, self._pending = self._pending, []
+        self._flush_task = None
+
+        try:
+            batch_id = await self._inner.submit_batch([req for req, _ in pending])
+            logger.info(f"Submitted LLM batch {batch_id} ({len(pending)} requests)")
+            while (results := await self._inner.fetch_batch(batch_id)) is None:
+                await asyncio.sleep(self._poll_seconds)
+        except Exception as exc:
+            logger.exception("LLM batch failed")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for req, future in pending:
+            if future.done():
+                continue  # caller gave up (cancelled)
+            if req.custom_id in results:
+                future.set_result(results[req.custom_id])
+            else:
+                future.set_exception(
+                    RuntimeError(f"Batch {batch_id} has no result for {req.custom_id}")
+                )
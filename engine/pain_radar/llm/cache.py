@@ -0,0 +1,297 @@
+"""Exact-match LLM response cache.
+
+Re-running the same idea over the same evidence pack rebuilds byte-identical
+prompts for every stage; serving those from a cache turns multi-second model
+calls into dict lookups. Only deterministic (temperature 0) JSON calls are
+cached, and only responses that parsed as JSON are stored. Identical calls
+that are in flight at the same time (e.g. two runs over the same evidence)
+share a single model call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import re
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Hashable
+from functools import lru_cache
+from typing import Any, Protocol
+
+from pain_radar.llm.base import LLMProvider, iter_json_stream, parse_json_response
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Cache key -> raw response of the identical call currently in flight
+_inflight: dict[str, asyncio.Future[str]] = {}
+
+
+class _FlightAbandoned(Exception):
+    """The coalesced call's owner was cancelled; a waiter should issue it."""
+
+
+class CacheBackend(Protocol):
+    """Storage for raw response text keyed by request hash."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+
+class MemoryCache:
+    """In-process LRU cache."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class SemanticCache:
+    """Near-duplicate lookup for short prompts (e.g. idea text).
+
+    Texts are embedded as character-trigram count vectors, which tolerate
+    articles, plurals and typos ("CRM for dentists" / "CRM for a dentist"),
+    and matched by cosine similarity against every stored entry. A linear
+    scan is fine at a few hundred entries; LRU eviction bounds it.
+
+    Entries are partitioned by scope: a lookup only considers entries stored
+    under an equal scope, so inputs that must match exactly stay out of the
+    fuzzy comparison.
+    """
+
+    def __init__(self, max_entries: int = 256, threshold: float = 0.92) -> None:
+        self._max_entries = max_entries
+        self._threshold = threshold
+        self._entries: OrderedDict[
+            tuple[Hashable, str], tuple[dict[str, float], Any]
+        ] = OrderedDict()
+
+    @staticmethod
+    def _embed(text: str) -> dict[str, float]:
+        normalized = f" {_WHITESPACE_RE.sub(' ', text.lower()).strip()} "
+        counts = Counter(normalized[i:i + 3] for i in range(len(normalized) - 2))
+        norm = math.sqrt(sum(c * c for c in counts.values())) or 1.0
+        return {gram: c / norm for gram, c in counts.items()}
+
+    def get(self, text: str, scope: Hashable = None) -> Any | None:
+        query = self._embed(text)
+        best_key, best_score = None, 0.0
+        for key, (vector, _) in self._entries.items():
+            if key[0] != scope:
+                continue
+            small, large = (query, vector) if len(query) <= len(vector) else (vector, query)
+            score = sum(w * large.get(gram, 0.0) for gram, w in small.items())
+            if score > best_score:
+                best_key, best_score = key, score
+        if best_key is None or best_score < self._threshold:
+            return None
+        self._entries.move_to_end(best_key)
+        logger.debug(f"Semantic cache hit (cosine {best_score:.3f})")
+        return self._entries[best_key][1]
+
+    def set(self, text: str, value: Any, scope: Hashable = None) -> None:
+        key = (scope, text)
+        self._entries[key] = (self._embed(text), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache
+def get_response_cache(max_entries: int) -> MemoryCache:
+    """Process-wide cache shared by the per-run providers."""
+    return MemoryCache(max_entries)
+
+
+@lru_cache
+def get_brief_cache(max_entries: int) -> SemanticCache:
+    """Process-wide idea brief cache shared by the research runs."""
+    return SemanticCache(max_entries)
+
+
+def cache_key(
+    model: str, system: str, messages: list[dict[str, str]], max_tokens: int
+) -> str:
+    payload = json.dumps(
+        {"model": model, "system": system, "messages": messages, "max_tokens": max_tokens},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachedProvider(LLMProvider):
+    """Wraps a provider with an exact-match cache for JSON completions.
+
+    A key already served by this provider is treated as a retry (stages
+    retry some prompts verbatim) and bypasses the cache, so a response that
+    failed downstream validation is never replayed within the same run.
+
+    On a miss, a call whose key is already in flight (from any provider in
+    the process) awaits that call's response instead of issuing its own.
+    """
+
+    def __init__(self, inner: LLMProvider, model: str, cache: CacheBackend) -> None:
+        self._inner = inner
+        self._model = model
+        self._cache = cache
+        self._served: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(
+        self, system: str, messages: list[dict[str, str]], temperature: float, max_tokens: int
+    ) -> tuple[str | None, str | None, bool]:
+        """Return (key, cached_text, shared).
+
+        key is None when the call is uncacheable; shared says whether the
+        call may use the cache and join an identical in-flight call, which
+        retries (keys this provider already served) may not.
+        """
+        if temperature > 0:
+            return None, None, False
+        key = cache_key(self._model, system, messages, max_tokens)
+        shared = key not in self._served
+        cached = self._cache.get(key) if shared else None
+        self._served.add(key)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.debug(f"LLM cache hit ({self.hits} hits / {self.misses} misses)")
+        return key, cached, shared
+
+    @staticmethod
+    def _begin_flight(key: str) -> asyncio.Future[str]:
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        # Waiters may all be gone by the time it fails; don't warn about that
+        future.add_done_callback(lambda f: f.exception())
+        _inflight[key] = future
+        return future
+
+    @staticmethod
+    def _end_flight(key: str, future: asyncio.Future[str], exc: BaseException | None) -> None:
+        _inflight.pop(key, None)
+        if future.done():
+            return
+        if exc is None:
+            future.set_exception(RuntimeError("Coalesced LLM call produced no response"))
+        elif isinstance(exc, Exception):
+            future.set_exception(exc)
+        else:
+            # Owner was cancelled/closed; waiters are not, so one of them
+            # takes the call over and the rest join it
+            future.set_exception(_FlightAbandoned())
+
+    async def complete(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> str:
+        return await self._inner.complete(system, messages, temperature, max_tokens)
+
+    async def stream(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[str]:
+        async for chunk in self._inner.stream(system, messages, temperature, max_tokens):
+            yield chunk
+
+    async def complete_json(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 8192,
+    ) -> Any:
+        key, cached, shared = self._lookup(system, messages, temperature, max_tokens)
+        if cached is not None:
+            return parse_json_response(cached)
+        while shared and key in _inflight:
+            try:
+                return parse_json_response(await asyncio.shield(_inflight[key]))
+            except _FlightAbandoned:
+                continue
+
+        if not shared:
+            raw = await self._inner.complete(system, messages, temperature, max_tokens)
+        else:
+            future = self._begin_flight(key)
+            try:
+                raw = await self._inner.complete(system, messages, temperature, max_tokens)
+            except BaseException as exc:
+                self._end_flight(key, future, exc)
+                raise
+            future.set_result(raw)
+            self._end_flight(key, future, None)
+        parsed = parse_json_response(raw)  # raises before caching bad output
+        if key is not None:
+            self._cache.set(key, raw)
+        return parsed
+
+    async def stream_json(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 8192,
+    ) -> AsyncIterator[Any]:
+        key, cached, shared = self._lookup(system, messages, temperature, max_tokens)
+        while cached is None and shared and key in _inflight:
+            try:
+                cached = await asyncio.shield(_inflight[key])
+            except _FlightAbandoned:
+                continue
+        if cached is not None:
+            parsed = parse_json_response(cached)
+            for item in parsed if isinstance(parsed, list) else [parsed]:
+                yield item
+            return
+
+        chunks: list[str] = []
+
+        async def tee() -> AsyncIterator[str]:
+            async for chunk in self._inner.stream(system, messages, temperature, max_tokens):
+                chunks.append(chunk)
+                yield chunk
+
+        if not shared:
+            async for item in iter_json_stream(tee()):
+                yield item
+            if key is not None:
+                self._cache.set(key, "".join(chunks))
+            return
+
+        future = self._begin_flight(key)
+        try:
+            async for item in iter_json_stream(tee()):
+                yield item
+        except BaseException as exc:
+            self._end_flight(key, future, exc)
+            raise
+        # Only reached when the whole response parsed
+        raw = "".join(chunks)
+        future.set_result(raw)
+        self._end_flight(key, future, None)
+        self._cache.set(key, raw)
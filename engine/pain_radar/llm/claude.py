@@ -2,16 +2,46 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
 import anthropic
 
 from pain_radar.llm.base import LLMProvider
+from pain_radar.llm.client import shared_client
+
+if TYPE_CHECKING:
+    from pain_radar.llm.batch import BatchRequest
+
+
+def _with_cache_breakpoint(messages: list[dict[str, str]]) -> list[dict]:
+    """Mark everything before the final message as a prompt-cache prefix.
+
+    Stages send shared context (the evidence pack) ahead of the stage prompt;
+    an ephemeral breakpoint there lets retries and repeated calls reuse it.
+    """
+    if len(messages) < 2:
+        return messages
+    *prefix, last = messages
+    anchor = prefix[-1]
+    cached = {
+        **anchor,
+        "content": [{
+            "type": "text",
+            "text": anchor["content"],
+            "cache_control": {"type": "ephemeral"},
+        }],
+    }
+    return [*prefix[:-1], cached, last]
 
 
 class ClaudeProvider(LLMProvider):
     def __init__(self, api_key: str, model: str) -> None:
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY is required for Claude provider")
-        self._client = anthropic.AsyncAnthropic(api_key=api_key)
+        self._client = shared_client(
+            "anthropic", api_key, lambda: anthropic.AsyncAnthropic(api_key=api_key)
+        )
         self._model = model
 
     async def complete(
@@ -26,6 +56,51 @@ class ClaudeProvider(LLMProvider):
             max_tokens=max_tokens,
             temperature=temperature,
             system=system,
-            messages=messages,
+            messages=_with_cache_breakpoint(messages),
         )
         return response.content[0].text
+
+    async def stream(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[str]:
+        async with self._client.messages.stream(
+            model=self._model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=_with_cache_breakpoint(messages),
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+    async def submit_batch(self, requests: list[BatchRequest]) -> str:
+        batch = await self._client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": req.custom_id,
+                    "params": {
+                        "model": self._model,
+                        "max_tokens": req.max_tokens,
+                        "temperature": req.temperature,
+                        "system": req.system,
+                        "messages": _with_cache_breakpoint(req.messages),
+                    },
+                }
+                for req in requests
+            ],
+        )
+        return batch.id
+
+    async def fetch_batch(self, batch_id: str) -> dict[str, str] | None:
+        batch = await self._client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+        results: dict[str, str] = {}
+        async for entry in await self._client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+        return results
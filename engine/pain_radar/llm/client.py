@@ -0,0 +1,37 @@
+"""Process-wide provider SDK clients.
+
+Providers are created per research run. Constructing a fresh SDK client
+each time gives every run its own connection pool (never closed), so each
+run pays new TLS handshakes to the same API. Sharing one client per
+(provider, API key) keeps pooled connections warm across runs and retries.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_clients: dict[tuple[str, str], Any] = {}
+
+
+def shared_client[T](kind: str, api_key: str, factory: Callable[[], T]) -> T:
+    """Return the shared client for (kind, api_key), building it on first use."""
+    key = (kind, api_key)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = factory()
+    return client
+
+
+async def close_clients() -> None:
+    """Close every shared client (on app shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception:
+            logger.exception("Failed to close LLM client")
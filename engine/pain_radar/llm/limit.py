@@ -0,0 +1,62 @@
+"""Process-wide cap on concurrent LLM requests.
+
+Stages fan out (chunked clustering alongside competitor extraction, batched
+and per-cluster scoring) and several research runs can be active at once.
+Unbounded, that burst trips provider rate limits and turns into 429 retries;
+a shared semaphore keeps in-flight requests at the configured ceiling and
+queues the rest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator
+
+from pain_radar.llm.base import LLMProvider
+
+# A semaphore binds to the first loop that waits on it, so each loop gets its own
+_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[int, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def get_request_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+    """Semaphore shared by the per-run providers on the running event loop."""
+    per_loop = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_loop.get(max_concurrency)
+    if semaphore is None:
+        semaphore = per_loop[max_concurrency] = asyncio.Semaphore(max_concurrency)
+    return semaphore
+
+
+class ConcurrencyLimitedProvider(LLMProvider):
+    """Wraps a provider so each request holds a semaphore slot while in flight.
+
+    A streamed request holds its slot until the stream ends.
+    """
+
+    def __init__(self, inner: LLMProvider, semaphore: asyncio.Semaphore) -> None:
+        self._inner = inner
+        self._semaphore = semaphore
+
+    async def complete(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> str:
+        async with self._semaphore:
+            return await self._inner.complete(system, messages, temperature, max_tokens)
+
+    async def stream(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[str]:
+        async with self._semaphore:
+            async for chunk in self._inner.stream(system, messages, temperature, max_tokens):
+                yield chunk
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
 import openai
 
 from pain_radar.llm.base import LLMProvider
+from pain_radar.llm.client import shared_client
+
+if TYPE_CHECKING:
+    from pain_radar.llm.batch import BatchRequest
+
+_BATCH_TERMINAL_FAILURES = {"failed", "expired", "cancelled"}
 
 
 class OpenAIProvider(LLMProvider):
     def __init__(self, api_key: str, model: str) -> None:
         if not api_key:
             raise ValueError("OPENAI_API_KEY is required for OpenAI provider")
-        self._client = openai.AsyncOpenAI(api_key=api_key)
+        self._client = shared_client(
+            "openai", api_key, lambda: openai.AsyncOpenAI(api_key=api_key)
+        )
         self._model = model
 
     async def complete(
@@ -29,3 +41,68 @@ class OpenAIProvider(LLMProvider):
             max_tokens=max_tokens,
         )
         return response.choices[0].message.content or ""
+
+    async def stream(
+        self,
+        system: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[str]:
+        full_messages = [{"role": "system", "content": system}] + messages
+        response = await self._client.chat.completions.create(
+            model=self._model,
+            messages=full_messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def submit_batch(self, requests: list[BatchRequest]) -> str:
+        lines = [
+            json.dumps({
+                "custom_id": req.custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self._model,
+                    "messages": [{"role": "system", "content": req.system}] + req.messages,
+                    "temperature": req.temperature,
+                    "max_tokens": req.max_tokens,
+                },
+            })
+            for req in requests
+        ]
+        batch_file = await self._client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self._client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def fetch_batch(self, batch_id: str) -> dict[str, str] | None:
+        batch = await self._client.batches.retrieve(batch_id)
+        if batch.status in _BATCH_TERMINAL_FAILURES:
+            raise RuntimeError(f"OpenAI batch {batch_id} {batch.status}")
+        if batch.status != "completed":
+            return None
+        results: dict[str, str] = {}
+        if not batch.output_file_id:
+            return results
+        output = await self._client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                choices = response["body"]["choices"]
+                results[entry["custom_id"]] = choices[0]["message"]["content"] or ""
+        return results
@@ -1,5 +1,19 @@
 """All LLM prompts centralized. Every prompt used in the pipeline lives here."""
 
+from __future__ import annotations
+
+import functools
+import hashlib
+import string
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from pain_radar.core.models import Citation
+
 # ---------------------------------------------------------------------------
 # KEYWORD EXTRACTION
 # ---------------------------------------------------------------------------
@@ -135,9 +149,6 @@ Output a JSON array of cluster objects."""
 
 CLUSTERING_USER = """Idea: {idea}
 
-Evidence pack ({count} citations):
-{evidence_summary}
-
 Group these citations into pain clusters. Output JSON array only."""
 
 # ---------------------------------------------------------------------------
@@ -172,11 +183,21 @@ Who: {who}
 Trigger: {trigger}
 Cluster citations: {citation_indices}
 
-Full evidence pack ({count} citations):
-{evidence_summary}
-
 Score this cluster on all 7 dimensions. Output JSON object only."""
 
+SCORING_BATCH_CLUSTER = """[{cluster_id}] {cluster_statement}
+Who: {who}
+Trigger: {trigger}
+Cluster citations: {citation_indices}"""
+
+SCORING_BATCH_USER = """Clusters:
+
+{clusters}
+
+Score every cluster above on all 7 dimensions, independently of the others.
+Output a JSON object keyed by cluster id, e.g. {{"c1": {{"frequency": {{...}}, ...}}, "c2": {{...}}}}.
+Output JSON object only."""
+
 # ---------------------------------------------------------------------------
 # COMPETITOR EXTRACTION
 # ---------------------------------------------------------------------------
@@ -210,9 +231,6 @@ Output a JSON array of competitor objects."""
 
 COMPETITOR_USER = """Idea: {idea}
 
-Evidence pack ({count} citations):
-{evidence_summary}
-
 Extract competitor information. Output JSON array only."""
 
 # ---------------------------------------------------------------------------
@@ -257,8 +275,7 @@ Output a JSON object."""
 
 PAYABILITY_USER = """Idea: {idea}
 
-Evidence pack ({count} citations from {unique_urls} unique URLs):
-{evidence_summary}
+The evidence pack above comes from {unique_urls} unique URLs.
 
 Assess payability signals. Distinguish general market signals from idea-specific signals. Output JSON object only."""
 
@@ -297,9 +314,6 @@ CONFLICT_USER = """Clusters:
 Competitors:
 {competitors_summary}
 
-Evidence pack ({count} citations):
-{evidence_summary}
-
 Detect contradictions. Output JSON array only."""
 
 # ---------------------------------------------------------------------------
@@ -373,9 +387,6 @@ Payability assessment:
 Conflicts:
 {conflicts_summary}
 
-Evidence pack ({count} citations):
-{evidence_summary}
-
 Render verdict. Output JSON object only."""
 
 # ---------------------------------------------------------------------------
@@ -483,14 +494,118 @@ Create structured idea brief. Output JSON object only."""
 # Helper: format evidence summary for prompts
 # ---------------------------------------------------------------------------
 
+# ---------------------------------------------------------------------------
+# SHARED EVIDENCE CONTEXT — sent as its own user message ahead of the stage
+# prompt, so the identical evidence prefix can be served from the provider's
+# prompt cache across retries and repeated calls
+# ---------------------------------------------------------------------------
+
+EVIDENCE_CONTEXT = """Evidence pack ({count} citations):
+{evidence_summary}"""
+
+
+@functools.lru_cache(maxsize=8)
+def _evidence_context(count: int, evidence_summary: str) -> str:
+    return EVIDENCE_CONTEXT.format(count=count, evidence_summary=evidence_summary)
+
+
+def evidence_messages(
+    count: int, evidence_summary: str, prompt: str
+) -> list[dict[str, str]]:
+    """Build [evidence context, stage prompt] user messages for an LLM call.
+
+    The context message is formatted once per pack and shared by every
+    stage, cluster and retry that sends it.
+    """
+    return [
+        {"role": "user", "content": _evidence_context(count, evidence_summary)},
+        {"role": "user", "content": prompt},
+    ]
+
+
+# ---------------------------------------------------------------------------
+# PARSE CORRECTION — appended after an unparseable response so the retry
+# tells the model what was wrong instead of resending the same prompt
+# ---------------------------------------------------------------------------
+
+PARSE_CORRECTION_USER = """Your previous response could not be parsed: {reason}.
+Return ONLY valid JSON with fields: {fields}."""
+
+
+def correction_messages(
+    raw: Any, reason: str, fields: Iterable[str]
+) -> list[dict[str, str]]:
+    """Build [echoed response, correction] turns to append before a retry."""
+    return [
+        {"role": "assistant", "content": to_json(raw).decode()},
+        {
+            "role": "user",
+            "content": PARSE_CORRECTION_USER.format(reason=reason, fields=", ".join(fields)),
+        },
+    ]
+
+
+@functools.cache
+def _parse_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported format spec in prompt field {field!r}")
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+def render_prompt(template: str, **fields: object) -> str:
+    """Equivalent of template.format(**fields) with the template parsed once.
+
+    Used for templates rendered once per cluster, where str.format would
+    re-parse the same template on every call.
+    """
+    out = []
+    for literal, field in _parse_template(template):
+        out.append(literal)
+        if field is not None:
+            out.append(str(fields[field]))
+    return "".join(out)
+
+
+_SUMMARY_CACHE_SIZE = 128
+_summary_cache: OrderedDict[bytes, str] = OrderedDict()
+
+
+def _summary_key(citations: list[Citation], max_citations: int) -> bytes:
+    """Digest of every citation field the summary renders."""
+    h = hashlib.blake2b(f"{max_citations}|{len(citations)}".encode(), digest_size=16)
+    for c in citations[:max_citations]:
+        h.update(
+            f"\x1e{c.url}\x1f{c.source_type}\x1f{c.date_published}\x1f{c.excerpt[:201]}".encode()
+        )
+    return h.digest()
+
+
 def format_evidence_summary(
-    citations: list[dict], max_citations: int = 50
+    citations: list[Citation], max_citations: int = 50
 ) -> str:
     """Format citations into a compact summary for LLM prompts.
 
     Groups citations sharing the same URL to prevent over-counting a single
-    source as multiple independent evidence points.
+    source as multiple independent evidence points. An exact repeat of an
+    earlier citation (same URL and excerpt) is listed by index only, so
+    indices stay stable without resending its text. Results are memoized on
+    a content digest, so repeat runs over the same pack reuse the text.
     """
+    key = _summary_key(citations, max_citations)
+    summary = _summary_cache.get(key)
+    if summary is None:
+        summary = _format_evidence_summary(citations, max_citations)
+        _summary_cache[key] = summary
+        while len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+    _summary_cache.move_to_end(key)
+    return summary
+
+
+def _format_evidence_summary(citations: list[Citation], max_citations: int) -> str:
     from collections import defaultdict
 
     capped = citations[:max_citations]
@@ -498,7 +613,7 @@ def format_evidence_summary(
     # Group indices by URL for dedup annotation
     url_groups: dict[str, list[int]] = defaultdict(list)
     for i, c in enumerate(capped):
-        url_groups[c.get("url", "")].append(i)
+        url_groups[c.url].append(i)
 
     lines = []
 
@@ -512,13 +627,19 @@ def format_evidence_summary(
             f"as independent evidence.\n"
         )
 
+    first_seen: dict[tuple[str, str], int] = {}
     for i, c in enumerate(capped):
-        excerpt = c.get("excerpt", "")
+        # Keyed on what the line would show (matches _summary_key)
+        original = first_seen.setdefault((c.url, c.excerpt[:201]), i)
+        if original != i:
+            lines.append(f"[{i}] duplicate of [{original}]")
+            continue
+        excerpt = c.excerpt
         if len(excerpt) > 200:
             excerpt = excerpt[:200] + "..."
-        source = c.get("source_type", "unknown")
-        url = c.get("url", "")
-        date = c.get("date_published", "unknown date")
+        source = c.source_type
+        url = c.url
+        date = c.date_published
 
         # Annotate if this URL has multiple citations
         siblings = url_groups.get(url, [])
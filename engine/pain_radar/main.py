@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pain_radar.api.routes import init_routes, router
 from pain_radar.core.config import get_settings
 from pain_radar.db import Database
+from pain_radar.llm.client import close_clients
 
 
 @asynccontextmanager
@@ -22,7 +23,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings.snapshots_dir.mkdir(parents=True, exist_ok=True)
 
     # Connect database
-    db = Database(settings.db_path)
+    db = Database(settings.db_path, readers=settings.db_readers)
     await db.connect()
 
     # Create orchestrator (lazy import to avoid circular deps)
@@ -35,6 +36,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown
+    await close_clients()
     await db.close()
 
 
@@ -67,7 +67,12 @@ class ResearchOrchestrator:
                 job_id, "intake", current_action="Generating idea brief"
             )
             from pain_radar.analysis.intake import generate_idea_brief
-            idea_brief = await generate_idea_brief(idea, options, llm)
+            from pain_radar.llm.cache import get_brief_cache
+            brief_cache = (
+                get_brief_cache(self._settings.llm_cache_size)
+                if self._settings.llm_cache_size > 0 else None
+            )
+            idea_brief = await generate_idea_brief(idea, options, llm, brief_cache)
             logger.info(
                 f"IdeaBrief: workflow_verbs={idea_brief.workflow_verbs}, "
                 f"incumbent_tools={idea_brief.incumbent_tools}"
@@ -262,38 +267,70 @@ class ResearchOrchestrator:
             # Stage 4: ANALYSIS
             await self._db.update_job_status(job_id, JobStatus.ANALYZING.value)
 
-            # Stage A: cluster_evidence (must complete first)
+            # Stage A: cluster_evidence + competitors in parallel (both only
+            # depend on the evidence, not on each other). Payability also only
+            # needs the evidence, so it starts now and is collected in stage B.
             await self._update_progress(
                 job_id, "analysis",
                 citations_found=len(citations),
-                current_action="Clustering pain points",
+                current_action="Clustering pain points & extracting competitors",
             )
 
-            from pain_radar.analysis.clustering import cluster_evidence
-            clusters = await cluster_evidence(analysis_citations, idea, options, llm, idea_brief=idea_brief)
-
-            # Stage B: score + competitors + payability in parallel
-            await self._update_progress(
-                job_id, "analysis",
-                citations_found=len(citations),
-                current_action="Scoring clusters, analyzing competitors & payability",
+            # Shared by every stage that sends the full evidence pack
+            from pain_radar.analysis.clustering import (
+                CLUSTER_CHUNK_SIZE,
+                cluster_evidence,
+                extract_competitors,
+            )
+            from pain_radar.llm.prompts import format_evidence_summary
+            evidence_summary = format_evidence_summary(analysis_citations)
+            # Packs over CLUSTER_CHUNK_SIZE are clustered chunk by chunk, so
+            # clusters can cite any index; the stages that resolve cluster
+            # citations (scoring, verdict) get every citation
+            cluster_evidence_summary = (
+                format_evidence_summary(analysis_citations, max_citations=len(analysis_citations))
+                if len(analysis_citations) > CLUSTER_CHUNK_SIZE else evidence_summary
             )
+
             from pain_radar.analysis.scoring import score_clusters, assess_payability
-            from pain_radar.analysis.clustering import extract_competitors
+            payability_task = asyncio.create_task(assess_payability(
+                analysis_citations, idea, llm, evidence_summary=evidence_summary,
+            ))
+            try:
+                clusters, competitors = await asyncio.gather(
+                    cluster_evidence(
+                        analysis_citations, idea, options, llm,
+                        idea_brief=idea_brief, evidence_summary=evidence_summary,
+                    ),
+                    extract_competitors(
+                        analysis_citations, idea, options, llm,
+                        idea_brief=idea_brief, evidence_summary=evidence_summary,
+                    ),
+                )
 
-            async def _scoring_progress(done: int, total: int) -> None:
+                # Stage B: score clusters while payability finishes
                 await self._update_progress(
                     job_id, "analysis",
                     citations_found=len(citations),
-                    current_action=f"Scoring cluster {done}/{total}",
-                    scoring_progress=f"{done}/{total}",
+                    current_action="Scoring clusters & analyzing payability",
                 )
 
-            scored_clusters, competitors, payability = await asyncio.gather(
-                score_clusters(clusters, analysis_citations, llm, on_progress=_scoring_progress),
-                extract_competitors(analysis_citations, idea, options, llm, idea_brief=idea_brief),
-                assess_payability(analysis_citations, idea, llm),
-            )
+                async def _scoring_progress(done: int, total: int) -> None:
+                    await self._update_progress(
+                        job_id, "analysis",
+                        citations_found=len(citations),
+                        current_action=f"Scoring cluster {done}/{total}",
+                        scoring_progress=f"{done}/{total}",
+                    )
+
+                scored_clusters = await score_clusters(
+                    clusters, analysis_citations, llm,
+                    on_progress=_scoring_progress, evidence_summary=cluster_evidence_summary,
+                )
+                payability = await payability_task
+            except BaseException:
+                payability_task.cancel()
+                raise
 
             # Post-scoring evidence quality check
             await self._update_progress(
@@ -428,7 +465,8 @@ class ResearchOrchestrator:
             )
             from pain_radar.analysis.conflict import detect_conflicts
             conflicts = await detect_conflicts(
-                scored_clusters, competitors, analysis_citations, llm
+                scored_clusters, competitors, analysis_citations, llm,
+                evidence_summary=evidence_summary,
             )
 
             # Stage 6: VERDICT
@@ -441,6 +479,7 @@ class ResearchOrchestrator:
             verdict = await generate_verdict(
                 scored_clusters, competitors, payability, conflicts,
                 analysis_citations, llm,
+                evidence_summary=cluster_evidence_summary,
             )
 
             # Enforce verdict ↔ payability consistency
@@ -4,18 +4,18 @@ from __future__ import annotations
 
 import csv
 import io
-import json
+
+from pydantic import TypeAdapter
 
 from pain_radar.core.models import Citation, ResearchReport
 
+# Serializes the whole list in one pass through pydantic's Rust serializer
+_CITATIONS_ADAPTER = TypeAdapter(list[Citation])
+
 
 def export_json(citations: list[Citation]) -> str:
     """Export citations as JSON string."""
-    return json.dumps(
-        [c.model_dump() for c in citations],
-        indent=2,
-        default=str,
-    )
+    return _CITATIONS_ADAPTER.dump_json(citations, indent=2).decode()
 
 
 def export_csv(citations: list[Citation]) -> str:
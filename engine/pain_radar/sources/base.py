@@ -92,33 +92,28 @@ async def collect_all_evidence(
     for pack_citations in results:
         all_citations.extend(pack_citations)
 
-    # Store snapshots FIRST (citations have FK to snapshots)
+    # Store snapshots FIRST (citations have FK to snapshots), all in one commit
     seen_hashes: set[str] = set()
+    snapshot_rows: list[tuple[str, str, str, str, str]] = []
     for citation in all_citations:
         if citation.snapshot_hash not in seen_hashes:
             snapshot_path = settings.snapshots_dir / f"{citation.snapshot_hash}.txt"
             if snapshot_path.exists():
                 raw_text = snapshot_path.read_text(encoding="utf-8")
-                await db.store_snapshot(
-                    content_hash=citation.snapshot_hash,
-                    url=citation.url,
-                    raw_text=raw_text,
-                    fetched_at=citation.date_retrieved,
-                    storage_path=str(snapshot_path),
-                )
+                snapshot_rows.append((
+                    citation.snapshot_hash, citation.url, raw_text,
+                    citation.date_retrieved, str(snapshot_path),
+                ))
             seen_hashes.add(citation.snapshot_hash)
 
-    # Store citations in DB
-    for citation in all_citations:
-        await db.store_citation(
-            job_id=job_id,
-            url=citation.url,
-            excerpt=citation.excerpt,
-            source_type=citation.source_type.value,
-            date_published=citation.date_published,
-            date_retrieved=citation.date_retrieved,
-            recency_months=citation.recency_months,
-            snapshot_hash=citation.snapshot_hash,
-        )
+    async with db.transaction():
+        await db.store_snapshots_bulk(snapshot_rows)
+        await db.store_citations_bulk(job_id, (
+            (
+                c.url, c.excerpt, c.source_type.value, c.date_published,
+                c.date_retrieved, c.recency_months, c.snapshot_hash,
+            )
+            for c in all_citations
+        ))
 
     return all_citations, {}
@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 _REDDIT_THREAD_PATTERN = re.compile(
     r"https?://(?:www\.)?reddit\.com/r/\w+/comments/\w+"
 )
+_REDDIT_POST_ID_PATTERN = re.compile(r"/comments/(\w+)")
 
 
 class RedditSourcePack(SourcePack):
@@ -167,7 +168,7 @@ async def _fetch_via_api(
     import hashlib
 
     # Extract post ID from URL
-    match = re.search(r"/comments/(\w+)", url)
+    match = _REDDIT_POST_ID_PATTERN.search(url)
     if not match:
         return None
 
@@ -0,0 +1,87 @@
+"""Tests for deterministic cluster/competitor classification."""
+
+from pain_radar.analysis.clustering import (
+    ClassifierContext,
+    _classify_cluster,
+    _classify_competitor_relationship,
+    _cluster_rules,
+    _competitor_rules,
+)
+from pain_radar.core.models import (
+    ClusterCategory,
+    CompetitorRelationship,
+    IdeaBrief,
+)
+
+
+def _make_brief() -> IdeaBrief:
+    return IdeaBrief(
+        raw_idea="receipt capture for bookkeepers",
+        one_liner="Automate receipt capture for small bookkeeping firms",
+        buyer_persona="Bookkeeper",
+        workflow_replaced="Manual receipt entry",
+        moment_of_pain="chasing clients for missing receipts",
+        keywords=["receipt capture", "bookkeeping automation"],
+        workflow_verbs=["re-key into QuickBooks", "text photo of receipt"],
+        incumbent_tools=["QuickBooks", "Dext"],
+    )
+
+
+class TestClassifierContext:
+    def test_precomputes_lowercased_tables(self):
+        ctx = ClassifierContext.from_idea_brief(_make_brief())
+        assert ctx.tool_phrases_lower == ("quickbooks", "dext")
+        assert ctx.verb_re.search("we re-key into quickbooks nightly")
+        assert ctx.verb_re.search("re-key into xero") is None
+        assert ctx.kw_tokens == frozenset({"receipt", "capture", "bookkeeping", "automation"})
+        assert ctx.mop_tokens == frozenset({"chasing", "clients", "missing", "receipts"})
+
+    def test_empty_phrase_lists_compile_to_none(self):
+        brief = _make_brief().model_copy(update={"workflow_verbs": [], "incumbent_tools": []})
+        ctx = ClassifierContext.from_idea_brief(brief)
+        assert ctx.verb_re is None
+        assert ctx.tool_re is None
+
+
+class TestClassifyCluster:
+    def test_tool_mention_is_core(self):
+        ctx = ClassifierContext.from_idea_brief(_make_brief())
+        assert _classify_cluster("Dext keeps losing uploads", ctx) == ClusterCategory.CORE
+
+    def test_gravity_without_overlap_is_context(self):
+        ctx = ClassifierContext.from_idea_brief(_make_brief())
+        category = _classify_cluster("Email back-and-forth with vendors is time-consuming", ctx)
+        assert category == ClusterCategory.CONTEXT
+
+
+class TestClassifyCompetitor:
+    def test_incumbent_with_workflow_overlap_is_direct(self):
+        ctx = ClassifierContext.from_idea_brief(_make_brief())
+        rel = _classify_competitor_relationship(
+            "Dext", "Snap a photo of receipt and sync", "Text photo of receipt", "adjacent", ctx,
+        )
+        assert rel == CompetitorRelationship.DIRECT
+
+    def test_no_context_caps_direct_label(self):
+        rel = _classify_competitor_relationship("Acme", "", "", "direct", None)
+        assert rel == CompetitorRelationship.ADJACENT
+
+    def test_labor_substitute_matches_regardless_of_case(self):
+        ctx = ClassifierContext.from_idea_brief(_make_brief())
+        rel = _classify_competitor_relationship(
+            "Remote Help Co", "Hire a VA to handle admin", "", "adjacent", ctx,
+        )
+        assert rel == CompetitorRelationship.SUBSTITUTE
+
+
+class TestRules:
+    def test_gravity_only_without_keywords_is_context(self):
+        assert _cluster_rules(0, False, False, True) == ClusterCategory.CONTEXT
+        assert _cluster_rules(1, False, False, True) == ClusterCategory.CORE
+        assert _cluster_rules(0, True, False, True) == ClusterCategory.CORE
+
+    def test_llm_direct_label_needs_evidence(self):
+        direct = CompetitorRelationship.DIRECT
+        assert _competitor_rules(False, False, False, 0, direct) == CompetitorRelationship.ADJACENT
+        assert _competitor_rules(True, True, False, 0, direct) == CompetitorRelationship.DIRECT
+        assert _competitor_rules(False, True, False, 3, direct) == CompetitorRelationship.DIRECT
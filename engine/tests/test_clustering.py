@@ -0,0 +1,51 @@
+"""Tests for chunked (map-reduce) pain clustering."""
+
+from pain_radar.analysis.clustering import _merge_chunk_clusters, _parse_cluster
+
+
+def _cluster(cluster_id: str, statement: str, indices: list[int]):
+    return _parse_cluster(
+        {"id": cluster_id, "statement": statement, "citation_indices": indices,
+         "workarounds": [f"{cluster_id} workaround"]},
+        pack_size=50,
+    )
+
+
+class TestMergeChunkClusters:
+    def test_offsets_indices_to_pack(self):
+        merged = _merge_chunk_clusters([
+            (0, [_cluster("c1", "Invoices arrive in inconsistent formats", [1, 2])]),
+            (50, [_cluster("c2", "Clients forget to upload receipts", [0, 3])]),
+        ])
+        assert [c.citation_indices for c in merged] == [[1, 2], [50, 53]]
+        assert merged[1].statement.citation_indices == [50, 53]
+        assert merged[1].scores.frequency.justification.citation_indices == [50]
+
+    def test_merges_similar_statements(self):
+        first = _cluster("c1", "Clients forget to upload receipts on time", [1])
+        merged = _merge_chunk_clusters([
+            (0, [first]),
+            (50, [_cluster("c2", "Clients forget to upload receipts", [4])]),
+        ])
+        assert len(merged) == 1
+        assert merged[0].citation_indices == [1, 54]
+        assert merged[0].statement.citation_indices == [1, 54]
+        assert merged[0].workarounds == ["c1 workaround", "c2 workaround"]
+        assert first.workarounds == ["c1 workaround"]
+
+    def test_renames_colliding_ids(self):
+        merged = _merge_chunk_clusters([
+            (0, [_cluster("c1", "Invoices arrive in inconsistent formats", [1])]),
+            (50, [_cluster("c1", "Clients forget to upload receipts", [4])]),
+        ])
+        assert [c.id for c in merged] == ["c1", "c1-2"]
+
+    def test_repeated_id_within_a_chunk_stays_unique(self):
+        merged = _merge_chunk_clusters([
+            (0, [_cluster("c1", "Invoices arrive in inconsistent formats", [1])]),
+            (50, [
+                _cluster("c1", "Clients forget to upload receipts", [4]),
+                _cluster("c1", "Bank feeds drop transactions overnight", [5]),
+            ]),
+        ])
+        assert [c.id for c in merged] == ["c1", "c1-2", "c1-3"]
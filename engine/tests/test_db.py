@@ -0,0 +1,154 @@
+"""Tests for Database transactions and bulk writes."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from pain_radar.db import Database
+
+
+@pytest.fixture
+async def db(tmp_path):
+    database = Database(tmp_path / "pain_radar.db")
+    await database.connect()
+    await database.create_job("job1", "receipt capture for bookkeepers")
+    await database.store_snapshot("hash0", "u", "text", "2025-01-01", "/tmp/hash0.txt")
+    yield database
+    await database.close()
+
+
+def _citation_row(url: str) -> tuple:
+    return (url, "excerpt", "reddit", None, "2025-01-01T00:00:00Z", None, "hash0")
+
+
+class TestTransaction:
+    async def test_bulk_writes_commit_together(self, db, tmp_path):
+        async with db.transaction():
+            await db.store_snapshots_bulk([("hash1", "u", "text", "2025-01-01", "/tmp/h")])
+            await db.store_citations_bulk("job1", [_citation_row("u1"), _citation_row("u2")])
+            await db.update_job_status("job1", "researching")
+        await db.close()
+
+        reopened = Database(tmp_path / "pain_radar.db")
+        await reopened.connect()
+        assert [c["url"] for c in await reopened.get_citations("job1")] == ["u1", "u2"]
+        assert await reopened.get_snapshot("hash1") is not None
+        assert (await reopened.get_job("job1"))["status"] == "researching"
+        await reopened.close()
+
+    async def test_error_rolls_back_whole_block(self, db):
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.store_citations_bulk("job1", [_citation_row("u1")])
+                await db.update_job_status("job1", "failed")
+                raise RuntimeError("crawl aborted")
+        assert await db.get_citations("job1") == []
+        assert (await db.get_job("job1"))["status"] == "created"
+
+
+class TestSnapshotCompression:
+    async def test_raw_text_round_trips(self, db):
+        raw_text = "Clients keep losing receipts. " * 200
+        await db.store_snapshots_bulk([("hash1", "u", raw_text, "2025-01-01", "/tmp/h1")])
+        await db.store_citations_bulk("job1", [_citation_row("u1")[:-1] + ("hash1",)])
+
+        assert (await db.get_snapshot("hash1"))["raw_text"] == raw_text
+        snapshots = await db.get_snapshots_for_job("job1")
+        assert snapshots == [{"content_hash": "hash1", "raw_text": raw_text}]
+
+        cursor = await db.db.execute(
+            "SELECT length(raw_text) FROM source_snapshots WHERE content_hash = 'hash1'"
+        )
+        assert (await cursor.fetchone())[0] < len(raw_text) // 10
+
+    async def test_legacy_text_rows_still_readable(self, db):
+        await db.db.execute(
+            "INSERT INTO source_snapshots VALUES ('old', 'u', 'plain text', 'f', 'p')"
+        )
+        await db.db.commit()
+        assert (await db.get_snapshot("old"))["raw_text"] == "plain text"
+
+
+class TestReaderPool:
+    async def test_reads_see_committed_writes(self, db):
+        await db.update_job_status("job1", "analyzing")
+        assert (await db.get_job("job1"))["status"] == "analyzing"
+        assert [c["url"] for c in await db.get_citations("job1")] == []
+        assert db._readers.qsize() == 4
+
+    async def test_without_pool_reads_share_writer(self, tmp_path):
+        database = Database(tmp_path / "solo.db", readers=0)
+        await database.connect()
+        await database.create_job("job1", "idea")
+        assert (await database.get_job("job1"))["idea_text"] == "idea"
+        assert await database.get_report("job1") is None
+        await database.close()
+
+    async def test_busy_inline_lookup_falls_back_to_pool(self, db):
+        class _BusyConn:
+            def execute(self, sql, params):
+                raise sqlite3.OperationalError("database is locked")
+
+            def close(self):
+                pass
+
+        inline = db._lookup_conn
+        db._lookup_conn = _BusyConn()
+        try:
+            assert (await db.get_job("job1"))["idea_text"] == "receipt capture for bookkeepers"
+            assert await db.get_report("job1") is None
+        finally:
+            db._lookup_conn = inline
+        assert db._readers.qsize() == 4
+
+    async def test_reads_inside_transaction_see_own_writes(self, db):
+        async with db.transaction():
+            await db.update_job_status("job1", "reviewing")
+            assert (await db.get_job("job1"))["status"] == "reviewing"
+
+
+class TestConcurrentTransactions:
+    async def test_concurrent_ingests_each_commit(self, db):
+        await db.create_job("job2", "second idea")
+
+        async def ingest(job_id: str, n: int) -> None:
+            async with db.transaction():
+                for i in range(n):
+                    await db.store_citations_bulk(job_id, [_citation_row(f"{job_id}-{i}")])
+                    await asyncio.sleep(0)
+
+        await asyncio.gather(ingest("job1", 30), ingest("job2", 30))
+        assert len(await db.get_citations("job1")) == 30
+        assert len(await db.get_citations("job2")) == 30
+
+    async def test_failed_transaction_keeps_other_tasks_writes(self, db):
+        started = asyncio.Event()
+
+        async def failing_ingest() -> None:
+            async with db.transaction():
+                await db.store_citations_bulk("job1", [_citation_row("u1")])
+                started.set()
+                await asyncio.sleep(0.01)
+                raise RuntimeError("crawl aborted")
+
+        async def progress() -> None:
+            await started.wait()
+            await db.update_job_progress("job1", {"stage": "researching"})
+
+        results = await asyncio.gather(failing_ingest(), progress(), return_exceptions=True)
+        assert isinstance(results[0], RuntimeError)
+        assert await db.get_citations("job1") == []
+        assert (await db.get_job("job1"))["progress_json"] == '{"stage":"researching"}'
+
+
+class TestIterCitations:
+    async def test_pages_in_order_without_holding_readers(self, db, monkeypatch):
+        monkeypatch.setattr("pain_radar.db._CITATION_PAGE_SIZE", 2)
+        await db.store_citations_bulk("job1", [_citation_row(f"u{i}") for i in range(5)])
+
+        rows = db.iter_citations("job1")
+        assert (await anext(rows))["url"] == "u0"
+        # Paused mid-export: every pooled reader is free for other reads
+        assert db._readers.qsize() == 4
+        assert [r["url"] async for r in rows] == ["u1", "u2", "u3", "u4"]
@@ -46,6 +46,11 @@ class TestEvidencedClaim:
         claim = EvidencedClaim(text="some claim", citation_indices=[0, 1])
         assert claim.citation_indices == [0, 1]
 
+    def test_citation_is_immutable(self):
+        citation = _make_citation(0)
+        with pytest.raises(ValidationError):
+            citation.excerpt = "edited"
+
 
 class TestScoredDimension:
     def test_rejects_score_below_zero(self):
@@ -98,6 +103,18 @@ class TestValidateOutput:
         result = validate_output(claim, citations)
         assert result.passed
 
+    def test_number_must_match_a_whole_excerpt_number(self):
+        citations = [_make_citation(0, excerpt="about 400 firms"), _make_citation(1, excerpt="x")]
+        claim = EvidencedClaim(text="40 firms complained", citation_indices=[0, 1])
+        result = validate_output(claim, citations)
+        assert any("'40'" in v.reason for v in result.violations)
+
+    def test_repeated_number_reported_once(self):
+        citations = [_make_citation(0, excerpt="users are unhappy")]
+        claim = EvidencedClaim(text="87 users, yes 87 users, and 12 more", citation_indices=[0])
+        result = validate_output(claim, citations)
+        assert [v.reason.split("'")[1] for v in result.violations] == ["87", "12"]
+
     def test_small_numbers_skipped(self):
         """Numbers 0-5 are allowed (score values)."""
         citations = [_make_citation(0, excerpt="some text")]
@@ -124,6 +141,80 @@ class TestValidateOutput:
         assert not result.passed
         assert any("Excerpt not found" in v.reason for v in result.violations)
 
+    def test_shared_missing_excerpt_flagged_for_every_claim(self):
+        from pydantic import BaseModel
+
+        class _Claims(BaseModel):
+            reasons: list[EvidencedClaim]
+
+        citations = [
+            _make_citation(0, excerpt="text NOT in snapshot"),
+            _make_citation(1, excerpt="exact text"),
+        ]
+        snapshots = {
+            "hash0": _make_snapshot("hash0", "Completely different content here"),
+            "hash1": _make_snapshot("hash1", "Has the exact text inside"),
+        }
+        output = _Claims(reasons=[
+            EvidencedClaim(text="first", citation_indices=[0, 1]),
+            EvidencedClaim(text="second", citation_indices=[1, 0]),
+        ])
+        result = validate_output(output, citations, snapshots)
+        assert [v.field_path for v in result.violations] == ["reasons[0]", "reasons[1]"]
+
+    def test_nested_violations_reported_in_field_order(self):
+        from pydantic import BaseModel
+
+        class _Inner(BaseModel):
+            claim: EvidencedClaim
+
+        class _Outer(BaseModel):
+            first: EvidencedClaim
+            inner: list[_Inner]
+            last: EvidencedClaim
+
+        bad = EvidencedClaim(text="x", citation_indices=[9])
+        output = _Outer(first=bad, inner=[_Inner(claim=bad), _Inner(claim=bad)], last=bad)
+        result = validate_output(output, [_make_citation(0)])
+        assert [v.field_path for v in result.violations] == [
+            "first", "inner[0].claim", "inner[1].claim", "last",
+        ]
+
+
+class TestModelBearingFields:
+    def test_scalar_fields_skipped(self):
+        from pain_radar.core.evidence_gate import _model_bearing_fields
+
+        assert _model_bearing_fields(Citation) == ()
+        assert _model_bearing_fields(PainCluster) == ("statement", "scores")
+
+    def test_optional_and_list_fields_kept(self):
+        from pydantic import BaseModel
+
+        from pain_radar.core.evidence_gate import _model_bearing_fields
+
+        class _Mixed(BaseModel):
+            note: str = ""
+            tags: list[str] = []
+            claim: EvidencedClaim | None = None
+            claims: list[EvidencedClaim] = []
+
+        assert _model_bearing_fields(_Mixed) == ("claim", "claims")
+
+
+class TestIsClaimFree:
+    def test_claims_found_through_nesting(self):
+        from pain_radar.core.evidence_gate import _is_claim_free
+
+        assert _is_claim_free(Citation)
+        assert not _is_claim_free(ClusterScores)
+        assert not _is_claim_free(PainCluster)
+
+    def test_claim_free_output_skips_walk(self):
+        citation = _make_citation(0)
+        result = validate_output(citation, [])
+        assert result.passed
+
 
 class TestComputeClusterConfidence:
     def test_single_citation_low_confidence(self):
@@ -263,3 +354,162 @@ class TestRecencyWeight:
         from pain_radar.analysis.scoring import compute_recency_weight
         w = compute_recency_weight("2022-01-01", "slow")
         assert w == 0.7
+
+    def test_invalid_month_treated_as_unknown(self):
+        from pain_radar.analysis.scoring import compute_recency_weight
+        assert compute_recency_weight("2024-13-01") == 0.5
+        assert compute_recency_weight("not a date") == 0.5
+
+
+class TestFilterValidIndices:
+    def test_all_in_range_kept(self):
+        from pain_radar.core.evidence_gate import filter_valid_indices
+        assert filter_valid_indices([2, 0, 1], 3) == [2, 0, 1]
+
+    def test_out_of_range_dropped_in_order(self):
+        from pain_radar.core.evidence_gate import filter_valid_indices
+        assert filter_valid_indices([5, 1, -1, 0], 3) == [1, 0]
+
+    def test_empty(self):
+        from pain_radar.core.evidence_gate import filter_valid_indices
+        assert filter_valid_indices([], 3) == []
+
+
+class TestParseScores:
+    def test_out_of_range_scores_clamped(self):
+        from pain_radar.analysis.scoring import _SCORE_DIMENSIONS, _parse_scores
+        raw = {dim: {"score": 3, "justification": "ok"} for dim in _SCORE_DIMENSIONS}
+        raw["severity"]["score"] = 9
+        raw["urgency"]["score"] = -2
+        raw["payability"]["score"] = 2.6
+        raw["saturation"]["score"] = "high"
+        raw["accessibility"]["score"] = "4"
+        raw["workaround_cost"] = 3
+        scores = _parse_scores(raw, pack_size=3, fallback_indices=[1])
+        assert scores.severity.score == 5
+        assert scores.urgency.score == 0
+        assert scores.payability.score == 2
+        assert scores.saturation.score == 0
+        assert scores.accessibility.score == 4
+        assert scores.workaround_cost.score == 3
+        assert scores.workaround_cost.justification.citation_indices == [1]
+        assert scores.frequency.justification.citation_indices == [1]
+
+
+
+class TestValidateAndFixExcerpts:
+    def test_invalid_excerpts_replaced_with_best_span(self):
+        from pain_radar.core.evidence_gate import validate_and_fix_excerpts
+        source = (
+            "We switched tools last year. Clients constantly forget to upload "
+            "receipts before month-end closing, so bookkeepers chase them by email."
+        )
+        kept = (
+            "Clients constantly forget to upload receipts before month-end closing "
+            "so bookkeepers chase"
+        )
+        claim = EvidencedClaim(
+            text="Bookkeepers chase clients for missing receipts",
+            citation_indices=[0],
+            evidence_excerpts=["too short", kept, "unrelated marketing fluff about pricing tiers"],
+        )
+        fixed = validate_and_fix_excerpts(claim, [_make_citation(0, source)])
+        span = "Clients constantly forget to upload receipts before month-end closing, so bookke"
+        assert fixed == [span, kept, span]
+
+
+class TestBestKeywordSpan:
+    def test_sliding_window_matches_per_window_tokenizing(self):
+        import random
+
+        from pain_radar.core.evidence_gate import _best_keyword_span, _extract_content_tokens
+
+        def reference(source, claim, span_len):
+            claim_tokens = set(_extract_content_tokens(claim))
+            best_start, best_score = 0, -1
+            for start in range(0, len(source) - span_len + 1, max(1, span_len // 4)):
+                window = set(_extract_content_tokens(source[start:start + span_len]))
+                if len(claim_tokens & window) > best_score:
+                    best_start, best_score = start, len(claim_tokens & window)
+            return source[best_start:best_start + span_len].strip()
+
+        vocab = [
+            "receipts", "receipt", "bookkeeping", "clients", "month-end", "closing", "invoices",
+            "spreadsheet", "chasing", "don't", "the,", "of", "(urgent)", "shipping",
+        ]
+        rng = random.Random(7)
+        for _ in range(300):
+            source = " ".join(rng.choice(vocab) for _ in range(rng.randint(10, 60)))
+            claim = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 5)))
+            span_len = rng.choice([20, 40, 80])
+            if len(source) > span_len:
+                assert _best_keyword_span(source, claim, span_len) == (
+                    reference(source, claim, span_len)
+                )
+
+    def test_first_best_sentence_wins(self):
+        from pain_radar.core.evidence_gate import _best_keyword_span
+
+        source = (
+            "Nothing relevant is said in this opening line at all. "
+            "Clients forget receipts every single month. "
+            "Clients forget receipts again, and invoices pile up too."
+        )
+        span = _best_keyword_span(source, "clients forget receipts", span_len=60)
+        assert span == "Clients forget receipts every single month."
+
+
+class TestExtractContentTokens:
+    def test_ascii_and_unicode_punctuation_stripped_alike(self):
+        from pain_radar.core.evidence_gate import _extract_content_tokens
+
+        assert _extract_content_tokens("Client's invoices, e-mailed (again)!") == (
+            "clients", "invoices", "emailed",
+        )
+        assert _extract_content_tokens("Client’s invoices — e‐mailed") == (
+            "clients", "invoices", "emailed",
+        )
+
+
+class TestComputeDisplayRewrites:
+    def test_pattern_priority_not_position(self):
+        from pain_radar.core.evidence_gate import compute_display_rewrites
+
+        rewrites = compute_display_rewrites("Absence of tooling, and no evidence of budget")
+        assert rewrites == [{
+            "original": "no evidence",
+            "rewritten": "not observed in retrieved excerpts",
+            "start": 24,
+            "end": 35,
+            "rule": "absence_rewrite",
+        }]
+
+    def test_leftmost_when_only_one_pattern_matches(self):
+        from pain_radar.core.evidence_gate import compute_display_rewrites
+
+        assert compute_display_rewrites("Zero mentions of pricing")[0]["original"] == (
+            "Zero mentions"
+        )
+        assert compute_display_rewrites("Users want faster exports") == []
+
+
+class TestApplyRewrites:
+    def test_splices_at_recorded_offsets(self):
+        from pain_radar.core.evidence_gate import (
+            apply_frequency_downgrades,
+            compute_frequency_downgrades,
+        )
+
+        text = "Softens often: users often retype receipts"
+        claim = EvidencedClaim(text=text, citation_indices=[0])
+        downgrades = compute_frequency_downgrades(claim, [_make_citation(0)])
+        assert apply_frequency_downgrades(text, downgrades) == (
+            "Softens in this source: users often retype receipts"
+        )
+
+    def test_rewrites_without_offsets_still_apply(self):
+        from pain_radar.core.evidence_gate import apply_display_rewrites
+
+        rewrites = [{"original": "no evidence", "rewritten": "not observed",
+                     "rule": "absence_rewrite"}]
+        assert apply_display_rewrites("Saw no evidence", rewrites) == "Saw not observed"
@@ -0,0 +1,453 @@
+"""Tests for the shared LLM provider helpers."""
+
+import asyncio
+
+import pytest
+
+from pain_radar.llm import base
+from pain_radar.llm.base import LLMProvider, retry_backoff
+
+
+class _ChunkedProvider(LLMProvider):
+    """Replays a fixed response split into fixed-size stream chunks."""
+
+    def __init__(self, text: str, chunk_size: int = 3) -> None:
+        self._text = text
+        self._chunk_size = chunk_size
+
+    async def complete(self, system, messages, temperature=0.0, max_tokens=4096) -> str:
+        return self._text
+
+    async def stream(self, system, messages, temperature=0.0, max_tokens=4096):
+        for i in range(0, len(self._text), self._chunk_size):
+            yield self._text[i:i + self._chunk_size]
+
+
+async def _collect(provider: LLMProvider) -> list:
+    return [item async for item in provider.stream_json(system="", messages=[])]
+
+
+class TestStreamJson:
+    async def test_yields_array_items(self):
+        provider = _ChunkedProvider('[{"id": "c1", "tags": ["a,b"]}, {"id": "c2"}, 12, true]')
+        assert await _collect(provider) == [{"id": "c1", "tags": ["a,b"]}, {"id": "c2"}, 12, True]
+
+    async def test_strips_code_fences(self):
+        provider = _ChunkedProvider('```json\n[{"id": "c1"}]\n```', chunk_size=2)
+        assert await _collect(provider) == [{"id": "c1"}]
+
+    async def test_non_array_yielded_once(self):
+        provider = _ChunkedProvider('```json\n{"id": "c1"}\n```')
+        assert await _collect(provider) == [{"id": "c1"}]
+
+    async def test_truncated_array_raises(self):
+        provider = _ChunkedProvider('[{"id": "c1"}, {"id": ')
+        with pytest.raises(ValueError):
+            await _collect(provider)
+
+    async def test_non_json_prefix_aborts_early(self):
+        class _Prose(LLMProvider):
+            def __init__(self):
+                self.chunks_sent = 0
+
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                raise AssertionError("unused")
+
+            async def stream(self, system, messages, temperature=0.0, max_tokens=4096):
+                for chunk in ["Sure! ", "Here is ", "the JSON: ", "[1]"]:
+                    self.chunks_sent += 1
+                    yield chunk
+
+        provider = _Prose()
+        with pytest.raises(ValueError):
+            await _collect(provider)
+        assert provider.chunks_sent == 1
+
+    async def test_default_stream_uses_complete(self):
+        class _Plain(LLMProvider):
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                return '[1, 2]'
+
+        assert await _collect(_Plain()) == [1, 2]
+
+
+class TestParseJsonResponse:
+    def test_fenced_and_bare_responses(self):
+        assert base.parse_json_response('```json\n{"id": "c1"}\n```') == {"id": "c1"}
+        assert base.parse_json_response('  [1, 2]\n') == [1, 2]
+
+    def test_fence_without_closing_line(self):
+        assert base._strip_code_fences('```json\n{"id": "c1"}') == '{"id": "c1"}'
+        assert base._strip_code_fences("```") == ""
+
+
+class TestRetryBackoff:
+    async def test_value_error_retries_immediately(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        await retry_backoff(3, ValueError("bad json"))
+        assert sleeps == []
+
+    async def test_transient_error_sleeps_within_cap(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        base._backoff_rng.seed(7)
+        for attempt in range(8):
+            await retry_backoff(attempt, TimeoutError())
+        assert len(sleeps) == 8
+        assert all(0 <= d <= min(30.0, 2 ** a) for a, d in enumerate(sleeps))
+
+
+class TestIsRetryableError:
+    def test_permanent_status_codes_not_retried(self):
+        class _StatusError(Exception):
+            def __init__(self, status_code):
+                self.status_code = status_code
+
+        assert not base.is_retryable_error(_StatusError(401))
+        assert not base.is_retryable_error(_StatusError(400))
+        assert base.is_retryable_error(_StatusError(429))
+        assert base.is_retryable_error(_StatusError(529))
+        assert base.is_retryable_error(TimeoutError())
+        assert base.is_retryable_error(ValueError("bad json"))
+
+
+class TestBatchProvider:
+    def test_batch_mode_rejects_provider_without_batch_api(self, monkeypatch):
+        from pain_radar.core.config import Settings
+        from pain_radar.llm import claude
+        from pain_radar.llm.batch import BatchProvider
+
+        class _OnlineOnly(LLMProvider):
+            def __init__(self, api_key, model):
+                pass
+
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                raise AssertionError("unused")
+
+        settings = Settings(llm_provider="claude", llm_mode="batch", llm_cache_size=0)
+        assert isinstance(base.create_provider(settings), BatchProvider)
+        monkeypatch.setattr(claude, "ClaudeProvider", _OnlineOnly)
+        with pytest.raises(ValueError, match="batch mode"):
+            base.create_provider(settings)
+
+    async def test_coalesces_concurrent_calls_into_one_batch(self):
+        from pain_radar.llm.batch import BatchProvider
+
+        class _FakeBatchInner(LLMProvider):
+            def __init__(self):
+                self.submitted = []
+                self.polls = 0
+
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                raise AssertionError("batch mode must not call complete()")
+
+            async def submit_batch(self, requests):
+                self.submitted.append(requests)
+                return "batch_1"
+
+            async def fetch_batch(self, batch_id):
+                self.polls += 1
+                if self.polls < 2:
+                    return None
+                return {
+                    r.custom_id: r.messages[-1]["content"].upper()
+                    for r in self.submitted[0]
+                    if r.messages[-1]["content"] != "drop"
+                }
+
+        inner = _FakeBatchInner()
+        provider = BatchProvider(inner, window_seconds=0, poll_seconds=0)
+        results = await asyncio.gather(
+            provider.complete("sys", [{"role": "user", "content": "a"}]),
+            provider.complete("sys", [{"role": "user", "content": "b"}]),
+            provider.complete("sys", [{"role": "user", "content": "drop"}]),
+            return_exceptions=True,
+        )
+        assert len(inner.submitted) == 1
+        assert results[:2] == ["A", "B"]
+        assert isinstance(results[2], RuntimeError)
+
+
+class TestCachedProvider:
+    class _CountingProvider(LLMProvider):
+        def __init__(self, text: str) -> None:
+            self.text = text
+            self.calls = 0
+
+        async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+            self.calls += 1
+            return self.text
+
+    async def test_repeat_run_served_from_cache(self):
+        from pain_radar.llm.cache import CachedProvider, MemoryCache
+
+        inner = self._CountingProvider('{"ok": true}')
+        cache = MemoryCache(8)
+        msgs = [{"role": "user", "content": "hi"}]
+        first = CachedProvider(inner, "m", cache)
+        assert await first.complete_json("sys", msgs) == {"ok": True}
+        second = CachedProvider(inner, "m", cache)
+        assert await second.complete_json("sys", msgs) == {"ok": True}
+        assert inner.calls == 1
+        assert (second.hits, second.misses) == (1, 0)
+
+    async def test_retry_within_run_bypasses_cache(self):
+        from pain_radar.llm.cache import CachedProvider, MemoryCache
+
+        inner = self._CountingProvider('[1, 2]')
+        provider = CachedProvider(inner, "m", MemoryCache(8))
+        msgs = [{"role": "user", "content": "hi"}]
+        assert [x async for x in provider.stream_json("sys", msgs)] == [1, 2]
+        assert [x async for x in provider.stream_json("sys", msgs)] == [1, 2]
+        assert inner.calls == 2
+
+    async def test_unparseable_and_sampled_responses_not_cached(self):
+        from pain_radar.llm.cache import CachedProvider, MemoryCache
+
+        cache = MemoryCache(8)
+        msgs = [{"role": "user", "content": "hi"}]
+        with pytest.raises(ValueError):
+            await CachedProvider(self._CountingProvider("nope"), "m", cache).complete_json("s", msgs)
+        await CachedProvider(self._CountingProvider("{}"), "m", cache).complete_json(
+            "s", msgs, temperature=0.7,
+        )
+        assert cache._entries == {}
+
+    async def test_concurrent_identical_calls_share_one_request(self):
+        from pain_radar.llm.cache import CachedProvider, MemoryCache, _inflight
+
+        class _Slow(self._CountingProvider):
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                await asyncio.sleep(0.01)
+                return await super().complete(system, messages, temperature, max_tokens)
+
+        inner = _Slow('{"ok": true}')
+        cache = MemoryCache(8)
+        msgs = [{"role": "user", "content": "hi"}]
+        results = await asyncio.gather(
+            CachedProvider(inner, "m", cache).complete_json("sys", msgs),
+            CachedProvider(inner, "m", cache).complete_json("sys", msgs),
+        )
+        assert results == [{"ok": True}, {"ok": True}]
+        assert inner.calls == 1
+        assert _inflight == {}
+
+    async def test_waiter_takes_over_when_owner_cancelled(self):
+        from pain_radar.llm.cache import CachedProvider, MemoryCache, _inflight
+
+        class _Slow(self._CountingProvider):
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                await asyncio.sleep(0.01)
+                return await super().complete(system, messages, temperature, max_tokens)
+
+            async def stream(self, system, messages, temperature=0.0, max_tokens=4096):
+                yield await self.complete(system, messages, temperature, max_tokens)
+
+        inner = _Slow('[{"ok": true}]')
+        cache = MemoryCache(8)
+        msgs = [{"role": "user", "content": "hi"}]
+
+        async def stream_items():
+            return [item async for item in CachedProvider(inner, "m", cache).stream_json("s", msgs)]
+
+        owner = asyncio.create_task(CachedProvider(inner, "m", cache).complete_json("s", msgs))
+        await asyncio.sleep(0)
+        waiters = asyncio.gather(
+            CachedProvider(inner, "m", cache).complete_json("s", msgs), stream_items(),
+        )
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiters == [[{"ok": True}], [{"ok": True}]]
+        assert inner.calls == 1  # the cancelled owner never reached it
+        assert _inflight == {}
+
+
+class TestConcurrencyLimitedProvider:
+    async def test_caps_in_flight_requests(self):
+        from pain_radar.llm.limit import ConcurrencyLimitedProvider
+
+        class _Tracking(LLMProvider):
+            def __init__(self):
+                self.active = 0
+                self.peak = 0
+
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                return "[1]"
+
+        inner = _Tracking()
+        provider = ConcurrencyLimitedProvider(inner, asyncio.Semaphore(2))
+        results = await asyncio.gather(*(
+            provider.complete_json("sys", [{"role": "user", "content": str(i)}])
+            for i in range(5)
+        ))
+        assert results == [[1]] * 5
+        assert inner.peak == 2
+        assert [x async for x in provider.stream_json("sys", [])] == [1]
+
+    def test_shared_semaphore_survives_a_new_event_loop(self):
+        from pain_radar.llm.limit import get_request_semaphore
+
+        async def contend():
+            semaphore = get_request_semaphore(1)
+            assert get_request_semaphore(1) is semaphore
+
+            async def hold():
+                async with semaphore:
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(hold(), hold())
+            return semaphore
+
+        first = asyncio.run(contend())
+        assert asyncio.run(contend()) is not first
+
+
+class TestSharedClient:
+    async def test_one_client_per_key_until_closed(self):
+        from pain_radar.llm import client
+
+        class _Client:
+            closed = False
+
+            async def close(self):
+                self.closed = True
+
+        first = client.shared_client("fake", "k1", _Client)
+        assert client.shared_client("fake", "k1", _Client) is first
+        assert client.shared_client("fake", "k2", _Client) is not first
+        await client.close_clients()
+        assert first.closed
+        assert client.shared_client("fake", "k1", _Client) is not first
+        await client.close_clients()
+
+
+class TestSemanticCache:
+    def test_paraphrase_hits_and_unrelated_misses(self):
+        from pain_radar.llm.cache import SemanticCache
+
+        cache = SemanticCache(max_entries=8)
+        cache.set("CRM for dentists that reminds patients about appointments", "brief")
+        assert cache.get("CRM for a dentist that reminds patients about appointments") == "brief"
+        assert cache.get("CRM for plumbers that reminds customers about appointments") is None
+
+    def test_evicts_least_recently_used(self):
+        from pain_radar.llm.cache import SemanticCache
+
+        cache = SemanticCache(max_entries=2)
+        cache.set("receipt capture for bookkeepers", 1)
+        cache.set("scheduling tool for dog groomers", 2)
+        assert cache.get("receipt capture for bookkeepers") == 1
+        cache.set("inventory alerts for florists", 3)
+        assert cache.get("scheduling tool for dog groomers") is None
+        assert cache.get("receipt capture for bookkeepers") == 1
+
+
+    async def test_idea_brief_reuse_requires_same_niche_and_role(self):
+        from pain_radar.analysis.intake import generate_idea_brief
+        from pain_radar.llm.cache import SemanticCache
+
+        class _BriefProvider(LLMProvider):
+            def __init__(self):
+                self.calls = 0
+
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                raise AssertionError("unused")
+
+            async def complete_json(self, system, messages, temperature=0.0, max_tokens=8192):
+                self.calls += 1
+                return {"one_liner": f"brief {self.calls}", "keywords": ["crm"]}
+
+        idea = "CRM for dentists that reminds patients about appointments"
+        paraphrase = "CRM for a dentist that reminds patients about appointments"
+        options = {"niche": "dental", "buyer_role": "office manager"}
+        llm = _BriefProvider()
+        cache = SemanticCache(max_entries=8)
+
+        first = await generate_idea_brief(idea, options, llm, cache)
+        reused = await generate_idea_brief(paraphrase, options, llm, cache)
+        assert llm.calls == 1
+        assert reused.one_liner == first.one_liner
+        assert reused.raw_idea == paraphrase
+
+        other_role = {**options, "buyer_role": "dentist"}
+        assert (await generate_idea_brief(paraphrase, other_role, llm, cache)).one_liner == "brief 2"
+        assert (await generate_idea_brief(idea, options, llm)).one_liner == "brief 3"
+
+
+class TestFormatEvidenceSummary:
+    def test_memoized_on_content(self):
+        from pain_radar.core.models import Citation, SourceType
+        from pain_radar.llm import prompts
+
+        def citation(excerpt):
+            return Citation(
+                url="https://example.com/a", excerpt=excerpt, source_type=SourceType.REDDIT,
+                date_retrieved="2025-01-01T00:00:00Z", snapshot_hash="h",
+            )
+
+        first = prompts.format_evidence_summary([citation("receipts pile up")])
+        again = prompts.format_evidence_summary([citation("receipts pile up")])
+        changed = prompts.format_evidence_summary([citation("clients never reply")])
+        assert again is first
+        assert "clients never reply" in changed
+
+    def test_exact_repeats_listed_by_index(self):
+        from pain_radar.core.models import Citation, SourceType
+        from pain_radar.llm.prompts import format_evidence_summary
+
+        def citation(url, excerpt):
+            return Citation(
+                url=url, excerpt=excerpt, source_type=SourceType.REDDIT,
+                date_retrieved="2025-01-01T00:00:00Z", snapshot_hash="h",
+            )
+
+        summary = format_evidence_summary([
+            citation("https://example.com/a", "receipts pile up"),
+            citation("https://example.com/b", "clients never reply"),
+            citation("https://example.com/a", "receipts pile up"),
+        ])
+        assert summary.count("receipts pile up") == 1
+        assert summary.splitlines()[-1] == "[2] duplicate of [0]"
+
+
+class TestEvidenceMessages:
+    def test_context_shared_across_calls(self):
+        from pain_radar.llm.prompts import evidence_messages
+
+        summary = "[0] (reddit) receipts pile up"
+        first = evidence_messages(1, summary, "Score cluster c1")
+        second = evidence_messages(1, summary, "Score cluster c2")
+        assert first[0]["content"] is second[0]["content"]
+        assert first[0]["content"].endswith(summary)
+        assert second[1] == {"role": "user", "content": "Score cluster c2"}
+
+
+class TestRenderPrompt:
+    def test_matches_str_format(self):
+        from pain_radar.llm.prompts import SCORING_BATCH_USER, SCORING_USER, render_prompt
+
+        fields = {
+            "cluster_statement": "Receipts go missing",
+            "who": "bookkeepers",
+            "trigger": "month end",
+            "citation_indices": [1, 4],
+        }
+        assert render_prompt(SCORING_USER, **fields) == SCORING_USER.format(**fields)
+        # Escaped braces survive
+        assert render_prompt(SCORING_BATCH_USER, clusters="[c1] x") == (
+            SCORING_BATCH_USER.format(clusters="[c1] x")
+        )
@@ -0,0 +1,60 @@
+"""Tests for API route helpers."""
+
+import csv
+import io
+import json
+from collections import OrderedDict
+
+from pain_radar.api.routes import _CSV_FIELDS, _iter_csv, _iter_json, _parse_cached
+from pain_radar.core.models import JobProgress
+
+
+def _rows() -> list[dict]:
+    return [
+        {"id": i, "job_id": "j1", "url": f"https://example.com/{i}",
+         "excerpt": 'says "receipts, again"\nand more', "source_type": "reddit",
+         "date_published": None, "date_retrieved": "2025-01-01T00:00:00Z",
+         "recency_months": 2, "snapshot_hash": f"h{i}"}
+        for i in range(3)
+    ]
+
+
+async def _aiter(rows: list[dict]):
+    for row in rows:
+        yield row
+
+
+class TestExportStreams:
+    async def test_json_matches_buffered_dump(self):
+        rows = _rows()
+        streamed = b"".join([chunk async for chunk in _iter_json(_aiter(rows))])
+        assert streamed.decode() == json.dumps(rows, indent=2)
+
+    async def test_csv_matches_buffered_writer(self):
+        rows = _rows()
+        expected = io.StringIO()
+        writer = csv.DictWriter(expected, fieldnames=_CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+        streamed = [chunk async for chunk in _iter_csv(_aiter(rows))]
+        assert len(streamed) == len(rows) + 1
+        assert "".join(streamed) == expected.getvalue()
+
+
+class TestParseCached:
+    async def test_reuses_parse_until_row_changes(self):
+        cache: OrderedDict = OrderedDict()
+        payload = '{"stage": "analysis", "citations_found": 12}'
+        parse = JobProgress.model_validate_json
+        first = await _parse_cached(cache, ("j1", "t1"), parse, payload)
+        again = await _parse_cached(cache, ("j1", "t1"), parse, payload)
+        updated = await _parse_cached(cache, ("j1", "t2"), parse, '{"stage": "verdict"}')
+        assert again is first
+        assert first.citations_found == 12
+        assert updated.stage == "verdict"
+
+    async def test_evicts_beyond_max_entries(self):
+        cache: OrderedDict = OrderedDict()
+        for job in ("j1", "j2", "j3"):
+            await _parse_cached(cache, (job, "t1"), str.encode, job, max_entries=2)
+        assert list(cache) == [("j2", "t1"), ("j3", "t1")]
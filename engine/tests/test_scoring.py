@@ -0,0 +1,100 @@
+"""Tests for cluster scoring."""
+
+from pain_radar.analysis.clustering import _parse_cluster
+from pain_radar.analysis.scoring import _SCORE_DIMENSIONS, score_clusters
+from pain_radar.core.models import Citation, SourceType
+from pain_radar.llm.base import LLMProvider
+
+
+def _citation(index: int) -> Citation:
+    return Citation(
+        url=f"https://example.com/{index}",
+        excerpt=f"excerpt {index}",
+        source_type=SourceType.REDDIT,
+        date_retrieved="2025-01-01T00:00:00Z",
+        snapshot_hash=f"hash{index}",
+    )
+
+
+def _scores(value: int) -> dict:
+    return {
+        dim: {"score": value, "justification": {"text": "seen", "citation_indices": [0]}}
+        for dim in _SCORE_DIMENSIONS
+    }
+
+
+class _ScriptedProvider(LLMProvider):
+    """Answers batch prompts for all but one cluster, single prompts with 2s."""
+
+    def __init__(self, skip_id: str) -> None:
+        self.skip_id = skip_id
+        self.calls = 0
+
+    async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+        raise AssertionError("unused")
+
+    async def complete_json(self, system, messages, temperature=0.0, max_tokens=8192):
+        self.calls += 1
+        prompt = messages[-1]["content"]
+        if prompt.startswith("Clusters:"):
+            return {cid: _scores(4) for cid in ("c1", "c2", "c3") if cid != self.skip_id}
+        return _scores(2)
+
+
+class TestScoreClusters:
+    async def test_batch_scores_with_per_cluster_fallback(self):
+        citations = [_citation(i) for i in range(3)]
+        clusters = [
+            _parse_cluster({"id": cid, "statement": f"pain {cid}", "citation_indices": [0, 1]}, 3)
+            for cid in ("c1", "c2", "c3")
+        ]
+        progress = []
+
+        async def on_progress(done, total):
+            progress.append((done, total))
+
+        llm = _ScriptedProvider(skip_id="c2")
+        scored = await score_clusters(clusters, citations, llm, on_progress=on_progress)
+
+        assert llm.calls == 2
+        assert [c.scores.severity.score for c in scored] == [4, 2, 4]
+        assert all(c.confidence > 0 for c in scored)
+        assert progress[-1] == (3, 3)
+
+    async def test_malformed_batch_entry_falls_back_alone(self):
+        citations = [_citation(i) for i in range(3)]
+        clusters = [
+            _parse_cluster({"id": cid, "statement": f"pain {cid}", "citation_indices": [0, 1]}, 3)
+            for cid in ("c1", "c2", "c3")
+        ]
+        progress = []
+
+        async def on_progress(done, total):
+            progress.append((done, total))
+
+        class _MalformedProvider(_ScriptedProvider):
+            async def complete_json(self, system, messages, temperature=0.0, max_tokens=8192):
+                raw = await super().complete_json(system, messages, temperature, max_tokens)
+                if messages[-1]["content"].startswith("Clusters:"):
+                    raw["c2"] = _scores(4)
+                    raw["c2"]["severity"]["justification"] = None
+                    raw["c2"]["urgency"]["justification"]["citation_indices"] = 7
+                    raw["c3"]["severity"]["justification"]["citation_indices"] = ["x", 0]
+                return raw
+
+        llm = _MalformedProvider(skip_id="")
+        scored = await score_clusters(clusters, citations, llm, on_progress=on_progress)
+
+        assert llm.calls == 2
+        assert [c.scores.severity.score for c in scored] == [4, 4, 2]
+        assert scored[1].scores.severity.justification.citation_indices == [0]
+        assert [done for done, _ in progress] == [1, 2, 3]
+
+    async def test_empty_evidence_skips_llm(self):
+        from pain_radar.analysis.scoring import assess_payability
+
+        llm = _ScriptedProvider(skip_id="")
+        payability = await assess_payability([], "idea", llm)
+        assert payability.overall_strength == "none"
+        assert await score_clusters([], [_citation(0)], llm) == []
+        assert llm.calls == 0
@@ -0,0 +1,114 @@
+"""Tests for verdict and validation plan generation."""
+
+from pain_radar.analysis.verdict import (
+    _insufficient_evidence_verdict,
+    generate_validation_plan,
+)
+from pain_radar.core.models import VerdictDecision
+from pain_radar.llm.base import LLMProvider
+
+
+class _RepairingProvider(LLMProvider):
+    """Returns a malformed plan first, then a valid one; records each call's messages."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[dict[str, str]]] = []
+
+    async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+        raise AssertionError("unused")
+
+    async def complete_json(self, system, messages, temperature=0.0, max_tokens=8192):
+        self.calls.append(list(messages))
+        if len(self.calls) == 1:
+            return {"objective": "Prove demand", "channels": "Reddit"}
+        return {
+            "objective": "Prove demand",
+            "channels": ["Reddit"],
+            "outreach_targets": ["10 bookkeepers"],
+            "interview_script": "How do you collect receipts?",
+            "success_threshold": "3 pre-orders",
+        }
+
+
+class TestGenerateValidationPlan:
+    async def test_parse_failure_reprompts_with_error(self):
+        verdict = _insufficient_evidence_verdict([], [], "no evidence").model_copy(
+            update={"decision": VerdictDecision.KILL},
+        )
+        llm = _RepairingProvider()
+        plan = await generate_validation_plan(verdict, [], "receipt capture", {}, llm)
+
+        assert plan.channels == ["Reddit"]
+        assert len(llm.calls) == 2
+        echoed, correction = llm.calls[1][-2:]
+        assert echoed == {
+            "role": "assistant", "content": '{"objective":"Prove demand","channels":"Reddit"}',
+        }
+        assert correction["role"] == "user"
+        assert "channels" in correction["content"]
+        assert "missing fields: outreach_targets" in correction["content"]
+
+    async def test_insufficient_evidence_without_clusters_skips_llm(self):
+        class _Unused(LLMProvider):
+            async def complete(self, system, messages, temperature=0.0, max_tokens=4096):
+                raise AssertionError("no LLM call expected")
+
+        verdict = _insufficient_evidence_verdict([], [], "no evidence")
+        plan = await generate_validation_plan(verdict, [], "receipt capture", {}, _Unused())
+        assert plan.reversal_criteria == "Strong payability signals from 5+ sources"
+
+
+class TestMatchCitationToText:
+    def test_picks_highest_overlap_lowest_index_on_tie(self):
+        from pain_radar.analysis.verdict import _citation_word_index, _match_citation_to_text
+        from pain_radar.core.models import Citation, SourceType
+
+        citations = [
+            Citation(url=f"https://example.com/{i}", excerpt=excerpt,
+                     source_type=SourceType.REDDIT, date_retrieved="2025-01-01T00:00:00Z",
+                     snapshot_hash="h")
+            for i, excerpt in enumerate([
+                "nothing relevant here",
+                "receipts go missing",
+                "Clients lose receipts every month",
+                "receipts every month",
+            ])
+        ]
+        index = _citation_word_index(citations)
+        assert _match_citation_to_text("clients lose receipts", citations, index) == [2]
+        assert _match_citation_to_text("receipts every month", citations, index) == [2]
+        assert _match_citation_to_text("unrelated words", citations) == [0]
+
+
+class TestParseVerdict:
+    def test_meta_statements_filtered(self):
+        from pain_radar.analysis.verdict import _parse_verdict
+
+        raw = {
+            "decision": "narrow",
+            "reasons": [
+                {"text": "Evidence is too SPARSE to judge", "citation_indices": [0]},
+                {"text": "Bookkeepers re-key receipts weekly", "citation_indices": [0]},
+            ],
+            "risks": [{"text": "Dext already covers capture", "citation_indices": [0]}],
+            "narrowest_wedge": "Receipt chasing for 1-5 person firms",
+            "what_would_change": "Pricing pages showing paid receipt tools",
+        }
+        verdict = _parse_verdict(raw, pack_size=1, conflicts=[])
+        assert [r.text for r in verdict.reasons] == ["Bookkeepers re-key receipts weekly"]
+
+
+class TestBestCitationIndices:
+    def test_diverse_types_first_then_earliest(self):
+        from pain_radar.analysis.verdict import _best_citation_indices
+        from pain_radar.core.models import Citation, SourceType
+
+        types = [SourceType.REDDIT, SourceType.REDDIT, SourceType.REVIEW, SourceType.REDDIT]
+        citations = [
+            Citation(url=f"https://example.com/{i}", excerpt="x", source_type=t,
+                     date_retrieved="2025-01-01T00:00:00Z", snapshot_hash="h")
+            for i, t in enumerate(types)
+        ]
+        assert _best_citation_indices(citations) == [0, 2, 1]
+        assert _best_citation_indices(citations, n=2) == [0, 2]
+        assert _best_citation_indices([]) == [0]